@@ -1,10 +1,13 @@
 #!/usr/bin/env python
+import sys
+
 from addict import Dict
 
 from manimlib import __version__
 from manimlib.config import manim_config
 from manimlib.config import parse_cli
 import manimlib.extract_scene
+from manimlib.benchmarks.runner import run_benchmarks
 from manimlib.utils.cache import clear_cache
 from manimlib.window import Window
 
@@ -58,6 +61,16 @@ def main():
     if args.clear_cache:
         clear_cache()
 
+    run_config = manim_config.run
+    if run_config.benchmark is not None:
+        passed = run_benchmarks(
+            Dict(manim_config.scene),
+            names=run_config.benchmark,
+            output_file=run_config.benchmark_output,
+            baseline_file=run_config.benchmark_baseline,
+        )
+        sys.exit(0 if passed else 1)
+
     run_scenes()
 
 
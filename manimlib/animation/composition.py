@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import numpy as np
+
 from manimlib.animation.animation import Animation
 from manimlib.animation.animation import prepare_animation
+from manimlib.animation.transform import FusedInterpolation
+from manimlib.animation.transform import Transform
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Group
+from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.iterables import remove_list_redundancies
-from manimlib.utils.simple_functions import clip
+from manimlib.utils.rate_functions import apply_rate_func_to_array
 
 from typing import TYPE_CHECKING, Union, Iterable
 AnimationType = Union[Animation, _AnimationBuilder]
@@ -17,7 +22,6 @@ AnimationType = Union[Animation, _AnimationBuilder]
 if TYPE_CHECKING:
     from typing import Callable, Optional
 
-    from manimlib.mobject.mobject import Mobject
     from manimlib.scene.scene import Scene
 
 
@@ -56,6 +60,9 @@ class AnimationGroup(Animation):
             lag_ratio=lag_ratio,
             **kwargs
         )
+        self.anims_to_update = self.animations
+        self.skippable_anims = None
+        self.fused_interpolation = None
 
     def get_all_mobjects(self) -> Mobject:
         return self.group
@@ -64,19 +71,108 @@ class AnimationGroup(Animation):
         self.group.set_animating_status(True)
         for anim in self.animations:
             anim.begin()
+        self.init_interpolation_shortcuts()
         # self.init_run_time()
 
+    def init_interpolation_shortcuts(self) -> None:
+        """
+        Animations whose interpolation only depends on their alpha needn't
+        be interpolated again on frames where their alpha is unchanged, as
+        is true for most of those in a LaggedStart at any given time.  Of
+        these, plain Transforms along straight paths (which includes fades)
+        are all interpolated at once through a FusedInterpolation.
+
+        None of this applies when animations share mobjects, so that
+        the order in which they're interpolated matters, or when any
+        updaters are attached to the mobjects involved.
+        """
+        anims = [awt[0] for awt in self.anims_with_timings]
+        self.anims_to_update = [
+            anim for anim in anims
+            if type(anim).update_mobjects is not Animation.update_mobjects
+            or any(
+                mob.has_updaters() for mob in anim.get_all_mobjects_to_update()
+                if isinstance(mob, Mobject)
+            )
+        ]
+        self.last_sub_alphas = None
+        self.skippable_anims = np.zeros(len(anims), dtype=bool)
+        self.fused_interpolation = None
+
+        family_ids = [id(sm) for anim in anims for sm in anim.mobject.get_family()]
+        if len(set(family_ids)) < len(family_ids):
+            return
+        # An updater on any of the mobjects involved, or on a group holding
+        # some of them, could change them between frames
+        if any(
+            mob.has_updaters() for anim in anims for mob in anim.get_all_mobjects()
+            if isinstance(mob, Mobject)
+        ) or any(
+            mob.updaters for mob in [self.group, *self.group.get_ancestors(extended=True)]
+        ):
+            return
+        self.skippable_anims[:] = [
+            type(anim).interpolate is Animation.interpolate
+            and type(anim).interpolate_mobject in (Animation.interpolate_mobject, Transform.interpolate_mobject)
+            for anim in anims
+        ]
+        fused = [
+            n for n, anim in enumerate(anims)
+            if self.skippable_anims[n]
+            and isinstance(anim, Transform)
+            and anim.supports_fused_interpolation()
+        ]
+        if not fused:
+            return
+        self.fused_anim_indices = np.array(fused, dtype=int)
+        # For each family member of those animations, which of them it
+        # belongs to, and how its alpha follows from that of the animation,
+        # as in Animation.get_sub_alpha
+        family_lengths = [len(anims[n].families) for n in fused]
+        self.fused_family_anim_indices = np.repeat(fused, family_lengths).astype(int)
+        self.fused_family_lag_starts = np.hstack([
+            anims[n].lag_ratio * np.arange(length)
+            for n, length in zip(fused, family_lengths)
+        ])
+        self.fused_family_full_lengths = np.repeat([
+            (length - 1) * anims[n].lag_ratio + 1
+            for n, length in zip(fused, family_lengths)
+        ], family_lengths)
+        rate_funcs = []
+        for n in fused:
+            if not any(anims[n].rate_func is rf for rf in rate_funcs):
+                rate_funcs.append(anims[n].rate_func)
+        rate_func_indices = np.repeat([
+            next(k for k, rf in enumerate(rate_funcs) if rf is anims[n].rate_func)
+            for n in fused
+        ], family_lengths)
+        self.fused_rate_funcs_and_masks = [
+            (rate_func, rate_func_indices == k)
+            for k, rate_func in enumerate(rate_funcs)
+        ]
+        self.fused_interpolation = FusedInterpolation([
+            family
+            for n in fused
+            for family in anims[n].families
+        ])
+        for n in fused:
+            # Superseded by the one above
+            anims[n].fused_interpolation = None
+
     def finish(self) -> None:
         self.group.set_animating_status(False)
         for anim in self.animations:
             anim.finish()
+        if self.fused_interpolation is not None:
+            self.fused_interpolation.release()
+            self.fused_interpolation = None
 
     def clean_up_from_scene(self, scene: Scene) -> None:
         for anim in self.animations:
             anim.clean_up_from_scene(scene)
 
     def update_mobjects(self, dt: float) -> None:
-        for anim in self.animations:
+        for anim in self.anims_to_update:
             anim.update_mobjects(dt)
 
     def calculate_max_end_time(self) -> None:
@@ -104,6 +200,8 @@ class AnimationGroup(Animation):
             curr_time = interpolate(
                 start_time, end_time, lag_ratio
             )
+        self.start_times = np.array([awt[1] for awt in self.anims_with_timings])
+        self.end_times = np.array([awt[2] for awt in self.anims_with_timings])
 
     def interpolate(self, alpha: float) -> None:
         # Note, if the run_time of AnimationGroup has been
@@ -112,13 +210,42 @@ class AnimationGroup(Animation):
         # e.g. of the surrounding scene.  Instead they'd
         # be a rescaled version.  But that's okay!
         time = alpha * self.max_end_time
-        for anim, start_time, end_time in self.anims_with_timings:
-            anim_time = end_time - start_time
-            if anim_time == 0:
-                sub_alpha = 0
-            else:
-                sub_alpha = clip((time - start_time) / anim_time, 0, 1)
-            anim.interpolate(sub_alpha)
+        anim_times = self.end_times - self.start_times
+        sub_alphas = np.zeros(len(anim_times))
+        nonzero = anim_times != 0
+        sub_alphas[nonzero] = np.clip(
+            (time - self.start_times[nonzero]) / anim_times[nonzero], 0, 1
+        )
+
+        if self.skippable_anims is None or self.last_sub_alphas is None:
+            to_interpolate = np.ones(len(sub_alphas), dtype=bool)
+        else:
+            changed = sub_alphas != self.last_sub_alphas
+            to_interpolate = changed | ~self.skippable_anims
+        self.last_sub_alphas = sub_alphas
+
+        fused = self.fused_interpolation
+        if fused is not None and not fused.is_intact():
+            # Something else has taken over the data of one of these
+            # mobjects, so fall back to interpolating one at a time
+            fused.release()
+            fused = self.fused_interpolation = None
+            self.skippable_anims[self.fused_anim_indices] = False
+            to_interpolate[self.fused_anim_indices] = True
+        if fused is not None:
+            family_anim_indices = self.fused_family_anim_indices
+            raw_alphas = np.clip(
+                sub_alphas[family_anim_indices] * self.fused_family_full_lengths - self.fused_family_lag_starts,
+                0, 1
+            )
+            family_alphas = np.zeros(len(raw_alphas))
+            for rate_func, mask in self.fused_rate_funcs_and_masks:
+                family_alphas[mask] = apply_rate_func_to_array(rate_func, raw_alphas[mask])
+            fused.interpolate(family_alphas, to_interpolate[family_anim_indices])
+            to_interpolate[self.fused_anim_indices] = False
+
+        for n in np.flatnonzero(to_interpolate):
+            self.anims_with_timings[n][0].interpolate(float(sub_alphas[n]))
 
 
 class Succession(AnimationGroup):
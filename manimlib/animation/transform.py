@@ -9,8 +9,10 @@ from manimlib.constants import DEG
 from manimlib.constants import OUT
 from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Mobject
+from manimlib.utils.bezier import interpolate
 from manimlib.utils.paths import path_along_arc
 from manimlib.utils.paths import straight_path
+from manimlib.utils.rate_functions import apply_rate_func_to_array
 
 from typing import TYPE_CHECKING
 
@@ -37,6 +39,7 @@ class Transform(Animation):
         self.path_arc = path_arc
         self.path_arc_axis = path_arc_axis
         self.path_func = path_func
+        self.fused_interpolation = None
         super().__init__(mobject, **kwargs)
         self.init_path_func()
 
@@ -64,15 +67,51 @@ class Transform(Animation):
             # change the structure of both arguments
             self.target_copy = self.target_mobject.copy()
         self.mobject.align_data_and_family(self.target_copy)
+        self.fused_interpolation = None
         super().begin()
         if not self.mobject.has_updaters():
             self.mobject.lock_matching_data(
                 self.starting_mobject,
                 self.target_copy,
             )
+        self.init_fused_interpolation()
+
+    def init_fused_interpolation(self) -> None:
+        """
+        For transforms of mobjects with more than one family member,
+        which supports_fused_interpolation, and where nothing involved has
+        updaters, all family members are interpolated together each frame
+        through a FusedInterpolation
+        """
+        if len(self.families) < 2 or not self.supports_fused_interpolation():
+            return
+        if any(mob.has_updaters() for mob in self.get_all_mobjects() if isinstance(mob, Mobject)):
+            return
+        n_families = len(self.families)
+        self.family_lag_starts = self.lag_ratio * np.arange(n_families)
+        self.family_full_length = (n_families - 1) * self.lag_ratio + 1
+        self.fused_interpolation = FusedInterpolation(self.families)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        fused = self.fused_interpolation
+        if fused is not None and not fused.is_intact():
+            fused.release()
+            fused = self.fused_interpolation = None
+        if fused is None:
+            super().interpolate_mobject(alpha)
+            return
+        # Equivalent to get_sub_alpha for all family members at once
+        raw_alphas = np.clip(alpha * self.family_full_length - self.family_lag_starts, 0, 1)
+        fused.interpolate(
+            apply_rate_func_to_array(self.rate_func, raw_alphas),
+            np.ones(len(raw_alphas), dtype=bool),
+        )
 
     def finish(self) -> None:
         super().finish()
+        if self.fused_interpolation is not None:
+            self.fused_interpolation.release()
+            self.fused_interpolation = None
         self.mobject.unlock_data()
 
     def create_target(self) -> Mobject:
@@ -128,6 +167,164 @@ class Transform(Animation):
         submob.interpolate(start, target_copy, alpha, self.path_func)
         return self
 
+    def supports_fused_interpolation(self) -> bool:
+        """
+        Whether, once begun, interpolating this animation amounts to
+        nothing more than calling Mobject.interpolate along a straight path
+        for each family member, with the alphas given by get_sub_alpha, so
+        that FusedInterpolation can stand in for it
+        """
+        cls = type(self)
+        return all([
+            self.path_func is straight_path,
+            self.time_span is None,
+            cls.interpolate is Animation.interpolate,
+            cls.interpolate_mobject is Transform.interpolate_mobject,
+            cls.interpolate_submobject is Transform.interpolate_submobject,
+            all(
+                type(sm).interpolate is Mobject.interpolate
+                and sm.data.dtype == start.data.dtype == target.data.dtype
+                and len(sm.data) == len(start.data) == len(target.data)
+                for sm, start, target in self.families
+            ),
+        ])
+
+
+class FusedInterpolation(object):
+    """
+    Interpolates many mobjects at once, each between its own starting and
+    target mobject and with its own alpha, as Mobject.interpolate would
+    along a straight path.
+
+    The data arrays of the mobjects interpolated (and their bounding boxes)
+    are replaced with views into one contiguous array for each data type,
+    so that each frame takes one vectorized operation per data key, rather
+    than a call to Mobject.interpolate for each mobject.  Should anything
+    else replace one of those arrays, is_intact returns False, and the
+    mobjects should be interpolated one by one from then on.  Either way,
+    release should be called once done, so that the mobjects don't hold
+    on to views of the shared arrays past the animation.
+    """
+    def __init__(self, families: list[tuple[Mobject, Mobject, Mobject]]):
+        self.families = families
+        self.mobjects = [mob for mob, start, target in families]
+
+        # Mobjects are grouped by their data type and which of their
+        # data keys are locked, so that each can keep its locked data
+        group_to_indices = dict()
+        for n, mob in enumerate(self.mobjects):
+            group = (mob.data.dtype, frozenset(mob.locked_data_keys))
+            group_to_indices.setdefault(group, []).append(n)
+        self.data_groups = [
+            self.init_data_group(indices)
+            for indices in group_to_indices.values()
+        ]
+
+        self.bounding_boxes = np.array([mob.bounding_box for mob in self.mobjects])
+        self.start_bounding_boxes = np.array([start.bounding_box for _, start, _ in families])
+        self.target_bounding_boxes = np.array([target.bounding_box for _, _, target in families])
+        for mob, bounding_box in zip(self.mobjects, self.bounding_boxes):
+            mob.bounding_box = bounding_box
+
+        # Any change to the data of these mobjects through the usual means
+        # renews the data versions of the outermost ones, see is_intact
+        mob_ids = set(map(id, self.mobjects))
+        self.roots = [
+            mob for mob in self.mobjects
+            if not any(id(parent) in mob_ids for parent in mob.parents)
+        ]
+        self.root_versions = [root._data_version for root in self.roots]
+
+        # Only the few uniforms which differ between start and target
+        # are interpolated mobject by mobject
+        self.uniform_changes = []
+        for n, (mob, start, target) in enumerate(families):
+            keys = [
+                key for key in mob.uniforms
+                if key not in mob.locked_uniform_keys
+                if key in start.uniforms and key in target.uniforms
+                if not np.array_equal(start.uniforms[key], target.uniforms[key])
+            ]
+            if keys:
+                self.uniform_changes.append((n, keys))
+
+    def init_data_group(self, indices: list[int]) -> tuple:
+        mobs = [self.mobjects[n] for n in indices]
+        lengths = [len(mob.data) for mob in mobs]
+        data = np.concatenate([mob.data for mob in mobs])
+        offsets = np.cumsum([0, *lengths])
+        for mob, low, high in zip(mobs, offsets, offsets[1:]):
+            mob.data = data[low:high]
+            # Its data is no longer a view of that of some other mobject
+            mob.shared_data_source = None
+        # Locked keys, the same for all of them, are left alone
+        keys = [
+            key for key in data.dtype.names
+            if key not in mobs[0].locked_data_keys
+        ]
+        return (
+            np.array(indices, dtype=int),
+            np.repeat(indices, lengths).astype(int),
+            keys,
+            data,
+            np.concatenate([self.families[n][1].data for n in indices]),
+            np.concatenate([self.families[n][2].data for n in indices]),
+        )
+
+    def is_intact(self) -> bool:
+        # Unless something else changed their data since the last
+        # interpolation, there's no need to look at every mobject
+        root_versions = [root._data_version for root in self.roots]
+        if root_versions == self.root_versions:
+            return True
+        self.root_versions = root_versions
+        return all(
+            mob.data.base is data and mob.data.flags.writeable
+            for indices, _, _, data, _, _ in self.data_groups
+            for mob in (self.mobjects[n] for n in indices)
+        )
+
+    def release(self) -> None:
+        """
+        Gives each mobject still viewing one of the shared arrays
+        a copy of its part for its own
+        """
+        for indices, _, _, data, _, _ in self.data_groups:
+            for mob in (self.mobjects[n] for n in indices):
+                if mob.data.base is data:
+                    mob.data = mob.data.copy()
+        for mob in self.mobjects:
+            if mob.bounding_box.base is self.bounding_boxes:
+                mob.bounding_box = mob.bounding_box.copy()
+
+    def interpolate(self, alphas: np.ndarray, changed: np.ndarray) -> None:
+        """
+        alphas holds one alpha for each mobject, and changed marks
+        those which need interpolating, since their alpha has changed
+        """
+        for indices, row_indices, keys, data, start_data, target_data in self.data_groups:
+            if not changed[indices].any():
+                continue
+            row_alphas = alphas[row_indices]
+            for key in keys:
+                key_alphas = row_alphas.reshape(-1, *[1] * (data[key].ndim - 1))
+                data[key] = interpolate(start_data[key], target_data[key], key_alphas)
+
+        self.bounding_boxes[changed] = interpolate(
+            self.start_bounding_boxes[changed],
+            self.target_bounding_boxes[changed],
+            alphas[changed, np.newaxis, np.newaxis],
+        )
+        for n, keys in self.uniform_changes:
+            if not changed[n]:
+                continue
+            mob, start, target = self.families[n]
+            for key in keys:
+                mob.uniforms[key] = interpolate(start.uniforms[key], target.uniforms[key], alphas[n])
+        for n in np.flatnonzero(changed):
+            self.mobjects[n].note_changed_data()
+        self.root_versions = [root._data_version for root in self.roots]
+
 
 class ReplacementTransform(Transform):
     replace_mobject_with_target_in_scene: bool = True
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import defaultdict
 import itertools as it
+import math
 from difflib import SequenceMatcher
 
 from manimlib.animation.composition import AnimationGroup
@@ -52,15 +54,17 @@ class TransformMatchingParts(AnimationGroup):
             self.add_transform(*pair)
 
         # Finally, account for mismatches
+        animated_ids = self.get_animated_mobject_ids()
         for source_piece in self.source_pieces:
-            if any([source_piece in anim.mobject.get_family() for anim in self.anims]):
+            if id(source_piece) in animated_ids:
                 continue
             self.anims.append(FadeOutToPoint(
                 source_piece, target.get_center(),
                 **self.anim_config
             ))
+        animated_ids = self.get_animated_mobject_ids()
         for target_piece in self.target_pieces:
-            if any([target_piece in anim.mobject.get_family() for anim in self.anims]):
+            if id(target_piece) in animated_ids:
                 continue
             self.anims.append(FadeInFromPoint(
                 target_piece, source.get_center(),
@@ -98,17 +102,68 @@ class TransformMatchingParts(AnimationGroup):
         for char in new_target_pieces:
             self.target_pieces.remove(char)
 
+    def get_animated_mobject_ids(self) -> set[int]:
+        return set(
+            id(mob)
+            for anim in self.anims
+            for mob in anim.mobject.get_family()
+        )
+
     def find_pairs_with_matching_shapes(
         self,
         chars1: list[Mobject],
-        chars2: list[Mobject]
+        chars2: list[Mobject],
+        width_bin_size: float = 0.05,
     ) -> list[tuple[Mobject, Mobject]]:
+        """
+        All pairs for which has_same_shape_as holds, in the order of
+        it.product(chars1, chars2).
+
+        Rather than checking every pair, chars2 is indexed by point count
+        and by width relative to height, in bins of width_bin_size.  As the
+        points of a matching pair, normalized to unit height, are within a
+        tolerance of each other, so are their relative widths, and only the
+        bins within that tolerance need to be checked.  Pieces without a
+        relative width, such as empty ones, have a bin of their own.
+        """
+        index = defaultdict(list)
+        for n, char2 in enumerate(chars2):
+            n_points, width = self.get_shape_signature(char2)
+            width_bin = None if width is None else math.floor(width / width_bin_size)
+            index[(n_points, width_bin)].append(n)
+
         result = []
-        for char1, char2 in it.product(chars1, chars2):
-            if char1.has_same_shape_as(char2):
-                result.append((char1, char2))
+        for char1 in chars1:
+            n_points, width = self.get_shape_signature(char1)
+            if width is None:
+                candidates = index.get((n_points, None), [])
+            else:
+                # Matches the tolerance of has_same_shape_as, with some leeway
+                tol = 2 * char1.get_width() * 1e-2 + 1e-3
+                low_bin = math.floor((width - tol) / width_bin_size)
+                high_bin = math.floor((width + tol) / width_bin_size)
+                candidates = sorted(it.chain(*(
+                    index.get((n_points, width_bin), [])
+                    for width_bin in range(low_bin, high_bin + 1)
+                )))
+            for n in candidates:
+                if char1.has_same_shape_as(chars2[n]):
+                    result.append((char1, chars2[n]))
         return result
 
+    @staticmethod
+    def get_shape_signature(mobject: Mobject) -> tuple[int, float | None]:
+        """
+        Number of points and width relative to height, the same for any
+        two mobjects with the same shape.  For mobjects of zero height,
+        such as empty ones, the relative width is None
+        """
+        height = mobject.get_height()
+        width = mobject.get_width() / height if height > 0 else math.nan
+        if not math.isfinite(width):
+            width = None
+        return (len(mobject.get_all_points()), width)
+
     def clean_up_from_scene(self, scene: Scene) -> None:
         super().clean_up_from_scene(scene)
         scene.remove(self.mobject)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import copy
+import datetime
+import json
+import multiprocessing
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manimlib.benchmarks.scenes import BENCHMARK_SCENES
+from manimlib.config import manim_config
+from manimlib.logger import log
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, where peak memory goes unreported
+    resource = None
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Optional
+
+
+def get_peak_memory_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in kilobytes elsewhere
+    if platform.system() == "Darwin":
+        return peak / 2**20
+    return peak / 2**10
+
+
+def run_benchmark(scene_name: str, scene_config: dict) -> dict:
+    """
+    Meant to be run in a fresh worker process, so that the peak memory
+    reported is that of this one benchmark.  The movie is written into
+    a temporary directory, so that encoding is accounted for.
+    """
+    scene_class = {sc.__name__: sc for sc in BENCHMARK_SCENES}[scene_name]
+    config = copy.deepcopy(scene_config)
+    with tempfile.TemporaryDirectory() as output_directory:
+        config["file_writer_config"].update(
+            output_directory=output_directory,
+            file_name=scene_name,
+        )
+        start_time = time.perf_counter()
+        scene = scene_class(**config)
+        scene.run()
+        total_time = time.perf_counter() - start_time
+
+    frame_stage_timer = scene.file_writer.frame_stage_timer
+    n_frames = frame_stage_timer.frame_counts["rendered"]
+    durations = dict(
+        {stage: scene.durations[stage] for stage in scene.frame_stages},
+        # These happen on the frame writing thread, in parallel with
+        # everything else, so they needn't add to the total time
+        readback=frame_stage_timer.durations["read back"],
+        encode=frame_stage_timer.durations["encoded"],
+    )
+    # Time spent in play and wait calls, including the stages within them
+    animation_time = sum(scene.durations[stage] for stage in scene.frame_stages)
+    return dict(
+        n_frames=n_frames,
+        total_time=total_time,
+        construct_time=scene.durations["construct"],
+        frames_per_second=n_frames / max(animation_time, 1e-9),
+        ms_per_frame={
+            stage: 1000 * duration / max(n_frames, 1)
+            for stage, duration in durations.items()
+        },
+        peak_memory_mb=get_peak_memory_mb(),
+    )
+
+
+def get_benchmark_scene_config(scene_config: dict) -> dict:
+    config = copy.deepcopy(scene_config)
+    config.pop("window", None)
+    config.update(
+        skip_animations=False,
+        start_at_animation_number=None,
+        end_at_animation_number=None,
+        presenter_mode=False,
+        show_animation_progress=False,
+    )
+    config["file_writer_config"].update(
+        write_to_movie=True,
+        subdivide_output=False,
+        cache_segments=False,
+        save_last_frame=False,
+        quiet=True,
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+    )
+    return config
+
+
+def flatten_metrics(result: dict, prefix: str = "") -> dict[str, float]:
+    metrics = dict()
+    for key, value in result.items():
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, prefix + key + "."))
+        elif isinstance(value, (int, float)):
+            metrics[prefix + key] = value
+    return metrics
+
+
+def compare_to_baseline(
+    results: dict,
+    baseline: dict,
+    tolerance: float = 0.1,
+    min_ms_per_frame: float = 0.1,
+) -> list[str]:
+    """
+    Returns a description of each metric in results which got worse than
+    its value in baseline by more than the given fraction.  Frames per
+    second are better the higher they are, all other metrics (times and
+    memory) the lower.  Stages taking a negligible time per frame are
+    left out, as their relative changes are mostly noise.
+    """
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        old_result = baseline["benchmarks"].get(name)
+        if "error" in result or old_result is None or "error" in old_result:
+            continue
+        old_metrics = flatten_metrics(old_result)
+        for key, new_value in flatten_metrics(result).items():
+            old_value = old_metrics.get(key)
+            if key == "n_frames" or not old_value:
+                continue
+            if key.startswith("ms_per_frame.") and max(old_value, new_value) < min_ms_per_frame:
+                continue
+            if key == "frames_per_second":
+                change = old_value / max(new_value, 1e-9) - 1
+            else:
+                change = new_value / old_value - 1
+            if change > tolerance:
+                regressions.append(
+                    f"{name} {key}: {old_value:.4g} -> {new_value:.4g} ({100 * change:+.0f}% worse)"
+                )
+    return regressions
+
+
+def run_benchmarks(
+    scene_config: dict,
+    names: Iterable[str] = (),
+    output_file: Optional[str] = None,
+    baseline_file: Optional[str] = None,
+    tolerance: float = 0.1,
+) -> bool:
+    """
+    Runs each of the named benchmark scenes (all of them if none are
+    named) headless in its own process, logs how each one went, and
+    writes all results as json to output_file.
+
+    When a baseline_file from an earlier run is given, results are compared
+    against it, and False is returned if anything regressed by more than
+    the given tolerance.
+    """
+    name_to_class = {sc.__name__: sc for sc in BENCHMARK_SCENES}
+    names = list(names) or list(name_to_class.keys())
+    for name in names:
+        if name not in name_to_class:
+            log.error(f"No benchmark named {name}, choose from {', '.join(name_to_class)}")
+            return False
+
+    config = get_benchmark_scene_config(scene_config)
+    results = dict(
+        date=datetime.datetime.now().isoformat(timespec="seconds"),
+        platform=platform.platform(),
+        python=platform.python_version(),
+        resolution=list(manim_config.camera.resolution),
+        fps=manim_config.camera.fps,
+        benchmarks=dict(),
+    )
+    # Spawn, rather than fork, so that no process inherits an OpenGL context
+    mp_context = multiprocessing.get_context("spawn")
+    for name in names:
+        with ProcessPoolExecutor(1, mp_context=mp_context) as executor:
+            try:
+                result = executor.submit(run_benchmark, name, config).result()
+            except Exception as err:
+                log.error(f"Benchmark {name} failed: {err!r}")
+                result = dict(error=repr(err))
+        results["benchmarks"][name] = result
+        if "error" not in result:
+            stage_times = ", ".join(
+                f"{stage} {ms:.2f}"
+                for stage, ms in result["ms_per_frame"].items()
+            )
+            log.info(
+                f"{name}: {result['n_frames']} frames at {result['frames_per_second']:.1f} fps, "
+                f"construct {result['construct_time']:.2f}s, ms per frame: {stage_times}"
+            )
+
+    if output_file is not None:
+        with open(output_file, "w") as fp:
+            json.dump(results, fp, indent=2)
+        log.info(f"Benchmark results written to {output_file}")
+
+    if baseline_file is None:
+        return True
+    with open(baseline_file, "r") as fp:
+        baseline = json.load(fp)
+    regressions = compare_to_baseline(results, baseline, tolerance)
+    for regression in regressions:
+        log.warning(f"Regression: {regression}")
+    if not regressions:
+        log.info(f"No regressions beyond {100 * tolerance:.0f}% compared to {baseline_file}")
+    return len(regressions) == 0
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import time
+
+import numpy as np
+
+from manimlib.animation.transform import Transform
+from manimlib.constants import DOWN, LEFT, RIGHT
+from manimlib.constants import DEG, PI, TAU
+from manimlib.constants import BLUE, RED, TEAL, YELLOW
+from manimlib.constants import FRAME_HEIGHT
+from manimlib.mobject.functions import ParametricCurve
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.geometry import Dot
+from manimlib.mobject.geometry import RegularPolygon
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.svg.tex_mobject import Tex
+from manimlib.mobject.svg.text_mobject import Text
+from manimlib.mobject.three_dimensions import Sphere
+from manimlib.mobject.three_dimensions import Torus
+from manimlib.mobject.types.dot_cloud import DotCloud
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.scene.scene import Scene
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+
+class BenchmarkScene(Scene):
+    """
+    Scene keeping track of where the time of its run goes.  Time spent
+    in each stage excludes the time spent in any stage nested within it,
+    so that construct only counts what construct itself does, outside of
+    playing animations.  Neither initializing the scene nor finishing the
+    movie file afterwards counts towards any stage.
+    """
+    stages = ("construct", "animate", "update", "capture", "write")
+    frame_stages = ("animate", "update", "capture", "write")
+
+    def setup(self):
+        self.durations: dict[str, float] = dict.fromkeys(self.stages, 0.0)
+        # Setup is called right before construct
+        self.stage_stack: list[str] = ["construct"]
+        self.stage_start: float = time.perf_counter()
+
+    def tear_down(self) -> None:
+        self.pause_current_stage()
+        self.stage_stack = []
+        super().tear_down()
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        self.pause_current_stage()
+        self.stage_stack.append(stage)
+        try:
+            yield
+        finally:
+            self.pause_current_stage()
+            self.stage_stack.pop()
+
+    def pause_current_stage(self) -> None:
+        now = time.perf_counter()
+        if self.stage_stack:
+            self.durations[self.stage_stack[-1]] += now - self.stage_start
+        self.stage_start = now
+
+    def play(self, *args, **kwargs) -> None:
+        with self.time_stage("animate"):
+            super().play(*args, **kwargs)
+
+    def wait(self, *args, **kwargs) -> None:
+        with self.time_stage("animate"):
+            super().wait(*args, **kwargs)
+
+    def update_mobjects(self, dt: float) -> None:
+        with self.time_stage("update"):
+            super().update_mobjects(dt)
+
+    def update_frame(self, *args, **kwargs) -> None:
+        with self.time_stage("capture"):
+            super().update_frame(*args, **kwargs)
+
+    def emit_frame(self) -> None:
+        with self.time_stage("write"):
+            super().emit_frame()
+
+
+class ManySmallVMobjects(BenchmarkScene):
+    def construct(self):
+        shapes = VGroup(*(
+            (Square if n % 2 else Circle)().set_height(0.08)
+            for n in range(2500)
+        ))
+        shapes.arrange_in_grid(50, 50, buff=0.05)
+        shapes.set_stroke(BLUE, 1)
+        shapes.set_fill(TEAL, 0.5)
+        self.add(shapes)
+        self.play(shapes.animate.rotate(PI / 2).set_fill(YELLOW), run_time=2)
+
+
+class HugeSinglePath(BenchmarkScene):
+    def construct(self):
+        curve = ParametricCurve(
+            lambda t: np.array([3 * np.sin(3.01 * t), 3 * np.sin(2 * t), 0 * t]).T,
+            t_range=(0, 200 * TAU, 0.01),
+            vectorized=True,
+        )
+        curve.set_stroke(YELLOW, 1)
+        self.add(curve)
+        self.play(curve.animate.rotate(PI / 2), run_time=2)
+
+
+class ManyTexts(BenchmarkScene):
+    def construct(self):
+        paragraphs = VGroup(*(
+            Text(f"Line {n}: The quick brown fox jumps over the lazy dog")
+            for n in range(20)
+        ))
+        paragraphs.arrange(DOWN)
+        paragraphs.set_height(FRAME_HEIGHT - 1)
+        self.add(paragraphs)
+        self.play(paragraphs.animate.set_color(BLUE), run_time=2)
+
+
+class ManyTexs(BenchmarkScene):
+    def construct(self):
+        equations = VGroup(*(
+            Tex(rf"\sum_{{k=1}}^{{{n}}} \frac{{1}}{{k^2}} \le \frac{{\pi^2}}{{6}}")
+            for n in range(1, 21)
+        ))
+        equations.arrange_in_grid(5, 4)
+        equations.set_width(13)
+        self.add(equations)
+        self.play(equations.animate.set_color(YELLOW), run_time=2)
+
+
+class Surfaces(BenchmarkScene):
+    def construct(self):
+        self.frame.reorient(20, 70)
+        sphere = Sphere(radius=1.5, resolution=(201, 101)).shift(2.5 * LEFT)
+        torus = Torus(r1=1.5, r2=0.5, resolution=(201, 101)).shift(2.5 * RIGHT)
+        sphere.set_color(BLUE)
+        torus.set_color(RED)
+        self.add(sphere, torus)
+        self.play(
+            sphere.animate.rotate(90 * DEG),
+            torus.animate.rotate(90 * DEG, axis=RIGHT),
+            run_time=2,
+        )
+
+
+class LargeDotCloud(BenchmarkScene):
+    def construct(self):
+        points = np.random.default_rng(0).normal(size=(10**6, 3))
+        cloud = DotCloud(points, radius=0.005, color=BLUE)
+        self.add(cloud)
+        self.play(cloud.animate.rotate(PI / 2), run_time=2)
+
+
+class ComplexTransform(BenchmarkScene):
+    def construct(self):
+        polygons = VGroup(*(
+            RegularPolygon(n=n, radius=0.3)
+            for n in range(3, 53)
+        ))
+        polygons.arrange_in_grid(5, 10)
+        curves = VGroup(*(
+            ParametricCurve(
+                lambda t, k=k: np.array([0.3 * np.cos(t), 0.3 * np.sin(k * t), 0 * t]).T,
+                t_range=(0, TAU, 0.02),
+                vectorized=True,
+            )
+            for k in range(1, 51)
+        ))
+        curves.arrange_in_grid(5, 10)
+        curves.set_stroke(YELLOW)
+        self.add(polygons)
+        self.play(Transform(polygons, curves), run_time=2)
+
+
+class ManyUpdaters(BenchmarkScene):
+    def construct(self):
+        dots = VGroup(*(Dot(radius=0.04) for n in range(500)))
+        for n, dot in enumerate(dots):
+            radius = 0.5 + 3 * (n / len(dots))
+            phase = n * 0.1
+            dot.add_updater(lambda d, radius=radius, phase=phase: d.move_to([
+                radius * np.cos(self.time + phase),
+                radius * np.sin(self.time + phase),
+                0,
+            ]))
+        self.add(dots)
+        self.wait(2)
+
+
+BENCHMARK_SCENES: list[type[BenchmarkScene]] = [
+    ManySmallVMobjects,
+    HugeSinglePath,
+    ManyTexts,
+    ManyTexs,
+    Surfaces,
+    LargeDotCloud,
+    ComplexTransform,
+    ManyUpdaters,
+]
@@ -13,6 +13,7 @@ from manimlib.constants import FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.profiling import profiler
 
 from typing import TYPE_CHECKING
 
@@ -146,6 +147,24 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def read_fbo_data_into(self, buffer: moderngl.Buffer, dtype: str = 'f1') -> None:
+        """
+        Begins reading the frame into a pixel pack buffer. This returns without
+        waiting on the gpu, and the data can be retrieved later with buffer.read()
+        """
+        self.blit(self.fbo, self.draw_fbo)
+        self.draw_fbo.read_into(
+            buffer,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            dtype=dtype,
+        )
+
+    def get_raw_fbo_data_size(self, dtype: str = 'f1') -> int:
+        # Dtypes here are moderngl's, e.g. 'f1' or 'f4', ending in the byte count
+        width, height = self.draw_fbo.size
+        return width * height * self.n_channels * int(dtype[1:])
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -227,7 +246,8 @@ class Camera(object):
         self.refresh_uniforms()
         self.fbo.use()
         for mobject in mobjects:
-            mobject.render(self.ctx, self.uniforms)
+            with profiler.span(lambda: str(mobject), "render_group"):
+                mobject.render(self.ctx, self.uniforms)
 
         if self.window:
             self.window.swap_buffers()
@@ -150,6 +150,12 @@ def parse_cli():
             help="Divide the output animation into individual movie files " +
                  "for each animation",
         )
+        parser.add_argument(
+            "--cache_segments",
+            action="store_true",
+            help="Cache the movie of each animation, so that animations which " + \
+                 "haven't changed are not rendered again on later runs",
+        )
         parser.add_argument(
             "--file_name",
             help="Name for the movie or image file",
@@ -193,7 +199,41 @@ def parse_cli():
             "--prerun",
             action="store_true",
             help="Calculate total framecount, to display in a progress bar, by doing " + \
-                 "an initial run of the scene which skips animations."
+                 "an initial run of the scene which skips animations. Only needed " + \
+                 "when the scene has not been rendered through before, as the run " + \
+                 "times from its last full run are otherwise cached."
+        )
+        parser.add_argument(
+            "--parallel",
+            metavar="N_PROCESSES",
+            help="Render the animations of a scene across multiple processes, " + \
+                 "each writing partial movie files which are then concatenated"
+        )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="frame_profile.json",
+            metavar="TRACE_FILE",
+            help="Record how long each stage of each frame takes, such as each " + \
+                 "updater and each render group, summarize this for each play " + \
+                 "call, and write it as a trace viewable in chrome://tracing",
+        )
+        parser.add_argument(
+            "--benchmark",
+            nargs="*",
+            metavar="BENCHMARK_NAME",
+            help="Run the built-in benchmark scenes, or only those named, " + \
+                 "headless, reporting where the time of each one goes",
+        )
+        parser.add_argument(
+            "--benchmark_output",
+            default="benchmark_results.json",
+            help="Path of the json file into which benchmark results are written",
+        )
+        parser.add_argument(
+            "--benchmark_baseline",
+            help="Path of the results of an earlier benchmark run, " + \
+                 "which new results are checked against for regressions",
         )
         parser.add_argument(
             "--video_dir",
@@ -290,6 +330,9 @@ def update_file_writer_config(config: Dict, args: Namespace):
     if args.pix_fmt:
         file_writer_config.pixel_format = args.pix_fmt
 
+    if args.cache_segments:
+        file_writer_config.cache_segments = True
+
 
 def update_scene_config(config: Dict, args: Namespace):
     scene_config = config.scene
@@ -304,6 +347,7 @@ def update_scene_config(config: Dict, args: Namespace):
         start_at_animation_number=start,
         end_at_animation_number=end,
         presenter_mode=args.presenter_mode,
+        profile_file=args.profile,
     )
     if args.leave_progress_bars:
         scene_config.leave_progress_bars = True
@@ -317,7 +361,11 @@ def update_run_config(config: Dict, args: Namespace):
         embed_line=(int(args.embed) if args.embed is not None else None),
         is_reload=False,
         prerun=args.prerun,
+        parallel=(int(args.parallel) if args.parallel is not None else 1),
         scene_names=args.scene_names,
+        benchmark=args.benchmark,
+        benchmark_output=args.benchmark_output,
+        benchmark_baseline=args.benchmark_baseline,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
         show_in_window=not args.write_file
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import inspect
+import os
 import sys
 
 from manimlib.module_loader import ModuleLoader
@@ -9,7 +10,10 @@ from manimlib.module_loader import ModuleLoader
 from manimlib.config import manim_config
 from manimlib.logger import log
 from manimlib.scene.interactive_scene import InteractiveScene
+from manimlib.scene.parallel_renderer import ParallelSceneRenderer
 from manimlib.scene.scene import Scene
+from manimlib.utils.cache import get_cached_value
+from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -59,6 +63,37 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
+def get_timeline_key(scene_class, scene_config, file_name: Optional[str]) -> str:
+    """
+    Key under which the run times of each play and wait call of a scene
+    are cached, which changes along with the file defining the scene
+    """
+    source = ""
+    if file_name is not None and os.path.exists(file_name):
+        with open(file_name, "r", encoding="utf-8") as fp:
+            source = fp.read()
+    return hash_string("".join(map(str, [
+        "scene_timeline",
+        scene_class.__qualname__,
+        source,
+        scene_config.get("default_wait_time"),
+    ])))
+
+
+def get_cached_total_frames(scene_config) -> Optional[int]:
+    """
+    Number of frames the scene is expected to require, based on the run
+    times cached from its last full run, if there was one
+    """
+    timeline = get_cached_value(scene_config["file_writer_config"]["timeline_key"])
+    if timeline is None:
+        return None
+    start = scene_config.get("start_at_animation_number") or 0
+    end = scene_config.get("end_at_animation_number")
+    total_time = sum(timeline[start:end])
+    return int(total_time * manim_config.camera.fps)
+
+
 def compute_total_frames(scene_class, scene_config):
     """
     When a scene is being written to file, a copy of the scene is run with
@@ -79,8 +114,23 @@ def compute_total_frames(scene_class, scene_config):
 
 def scene_from_class(scene_class, scene_config: Dict, run_config: Dict):
     fw_config = manim_config.file_writer
-    if fw_config.write_to_movie and run_config.prerun:
-        scene_config.file_writer_config.total_frames = compute_total_frames(scene_class, scene_config)
+    if fw_config.write_to_movie:
+        fw = scene_config.file_writer_config
+        fw.timeline_key = get_timeline_key(scene_class, scene_config, run_config.file_name)
+    if fw_config.write_to_movie and run_config.parallel > 1 and run_config.file_name:
+        return ParallelSceneRenderer(
+            scene_class, scene_config,
+            file_name=run_config.file_name,
+            n_processes=run_config.parallel,
+        )
+    if fw_config.write_to_movie:
+        # Without a known total, the progress display grows as frames come in.
+        # The total is known when a previous full run of this scene was cached,
+        # or, failing that, when computed by an initial run through the scene
+        total_frames = get_cached_total_frames(scene_config)
+        if total_frames is None and run_config.prerun:
+            total_frames = compute_total_frames(scene_class, scene_config)
+        fw.total_frames = total_frames or 0
     return scene_class(**scene_config)
 
 
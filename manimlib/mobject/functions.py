@@ -3,15 +3,18 @@ from __future__ import annotations
 from isosurfaces import plot_isoline
 import numpy as np
 
+from manimlib.constants import DEFAULT_PIXEL_WIDTH
+from manimlib.constants import FRAME_WIDTH
 from manimlib.constants import FRAME_X_RADIUS, FRAME_Y_RADIUS
 from manimlib.constants import YELLOW
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.space_ops import get_dist_to_segments
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Sequence, Tuple
-    from manimlib.typing import ManimColor, Vect3
+    from manimlib.typing import ManimColor, Vect3, Vect3Array
 
 
 class ParametricCurve(VMobject):
@@ -23,6 +26,15 @@ class ParametricCurve(VMobject):
         # TODO, automatically figure out discontinuities
         discontinuities: Sequence[float] = [],
         use_smoothing: bool = True,
+        # If True, t_func is called once on an array of n values of t,
+        # and should return an array of shape (n, 3)
+        vectorized: bool = False,
+        # If True, the samples spaced by the step of t_range are refined
+        # wherever the curve strays from the lines between them by more
+        # than tolerance, and thinned out wherever it doesn't
+        adaptive: bool = False,
+        tolerance: float = FRAME_WIDTH / DEFAULT_PIXEL_WIDTH,
+        max_refinements: int = 8,
         **kwargs
     ):
         self.t_func = t_func
@@ -30,10 +42,64 @@ class ParametricCurve(VMobject):
         self.epsilon = epsilon
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
+        self.vectorized = vectorized
+        self.adaptive = adaptive
+        self.tolerance = tolerance
+        self.max_refinements = max_refinements
         super().__init__(**kwargs)
 
     def get_point_from_function(self, t: float) -> Vect3:
-        return np.array(self.t_func(t))
+        return self.get_points_from_function(np.array([t]))[0]
+
+    def get_points_from_function(self, ts: np.ndarray) -> Vect3Array:
+        if self.vectorized:
+            points = np.array(self.t_func(ts), dtype=float)
+        else:
+            points = np.array([self.t_func(t) for t in ts], dtype=float)
+        return points.reshape((len(ts), self.dim))
+
+    def get_samples(self, t1: float, t2: float) -> tuple[np.ndarray, Vect3Array]:
+        ts = np.array([*np.arange(t1, t2, self.t_range[2]), t2])
+        points = self.get_points_from_function(ts)
+        if self.adaptive:
+            ts, points = self.refine_samples(ts, points)
+            ts, points = self.thin_out_samples(ts, points)
+        return ts, points
+
+    def refine_samples(self, ts: np.ndarray, points: Vect3Array) -> tuple[np.ndarray, Vect3Array]:
+        """
+        Repeatedly adds samples halfway (in t) between neighboring
+        samples, wherever the curve there is further than tolerance
+        from the line between them
+        """
+        for _ in range(self.max_refinements):
+            mid_ts = 0.5 * (ts[:-1] + ts[1:])
+            mid_points = self.get_points_from_function(mid_ts)
+            errors = get_dist_to_segments(mid_points, points[:-1], points[1:])
+            indices = np.flatnonzero(errors > self.tolerance)
+            if len(indices) == 0:
+                break
+            ts = np.insert(ts, indices + 1, mid_ts[indices])
+            points = np.insert(points, indices + 1, mid_points[indices], axis=0)
+        return ts, points
+
+    def thin_out_samples(self, ts: np.ndarray, points: Vect3Array) -> tuple[np.ndarray, Vect3Array]:
+        """
+        Repeatedly drops every other sample lying within tolerance of
+        the line between its neighbors, never two neighbors at once
+        """
+        for _ in range(self.max_refinements):
+            if len(points) < 3:
+                break
+            errors = get_dist_to_segments(points[1:-1:2], points[0:-2:2], points[2::2])
+            flat = errors <= self.tolerance
+            if not flat.any():
+                break
+            keep = np.ones(len(points), dtype=bool)
+            keep[1:-1:2] = ~flat
+            ts = ts[keep]
+            points = points[keep]
+        return ts, points
 
     def init_points(self):
         t_min, t_max, step = self.t_range
@@ -43,14 +109,13 @@ class ParametricCurve(VMobject):
         boundary_times = [t_min, t_max, *(jumps - self.epsilon), *(jumps + self.epsilon)]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = [*np.arange(t1, t2, step), t2]
-            points = np.array([self.t_func(t) for t in t_range])
+            _, points = self.get_samples(t1, t2)
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
             self.make_smooth(approx=True)
         if not self.has_points():
-            self.set_points(np.array([self.t_func(t_min)]))
+            self.set_points(self.get_points_from_function(np.array([t_min])))
         return self
 
     def get_t_func(self):
@@ -73,15 +138,21 @@ class FunctionGraph(ParametricCurve):
         function: Callable[[float], float],
         x_range: Tuple[float, float, float] = (-8, 8, 0.25),
         color: ManimColor = YELLOW,
+        # If True, function is called once on an array of values of x
+        vectorized: bool = False,
         **kwargs
     ):
         self.function = function
         self.x_range = x_range
 
         def parametric_function(t):
+            if vectorized:
+                # Functions returning a constant needn't return an array
+                ys = np.broadcast_to(function(t), t.shape)
+                return np.array([t, ys, np.zeros_like(t)]).T
             return [t, function(t), 0]
 
-        super().__init__(parametric_function, self.x_range, **kwargs)
+        super().__init__(parametric_function, self.x_range, vectorized=vectorized, **kwargs)
 
 
 class ImplicitFunction(VMobject):
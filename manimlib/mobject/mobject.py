@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import copy
 from functools import wraps
 import itertools as it
@@ -7,6 +8,7 @@ import os
 import pickle
 import random
 import sys
+import weakref
 
 import moderngl
 import numbers
@@ -39,6 +41,7 @@ from manimlib.utils.iterables import resize_with_interpolation
 from manimlib.utils.bezier import integer_interpolate
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.paths import straight_path
+from manimlib.utils.profiling import profiler
 from manimlib.utils.shaders import get_colormap_code
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
@@ -66,6 +69,9 @@ class Mobject(object):
     Mathematical Object
     """
     dim: int = 3
+    # Shared across all mobjects, so that data versions are never
+    # repeated, even between mobjects reusing the same id
+    data_versions: Iterator[int] = it.count(1)
     shader_folder: str = ""
     render_primitive: int = moderngl.TRIANGLE_STRIP
     # Must match in attributes of vert shader
@@ -99,6 +105,8 @@ class Mobject(object):
         self.submobjects: list[Mobject] = []
         self.parents: list[Mobject] = []
         self.family: list[Mobject] | None = [self]
+        # Only set within batched_additions
+        self.submobject_ids: set[int] | None = None
         self.locked_data_keys: set[str] = set()
         self.const_data_keys: set[str] = set()
         self.locked_uniform_keys: set[str] = set()
@@ -109,6 +117,13 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        # Renewed with each change to data, so that shader wrappers
+        # can tell which submobjects need their data read in again
+        self._data_version: int = next(self.data_versions)
+        self._rendered_data_version: int | None = None
+        # See copy and unshare_data
+        self.data_sharers: list[weakref.ref[Mobject]] = []
+        self.shared_data_source: tuple[weakref.ref[Mobject], np.ndarray] | None = None
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -202,8 +217,37 @@ class Mobject(object):
         """
         return _FunctionalUpdaterBuilder(self)
 
+    def unshare_data(self, detach_copies: bool = True) -> Self:
+        """
+        Copies get a read-only view of the data of the mobject they were
+        copied from until either one goes to change it.  Anything writing
+        into data directly should call this first, after which a copy has
+        an array of its own, and a mobject which has been copied hands
+        each of its copies an array of their own, keeping its own array
+        (along with any views of it gotten earlier) as it is.
+
+        Writes of values derived from the points alone, like normals and
+        joint angles, can pass detach_copies=False, since copies sharing
+        those points would derive the same values.
+        """
+        if not self.data.flags.writeable:
+            self.data = self.data.copy()
+            self.shared_data_source = None
+        if detach_copies and self.data_sharers:
+            for ref in self.data_sharers:
+                sharer = ref()
+                if sharer is not None and sharer.is_sharing_data_of(self.data):
+                    sharer.data = sharer.data.copy()
+                    sharer.shared_data_source = None
+            self.data_sharers = []
+        return self
+
+    def is_sharing_data_of(self, array: np.ndarray) -> bool:
+        return self.shared_data_source is not None and self.shared_data_source[1] is array
+
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version = next(self.data_versions)
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
@@ -213,6 +257,7 @@ class Mobject(object):
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.unshare_data()
             result = func(self, *args, **kwargs)
             self.note_changed_data()
             return result
@@ -222,6 +267,8 @@ class Mobject(object):
     def affects_family_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            for mob in self.get_family():
+                mob.unshare_data()
             result = func(self, *args, **kwargs)
             for mob in self.family_members_with_points():
                 mob.note_changed_data()
@@ -459,24 +506,60 @@ class Mobject(object):
     def add(self, *mobjects: Mobject) -> Self:
         if self in mobjects:
             raise Exception("Mobject cannot contain self")
+        in_batch = self.submobject_ids is not None
+        if in_batch:
+            submobject_ids = self.submobject_ids
+        else:
+            submobject_ids = set(map(id, self.submobjects))
         for mobject in mobjects:
-            if mobject not in self.submobjects:
+            if id(mobject) not in submobject_ids:
                 self.submobjects.append(mobject)
+                submobject_ids.add(id(mobject))
             if self not in mobject.parents:
                 mobject.parents.append(self)
-        self.note_changed_family()
+        if not in_batch:
+            self.note_changed_family()
         return self
 
+    @contextmanager
+    def batched_additions(self) -> Iterator[Self]:
+        """
+        For adding a great many submobjects one at a time, e.g.
+
+        with group.batched_additions():
+            for point in points:
+                group.add(Dot(point))
+
+        Within this context, add only appends to the submobject list,
+        and the family of this mobject is refreshed once at the end.
+        """
+        if self.submobject_ids is not None:
+            yield self
+            return
+        self.submobject_ids = set(map(id, self.submobjects))
+        try:
+            yield self
+        finally:
+            self.submobject_ids = None
+            self.note_changed_family()
+
     def remove(
         self,
         *to_remove: Mobject,
         reassemble: bool = True,
         recurse: bool = True
     ) -> Self:
+        ids_to_remove = set(map(id, to_remove))
         for parent in self.get_family(recurse):
-            for child in to_remove:
-                if child in parent.submobjects:
-                    parent.submobjects.remove(child)
+            removed = [sm for sm in parent.submobjects if id(sm) in ids_to_remove]
+            if removed:
+                parent.submobjects[:] = [
+                    sm for sm in parent.submobjects
+                    if id(sm) not in ids_to_remove
+                ]
+                if parent.submobject_ids is not None:
+                    parent.submobject_ids.difference_update(map(id, removed))
+            for child in removed:
                 if parent in child.parents:
                     child.parents.remove(parent)
             if reassemble:
@@ -497,11 +580,16 @@ class Mobject(object):
             old_submob.parents.remove(self)
         self.submobjects[index] = new_submob
         new_submob.parents.append(self)
+        if self.submobject_ids is not None:
+            self.submobject_ids.discard(id(old_submob))
+            self.submobject_ids.add(id(new_submob))
         self.note_changed_family()
         return self
 
     def insert_submobject(self, index: int, new_submob: Mobject) -> Self:
         self.submobjects.insert(index, new_submob)
+        if self.submobject_ids is not None:
+            self.submobject_ids.add(id(new_submob))
         self.note_changed_family()
         return self
 
@@ -636,7 +724,7 @@ class Mobject(object):
     def stash_mobject_pointers(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            uncopied_attrs = ["parents", "target", "saved_state"]
+            uncopied_attrs = ["parents", "target", "saved_state", "submobject_ids"]
             stash = dict()
             for attr in uncopied_attrs:
                 if hasattr(self, attr):
@@ -661,7 +749,22 @@ class Mobject(object):
     def deepcopy(self) -> Self:
         return copy.deepcopy(self)
 
+    def __getstate__(self):
+        # Pointers for the data sharing between copies are neither
+        # picklable nor meaningful for a deepcopy
+        state = self.__dict__.copy()
+        state["data_sharers"] = []
+        state["shared_data_source"] = None
+        return state
+
     def copy(self, deep: bool = False) -> Self:
+        """
+        Note, the data array is not copied up front, rather the copy gets a
+        read-only view of it until either this mobject or the copy goes to
+        change it (see unshare_data).  Arrays gotten from this mobject, say
+        from get_points(), stay its own, but code writing into them directly
+        should call unshare_data first so as to leave the copy unaffected.
+        """
         if deep:
             return self.deepcopy()
 
@@ -670,6 +773,7 @@ class Mobject(object):
         result.parents = []
         result.target = None
         result.saved_state = None
+        result.submobject_ids = None
 
         # copy.copy is only a shallow copy, so the internal
         # data which are numpy arrays or other mobjects still
@@ -693,12 +797,32 @@ class Mobject(object):
         result._data_has_changed = True
         result.shader_wrapper = None
 
+        # Rather than copying data up front, the copy gets a read-only view
+        # of it until either one changes it, see unshare_data
+        if self.data.flags.writeable:
+            source = (weakref.ref(self), self.data)
+        else:
+            source = self.shared_data_source
+        if source is not None:
+            owner = source[0]()
+            if owner is not None and owner.data is source[1]:
+                if len(owner.data_sharers) >= 32:
+                    owner.data_sharers = [
+                        ref for ref in owner.data_sharers
+                        if ref() is not None and ref().is_sharing_data_of(owner.data)
+                    ]
+                owner.data_sharers.append(weakref.ref(result))
+        result.data = self.data.view()
+        result.data.flags.writeable = False
+        result.data_sharers = []
+        result.shared_data_source = source
+
         family = self.get_family()
         for attr, value in self.__dict__.items():
             if isinstance(value, Mobject) and value is not self:
                 if value in family:
                     setattr(result, attr, result.family[family.index(value)])
-            elif isinstance(value, np.ndarray):
+            elif isinstance(value, np.ndarray) and value is not self.data:
                 setattr(result, attr, value.copy())
         return result
 
@@ -829,12 +953,13 @@ class Mobject(object):
             for submob in self.submobjects:
                 submob.update(dt, recurse)
         for updater in self.updaters:
-            # This is hacky, but if an updater takes dt as an arg,
-            # it will be passed the change in time from here
-            if "dt" in updater.__code__.co_varnames:
-                updater(self, dt=dt)
-            else:
-                updater(self)
+            with profiler.span(updater.__qualname__, "updater", mobject=self):
+                # This is hacky, but if an updater takes dt as an arg,
+                # it will be passed the change in time from here
+                if "dt" in updater.__code__.co_varnames:
+                    updater(self, dt=dt)
+                else:
+                    updater(self)
         return self
 
     def get_updaters(self) -> list[Updater]:
@@ -1807,6 +1932,7 @@ class Mobject(object):
     ) -> Self:
         keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
         if keys:
+            self.unshare_data()
             self.note_changed_data()
         for key in keys:
             md1 = mobject1.data[key]
@@ -2020,8 +2146,12 @@ class Mobject(object):
             if submob.shader_wrapper is not None:
                 submob.shader_wrapper.depth_test = submob.depth_test
                 submob.shader_wrapper.refresh_id()
-        for mob in (self, *self.get_ancestors()):
-            mob._data_has_changed = True
+        # Renewing data versions, rather than just flagging the change,
+        # has shader wrappers read in the data of this family anew
+        for submob in self.get_family():
+            submob.note_changed_data(recurse_up=False)
+        for mob in self.get_ancestors():
+            mob.note_changed_data(recurse_up=False)
         return self
 
     def get_shader_wrapper(self, ctx: Context) -> ShaderWrapper:
@@ -2029,15 +2159,26 @@ class Mobject(object):
             self.init_shader_wrapper(ctx)
         return self.shader_wrapper
 
-    def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
+    def get_shader_wrapper_list(
+        self,
+        ctx: Context,
+        reuse_data: bool = True
+    ) -> list[ShaderWrapper]:
         family = self.family_members_with_points()
         batches = batch_by_property(family, lambda sm: sm.get_shader_wrapper(ctx).get_id())
 
         result = []
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            # When possible, only rewrite data for those
+            # submobjects whose data has changed
+            data_keys = [(id(sm), sm._data_version) for sm in submobs]
+            if not reuse_data or not shader_wrapper.read_in_changes(
+                data_keys, lambda i: submobs[i].get_shader_data()
+            ):
+                data_list = [sm.get_shader_data() for sm in submobs]
+                index_list = [sm.get_shader_index_data() for sm in submobs]
+                shader_wrapper.read_in(data_list, index_list, data_keys)
             result.append(shader_wrapper)
         return result
 
@@ -2054,14 +2195,30 @@ class Mobject(object):
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return None
 
+    def get_shader_index_data(self) -> Optional[np.ndarray]:
+        """
+        Indices into the array returned by get_shader_data, for
+        shader wrappers which draw some primitives through an
+        index buffer
+        """
+        return None
+
     def render(self, ctx: Context, camera_uniforms: dict):
         if self._data_has_changed:
-            self.shader_wrappers = self.get_shader_wrapper_list(ctx)
+            with profiler.span("get_shader_wrapper_list", "render", mobject=self):
+                # A change flagged without renewing the data version, say
+                # after writing into data directly, leaves no trace in the
+                # data keys, so then everything is read in anew
+                self.shader_wrappers = self.get_shader_wrapper_list(
+                    ctx, reuse_data=(self._data_version != self._rendered_data_version)
+                )
             self._data_has_changed = False
+            self._rendered_data_version = self._data_version
         for shader_wrapper in self.shader_wrappers:
-            shader_wrapper.update_program_uniforms(camera_uniforms)
-            shader_wrapper.pre_render()
-            shader_wrapper.render()
+            with profiler.span(shader_wrapper.shader_folder, "shader_wrapper", mobject=self):
+                shader_wrapper.update_program_uniforms(camera_uniforms)
+                shader_wrapper.pre_render()
+                shader_wrapper.render()
 
     # Event Handlers
     """
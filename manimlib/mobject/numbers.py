@@ -31,6 +31,25 @@ def char_to_cahced_mob(char: str, **text_config):
         return Text(char, **text_config)
 
 
+class Glyph(object):
+    """
+    Points of each family member of a cached character mobject, relative
+    to the lower left corner of its bounding box, along with its size
+    """
+    def __init__(self, template: VMobject):
+        members = template.family_members_with_points()
+        corner = template.get_bounding_box()[0]
+        self.point_arrays = [member.get_points() - corner for member in members]
+        self.width = template.get_width()
+        self.height = template.get_height()
+        self.font_size = template.font_size
+
+
+@lru_cache()
+def char_to_glyph(char: str, **text_config) -> Glyph:
+    return Glyph(char_to_cahced_mob(char, **text_config))
+
+
 class DecimalNumber(VMobject):
     def __init__(
         self,
@@ -78,6 +97,11 @@ class DecimalNumber(VMobject):
         self.number = number
         self.num_string = self.get_num_string(number)
 
+        chars = [*self.num_string, *([self.unit] if self.unit is not None else [])]
+        if self.can_place_glyphs(chars):
+            self.place_glyphs(chars)
+            return
+
         # Submob_templates will be a list of cached Tex and Text mobjects,
         # with the intent of calling .copy or .become on them
         submob_templates = list(map(self.char_to_mob, self.num_string))
@@ -116,6 +140,56 @@ class DecimalNumber(VMobject):
         if self.include_background_rectangle:
             self.add_background_rectangle()
 
+    def can_place_glyphs(self, chars: list[str]) -> bool:
+        """
+        Whether the current submobjects, one per character, have the same
+        structure as the glyphs of the given characters, so that their
+        points can simply be overwritten by those of the glyphs
+        """
+        if self.show_ellipsis or self.include_background_rectangle:
+            return False
+        if len(chars) != len(self.submobjects):
+            return False
+        return all(
+            len(submob.family_members_with_points()) == len(self.char_to_glyph(char).point_arrays)
+            for submob, char in zip(self.submobjects, chars)
+        )
+
+    def place_glyphs(self, chars: list[str]) -> None:
+        """
+        Fast path for set_submobjects_from_number, writing the points of
+        cached glyphs straight into the existing submobjects, laid out as
+        arrange and the alignment of special characters would lay them out
+        """
+        font_size = self.get_font_size()
+        glyphs = [self.char_to_glyph(char) for char in chars]
+        scale_factors = np.array([font_size / glyph.font_size for glyph in glyphs])
+        widths = scale_factors * [glyph.width for glyph in glyphs]
+        heights = scale_factors * [glyph.height for glyph in glyphs]
+
+        # Arranged to the right, bottoms aligned, and centered as a whole
+        digit_buff = self.digit_buff_per_font_unit * font_size
+        lefts = np.hstack([0, np.cumsum(widths[:-1] + digit_buff)])
+        lefts -= (lefts[-1] + widths[-1]) / 2
+        bottoms = np.full(len(glyphs), -heights.max() / 2)
+
+        # Handle alignment of special characters
+        num_string = self.num_string
+        for i, c in enumerate(num_string):
+            if c == "–" and len(num_string) > i + 1:
+                bottoms[i] = bottoms[i + 1] + heights[i + 1] / 2 - heights[i]
+            elif c == ",":
+                bottoms[i] -= heights[i] / 2
+        if self.unit and self.unit.startswith("^"):
+            bottoms[-1] = (bottoms + heights).max() - heights[-1]
+
+        for submob, glyph, scale_factor, left, bottom in zip(
+            self.submobjects, glyphs, scale_factors, lefts, bottoms
+        ):
+            offset = np.array([left, bottom, 0])
+            for member, points in zip(submob.family_members_with_points(), glyph.point_arrays):
+                member.set_points(scale_factor * points + offset)
+
     def get_num_string(self, number: float | complex) -> str:
         if isinstance(number, complex):
             formatter = self.get_complex_formatter()
@@ -137,6 +211,9 @@ class DecimalNumber(VMobject):
     def char_to_mob(self, char: str) -> Text:
         return char_to_cahced_mob(char, **self.text_config)
 
+    def char_to_glyph(self, char: str) -> Glyph:
+        return char_to_glyph(char, **self.text_config)
+
     def interpolate(
         self,
         mobject1: Mobject,
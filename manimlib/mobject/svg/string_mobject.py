@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 import itertools as it
 import re
 from scipy.optimize import linear_sum_assignment
@@ -18,7 +19,7 @@ from manimlib.utils.color import int_to_hex
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Callable
+    from typing import Callable, ContextManager
     from manimlib.typing import ManimColor, Span, Selector
 
 
@@ -66,6 +67,11 @@ class StringMobject(SVGMobject, ABC):
         self.use_labelled_svg = use_labelled_svg
 
         self.parse()
+        if not self.use_labelled_svg:
+            # Both svgs will be needed, so have them compiled together
+            with self.gather_svg_strings():
+                self.get_svg_string()
+                self.get_svg_string(is_labelled=True)
         svg_string = self.get_svg_string()
         super().__init__(svg_string=svg_string, **kwargs)
         self.set_stroke(stroke_color, stroke_width)
@@ -80,6 +86,26 @@ class StringMobject(SVGMobject, ABC):
     def get_svg_string_by_content(self, content: str) -> str:
         return ""
 
+    @staticmethod
+    def gather_svg_strings() -> ContextManager:
+        """
+        Context within which svg strings which are not yet cached are
+        gathered, rather than compiled, to then all be compiled at once
+        upon exiting.  By default, nothing is gathered.
+        """
+        return nullcontext()
+
+    @classmethod
+    def prefetch(cls, *strings: str, **kwargs) -> None:
+        """
+        Compiles whatever svgs constructing cls(string, **kwargs) would need
+        for each of the given strings, all at once, so that constructing
+        them afterwards reads each from the cache
+        """
+        with cls.gather_svg_strings():
+            for string in strings:
+                cls(string, **kwargs)
+
     def assign_labels_by_color(self, mobjects: list[VMobject]) -> None:
         """
         Assuming each mobject in the list `mobjects` has a fill color
@@ -121,9 +147,8 @@ class StringMobject(SVGMobject, ABC):
         # Otherwise, submobs are not colored, so generate a new list
         # of submobject which are and use those for labels
         unlabelled_submobs = submobs
-        labelled_content = self.get_content(is_labelled=True)
-        labelled_file = self.get_file_path_by_content(labelled_content)
-        labelled_submobs = super().mobjects_from_file(labelled_file)
+        labelled_svg_string = self.get_svg_string(is_labelled=True)
+        labelled_submobs = super().mobjects_from_svg_string(labelled_svg_string)
         self.labelled_submobs = labelled_submobs
         self.unlabelled_submobs = unlabelled_submobs
 
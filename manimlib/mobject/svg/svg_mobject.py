@@ -4,9 +4,12 @@ from xml.etree import ElementTree as ET
 
 import numpy as np
 import svgelements as se
+import importlib
 import io
+import json
 from pathlib import Path
 
+from manimlib import __version__
 from manimlib.constants import RIGHT
 from manimlib.logger import log
 from manimlib.mobject.geometry import Circle
@@ -16,8 +19,11 @@ from manimlib.mobject.geometry import Polyline
 from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.cache import cache_value
+from manimlib.utils.cache import get_cached_value
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
+from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -32,6 +38,35 @@ def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
     return np.array([x, y, 0.0])
 
 
+def _encode_attribute(value):
+    # Into something json can store, for the svg geometry cache
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return dict(array=value.tolist())
+    if isinstance(value, se.Path):
+        return dict(path=value.d())
+    raise TypeError(f"{type(value).__name__} attribute")
+
+
+def _decode_attribute(value):
+    if isinstance(value, dict) and "array" in value:
+        return np.array(value["array"])
+    if isinstance(value, dict) and "path" in value:
+        return se.Path(value["path"])
+    return value
+
+
+def _find_vmobject_class(class_path: str) -> type[VMobject]:
+    module_name, qualname = str(class_path).split(":")
+    result = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        result = getattr(result, name)
+    if not (isinstance(result, type) and issubclass(result, VMobject)):
+        raise TypeError(f"{class_path} is not a VMobject class")
+    return result
+
+
 class SVGMobject(VMobject):
     file_name: str = ""
     height: float | None = 2.0
@@ -107,7 +142,10 @@ class SVGMobject(VMobject):
         if hash_val in SVG_HASH_TO_MOB_MAP:
             submobs = [sm.copy() for sm in SVG_HASH_TO_MOB_MAP[hash_val]]
         else:
-            submobs = self.mobjects_from_svg_string(self.svg_string)
+            submobs = self.load_cached_submobjects()
+            if submobs is None:
+                submobs = self.mobjects_from_svg_string(self.svg_string)
+                self.cache_submobjects(submobs)
             SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in submobs]
 
         self.add(*submobs)
@@ -124,6 +162,72 @@ class SVGMobject(VMobject):
             self.svg_string
         )
 
+    def get_geometry_cache_key(self) -> str:
+        # Unlike hash_obj, this is stable across processes
+        return hash_string(f"svg_geometry{__version__}{VMobject.data_dtype}{self.hash_seed}")
+
+    def cache_submobjects(self, submobs: list[VMobject]) -> None:
+        """
+        Stores the data of the given submobjects on disk as npz, together with
+        the path of their class and the attributes particular to it, such as
+        labels, so that other processes can skip parsing the svg.  Derived
+        state which a plain VMobject also carries, like triangulations, is
+        left out and recomputed as needed.
+        """
+        if any(sm.data.dtype != VMobject.data_dtype or sm.submobjects for sm in submobs):
+            return
+        base_attrs = set(vars(VMobject()))
+        try:
+            attributes = [
+                json.dumps({
+                    key: _encode_attribute(value)
+                    for key, value in vars(sm).items()
+                    if key not in base_attrs
+                })
+                for sm in submobs
+            ]
+        except TypeError as err:
+            log.debug(f"Not caching svg geometry with attributes that can't be stored: {err}")
+            return
+        stream = io.BytesIO()
+        np.savez(
+            stream,
+            data=np.hstack([sm.data for sm in submobs]) if submobs else np.zeros(0, VMobject.data_dtype),
+            lengths=np.array([len(sm.data) for sm in submobs], dtype=int),
+            class_paths=np.array([
+                f"{type(sm).__module__}:{type(sm).__qualname__}"
+                for sm in submobs
+            ], dtype=str),
+            attributes=np.array(attributes, dtype=str),
+        )
+        cache_value(self.get_geometry_cache_key(), stream.getvalue())
+
+    def load_cached_submobjects(self) -> list[VMobject] | None:
+        cached_bytes = get_cached_value(self.get_geometry_cache_key())
+        if cached_bytes is None:
+            return None
+        with np.load(io.BytesIO(cached_bytes)) as arrays:
+            data = arrays["data"]
+            ends = np.cumsum(arrays["lengths"])
+            class_paths = arrays["class_paths"]
+            attributes = arrays["attributes"]
+        try:
+            classes = list(map(_find_vmobject_class, class_paths))
+        except (ImportError, AttributeError, TypeError):
+            # E.g. one of the classes has since been moved or renamed
+            return None
+        submobs = []
+        for start, end, cls, attrs in zip([0, *ends[:-1]], ends, classes, attributes):
+            # Rebuilt from a plain VMobject, as the initializers of these
+            # classes would redo what's being skipped here
+            submob = VMobject()
+            submob.__class__ = cls
+            for key, value in json.loads(str(attrs)).items():
+                setattr(submob, key, _decode_attribute(value))
+            submob.set_data(data[start:end])
+            submobs.append(submob)
+        return submobs
+
     def mobjects_from_svg_string(self, svg_string: str) -> list[VMobject]:
         element_tree = ET.ElementTree(ET.fromstring(svg_string))
         new_tree = self.modify_xml_tree(element_tree)
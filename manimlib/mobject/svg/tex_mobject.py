@@ -8,6 +8,7 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import hex_to_int
+from manimlib.utils.tex_file_writing import gather_latex
 from manimlib.utils.tex_file_writing import latex_to_svg
 from manimlib.utils.tex import num_tex_symbols
 from manimlib.logger import log
@@ -69,6 +70,10 @@ class Tex(StringMobject):
     def get_svg_string_by_content(self, content: str) -> str:
         return latex_to_svg(content, self.template, self.additional_preamble, short_tex=self.tex_string)
 
+    @staticmethod
+    def gather_svg_strings():
+        return gather_latex()
+
     def _handle_scale_side_effects(self, scale_factor: float) -> Self:
         self.font_size *= scale_factor
         return self
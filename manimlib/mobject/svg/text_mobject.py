@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
+import multiprocessing
 import os
 from pathlib import Path
 import re
@@ -18,9 +21,11 @@ from manimlib.constants import NORMAL
 from manimlib.logger import log
 from manimlib.mobject.svg.string_mobject import StringMobject
 from manimlib.utils.cache import cache_on_disk
+from manimlib.utils.cache import is_cached_on_disk
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import int_to_hex
 from manimlib.utils.simple_functions import hash_string
+from manimlib.utils.tex_file_writing import EMPTY_SVG
 
 from typing import TYPE_CHECKING
 
@@ -100,6 +105,82 @@ def markup_to_svg(
     return result
 
 
+# Spawning the pool, whose workers each import manimlib, only pays off
+# for batches at least this large
+MIN_POOL_BATCH_SIZE = 16
+
+_markup_batch: list[tuple[str, dict]] | None = None
+_markup_batch_uses_pool: bool = False
+_markup_pool: ProcessPoolExecutor | None = None
+
+
+def get_markup_pool() -> ProcessPoolExecutor:
+    global _markup_pool
+    if _markup_pool is None:
+        # Spawn, rather than fork, so that no worker inherits an OpenGL context
+        _markup_pool = ProcessPoolExecutor(
+            manim_config.text.n_compile_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        atexit.register(shutdown_markup_pool)
+    return _markup_pool
+
+
+def shutdown_markup_pool() -> None:
+    global _markup_pool
+    if _markup_pool is not None:
+        _markup_pool.shutdown()
+        _markup_pool = None
+
+
+@contextmanager
+def gather_markup(use_pool: bool = False):
+    """
+    Within this context, MarkupText gathers any markup whose svg is not yet
+    cached, using an empty svg in its place.  Upon exiting, everything
+    gathered is rendered, filling in the disk cache.
+
+    With use_pool set, as when prefetching, a large enough batch is
+    rendered concurrently across a pool of processes.  When nested within
+    another such context, it is the outermost one which decides.
+
+    Note, mobjects constructed within this context are meant to be thrown
+    away, e.g.
+
+    with gather_markup():
+        for string in strings:
+            Text(string)
+    """
+    global _markup_batch, _markup_batch_uses_pool
+    outer_batch = _markup_batch
+    if outer_batch is None:
+        _markup_batch_uses_pool = use_pool
+    batch = outer_batch if outer_batch is not None else []
+    _markup_batch = batch
+    try:
+        yield batch
+    finally:
+        _markup_batch = outer_batch
+    if outer_batch is None and len(batch) > 0:
+        render_markup_batch(batch, _markup_batch_uses_pool)
+
+
+def render_markup_batch(batch: list[tuple[str, dict]], use_pool: bool = False) -> None:
+    n_workers = manim_config.text.n_compile_workers
+    if not use_pool or not n_workers or len(batch) < MIN_POOL_BATCH_SIZE:
+        for markup_str, kwargs in batch:
+            markup_to_svg(markup_str, **kwargs)
+        return
+    futures = [
+        get_markup_pool().submit(markup_to_svg, markup_str, **kwargs)
+        for markup_str, kwargs in batch
+    ]
+    for future in futures:
+        # Errors are left to come up when the markup is used
+        if future.exception() is not None:
+            log.debug(f"Rendering markup failed: {future.exception()}")
+
+
 class MarkupText(StringMobject):
     # See https://docs.gtk.org/Pango/pango_markup.html
     MARKUP_TAGS = {
@@ -195,13 +276,27 @@ class MarkupText(StringMobject):
 
     def get_svg_string_by_content(self, content: str) -> str:
         self.content = content
-        return markup_to_svg(
-            content,
+        kwargs = dict(
             justify=self.justify,
             indent=self.indent,
             alignment=self.alignment,
             line_width=self.line_width
         )
+        if _markup_batch is not None and not is_cached_on_disk(markup_to_svg, content, **kwargs):
+            if (content, kwargs) not in _markup_batch:
+                _markup_batch.append((content, kwargs))
+            return EMPTY_SVG
+        return markup_to_svg(content, **kwargs)
+
+    @staticmethod
+    def gather_svg_strings():
+        return gather_markup()
+
+    @classmethod
+    def prefetch(cls, *strings: str, **kwargs) -> None:
+        # Only worth spinning up the pool of renderers when warming up
+        with gather_markup(use_pool=True):
+            super().prefetch(*strings, **kwargs)
 
     # Toolkits
 
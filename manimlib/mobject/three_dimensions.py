@@ -91,6 +91,8 @@ class SurfaceMesh(VGroup):
 # 3D shapes
 
 class Sphere(Surface):
+    vectorized_uv_func: bool = True
+
     def __init__(
         self,
         u_range: Tuple[float, float] = (0, TAU),
@@ -108,14 +110,21 @@ class Sphere(Surface):
         )
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return self.radius * np.array([
-            math.cos(u) * math.sin(v),
-            math.sin(u) * math.sin(v),
-            -math.cos(v)
-        ])
+        return self.radius * np.stack([
+            np.cos(u) * np.sin(v),
+            np.sin(u) * np.sin(v),
+            -np.cos(v)
+        ], axis=-1)
+
+    def uv_derivatives(self, u: float, v: float) -> tuple[np.ndarray, np.ndarray]:
+        du = np.stack([-np.sin(u) * np.sin(v), np.cos(u) * np.sin(v), np.zeros_like(v)], axis=-1)
+        dv = np.stack([np.cos(u) * np.cos(v), np.sin(u) * np.cos(v), np.sin(v)], axis=-1)
+        return self.radius * du, self.radius * dv
 
 
 class Torus(Surface):
+    vectorized_uv_func: bool = True
+
     def __init__(
         self,
         u_range: Tuple[float, float] = (0, TAU),
@@ -133,11 +142,20 @@ class Torus(Surface):
         )
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        P = np.array([math.cos(u), math.sin(u), 0])
-        return (self.r1 - self.r2 * math.cos(v)) * P - self.r2 * math.sin(v) * OUT
+        r = self.r1 - self.r2 * np.cos(v)
+        return np.stack([r * np.cos(u), r * np.sin(u), -self.r2 * np.sin(v)], axis=-1)
+
+    def uv_derivatives(self, u: float, v: float) -> tuple[np.ndarray, np.ndarray]:
+        r = self.r1 - self.r2 * np.cos(v)
+        dr = self.r2 * np.sin(v)
+        du = np.stack([-r * np.sin(u), r * np.cos(u), np.zeros_like(u)], axis=-1)
+        dv = np.stack([dr * np.cos(u), dr * np.sin(u), -self.r2 * np.cos(v)], axis=-1)
+        return du, dv
 
 
 class Cylinder(Surface):
+    vectorized_uv_func: bool = True
+
     def __init__(
         self,
         u_range: Tuple[float, float] = (0, TAU),
@@ -165,10 +183,17 @@ class Cylinder(Surface):
         self.apply_matrix(z_to_vector(self.axis))
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([np.cos(u), np.sin(u), v])
+        return np.stack([np.cos(u), np.sin(u), v], axis=-1)
+
+    def uv_derivatives(self, u: float, v: float) -> tuple[np.ndarray, np.ndarray]:
+        du = np.stack([-np.sin(u), np.cos(u), np.zeros_like(u)], axis=-1)
+        dv = np.stack([np.zeros_like(v), np.zeros_like(v), np.ones_like(v)], axis=-1)
+        return du, dv
 
 
 class Cone(Cylinder):
+    vectorized_uv_func: bool = True
+
     def __init__(
         self,
         u_range: Tuple[float, float] = (0, TAU),
@@ -179,7 +204,12 @@ class Cone(Cylinder):
         super().__init__(u_range=u_range, v_range=v_range, *args, **kwargs)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([(1 - v) * np.cos(u), (1 - v) * np.sin(u), v])
+        return np.stack([(1 - v) * np.cos(u), (1 - v) * np.sin(u), v], axis=-1)
+
+    def uv_derivatives(self, u: float, v: float) -> tuple[np.ndarray, np.ndarray]:
+        du = np.stack([-(1 - v) * np.sin(u), (1 - v) * np.cos(u), np.zeros_like(u)], axis=-1)
+        dv = np.stack([-np.cos(u), -np.sin(u), np.ones_like(v)], axis=-1)
+        return du, dv
 
 
 class Line3D(Cylinder):
@@ -203,6 +233,8 @@ class Line3D(Cylinder):
 
 
 class Disk3D(Surface):
+    vectorized_uv_func: bool = True
+
     def __init__(
         self,
         radius: float = 1,
@@ -220,14 +252,21 @@ class Disk3D(Surface):
         self.scale(radius)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([
-            u * math.cos(v),
-            u * math.sin(v),
-            0
-        ])
+        return np.stack([
+            u * np.cos(v),
+            u * np.sin(v),
+            np.zeros_like(u)
+        ], axis=-1)
+
+    def uv_derivatives(self, u: float, v: float) -> tuple[np.ndarray, np.ndarray]:
+        du = np.stack([np.cos(v), np.sin(v), np.zeros_like(u)], axis=-1)
+        dv = np.stack([-u * np.sin(v), u * np.cos(v), np.zeros_like(u)], axis=-1)
+        return du, dv
 
 
 class Square3D(Surface):
+    vectorized_uv_func: bool = True
+
     def __init__(
         self,
         side_length: float = 2.0,
@@ -245,7 +284,12 @@ class Square3D(Surface):
         self.scale(side_length / 2)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([u, v, 0])
+        return np.stack([u, v, np.zeros_like(u)], axis=-1)
+
+    def uv_derivatives(self, u: float, v: float) -> tuple[np.ndarray, np.ndarray]:
+        du = np.stack([np.ones_like(u), np.zeros_like(u), np.zeros_like(u)], axis=-1)
+        dv = np.stack([np.zeros_like(v), np.ones_like(v), np.zeros_like(v)], axis=-1)
+        return du, dv
 
 
 def square_to_cube_faces(square: T) -> list[T]:
@@ -35,6 +35,12 @@ class Surface(Mobject):
         ('rgba', np.float32, (4,)),
     ])
     pointlike_data_keys = ['point', 'du_point', 'dv_point']
+    # If True, uv_func and uv_derivatives are called once, with arrays of u
+    # and v values spanning the whole grid, and should return arrays whose
+    # last axis holds the coordinates. Otherwise they're called per vertex.
+    # This only holds for the uv_func of the class setting it, see
+    # is_defined_along_with_uv_func
+    vectorized_uv_func: bool = False
 
     def __init__(
         self,
@@ -71,29 +77,74 @@ class Surface(Mobject):
         # To be implemented in subclasses
         return (u, v, 0.0)
 
+    def uv_derivatives(self, u: float, v: float) -> tuple[Vect3, Vect3] | None:
+        """
+        Partial derivatives of uv_func with respect to u and v, which
+        subclasses knowing them analytically can implement to spare the
+        evaluation of uv_func at points nudged along u and along v
+        """
+        return None
+
+    def is_defined_along_with_uv_func(self, attr: str) -> bool:
+        """
+        Whether attr is defined by the class defining uv_func, or by one
+        of its subclasses.  A subclass overriding only uv_func shouldn't
+        inherit derivatives, or a promise of vectorization, which were
+        written for the uv_func it replaces
+        """
+        mro = type(self).__mro__
+
+        def get_defining_index(name: str) -> int:
+            return next(i for i, cls in enumerate(mro) if name in cls.__dict__)
+
+        return get_defining_index(attr) <= get_defining_index("uv_func")
+
+    def uv_func_is_vectorized(self) -> bool:
+        if "vectorized_uv_func" in self.__dict__:
+            # Set for this instance in particular, as by ParametricSurface
+            return self.vectorized_uv_func
+        return self.vectorized_uv_func and self.is_defined_along_with_uv_func("vectorized_uv_func")
+
+    def evaluate_on_grid(
+        self,
+        func: Callable,
+        u_grid: np.ndarray,
+        v_grid: np.ndarray
+    ) -> np.ndarray | list | None:
+        if self.uv_func_is_vectorized():
+            return func(u_grid, v_grid)
+        results = [func(u, v) for u, v in zip(u_grid.flat, v_grid.flat)]
+        if any(result is None for result in results):
+            return None
+        return results
+
     @Mobject.affects_data
     def init_points(self):
-        dim = self.dim
-        nu, nv = self.resolution
-        u_range = np.linspace(*self.u_range, nu)
-        v_range = np.linspace(*self.v_range, nv)
-
-        # Get three lists:
-        # - Points generated by pure uv values
-        # - Those generated by values nudged by du
-        # - Those generated by values nudged by dv
-        uv_grid = np.array([[[u, v] for v in v_range] for u in u_range])
-        uv_plus_du = uv_grid.copy()
-        uv_plus_du[:, :, 0] += self.epsilon
-        uv_plus_dv = uv_grid.copy()
-        uv_plus_dv[:, :, 1] += self.epsilon
-
-        points, du_points, dv_points = [
-            np.apply_along_axis(
-                lambda p: self.uv_func(*p), 2, grid
-            ).reshape((nu * nv, dim))
-            for grid in (uv_grid, uv_plus_du, uv_plus_dv)
-        ]
+        shape = (np.prod(self.resolution, dtype=int), self.dim)
+        u_grid, v_grid = np.meshgrid(
+            np.linspace(*self.u_range, self.resolution[0]),
+            np.linspace(*self.v_range, self.resolution[1]),
+            indexing='ij',
+        )
+        points = np.reshape(self.evaluate_on_grid(self.uv_func, u_grid, v_grid), shape)
+
+        # The du and dv points sit epsilon along the partial derivatives,
+        # which if not given are found by evaluating uv_func on nudged values
+        derivatives = None
+        if self.is_defined_along_with_uv_func("uv_derivatives"):
+            derivatives = self.evaluate_on_grid(self.uv_derivatives, u_grid, v_grid)
+        if derivatives is not None and len(points) > 0:
+            if not self.uv_func_is_vectorized():
+                derivatives = list(zip(*derivatives))
+            du_points, dv_points = (
+                points + self.epsilon * np.reshape(derivative, shape)
+                for derivative in derivatives
+            )
+        else:
+            du_points, dv_points = (
+                np.reshape(self.evaluate_on_grid(self.uv_func, *grid), shape)
+                for grid in [(u_grid + self.epsilon, v_grid), (u_grid, v_grid + self.epsilon)]
+            )
         self.set_points(points)
         self.data['du_point'][:] = du_points
         self.data['dv_point'][:] = dv_points
@@ -250,14 +301,26 @@ class ParametricSurface(Surface):
         uv_func: Callable[[float, float], Iterable[float]],
         u_range: tuple[float, float] = (0, 1),
         v_range: tuple[float, float] = (0, 1),
+        # See Surface.vectorized_uv_func
+        vectorized: bool = False,
+        # Optional function of u and v returning the partial
+        # derivatives of uv_func with respect to u and v
+        uv_derivatives: Callable[[float, float], tuple[Vect3, Vect3]] | None = None,
         **kwargs
     ):
         self.passed_uv_func = uv_func
+        self.passed_uv_derivatives = uv_derivatives
+        self.vectorized_uv_func = vectorized
         super().__init__(u_range=u_range, v_range=v_range, **kwargs)
 
     def uv_func(self, u, v):
         return self.passed_uv_func(u, v)
 
+    def uv_derivatives(self, u, v):
+        if self.passed_uv_derivatives is None:
+            return None
+        return self.passed_uv_derivatives(u, v)
+
 
 class SGroup(Surface):
     def __init__(
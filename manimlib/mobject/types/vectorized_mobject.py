@@ -97,6 +97,10 @@ class VMobject(Mobject):
         # Measured in pixel widths
         anti_alias_width: float = 1.5,
         fill_border_width: float = 0.0,
+        # Draw fill from a cached triangulation, rather than through the
+        # winding fill canvas. Only suitable for shapes which don't overlap
+        # themselves, and which mostly move rigidly.
+        triangulated_fill: bool = False,
         **kwargs
     ):
         self.fill_color = fill_color or color or DEFAULT_FILL_COLOR
@@ -113,11 +117,19 @@ class VMobject(Mobject):
         self.use_simple_quadratic_approx = use_simple_quadratic_approx
         self.anti_alias_width = anti_alias_width
         self.fill_border_width = fill_border_width
+        self.triangulated_fill = triangulated_fill
 
         self.needs_new_joint_angles = True
         self.needs_new_unit_normal = True
+        self.needs_new_triangulation = True
         self.subpath_end_indices = None
+        # Pairs of a data version and what was computed from the points then
+        self.curve_lengths_cache: tuple[int, np.ndarray] | None = None
+        self.arc_length_cache: tuple[int, float] | None = None
         self.outer_vert_indices = np.zeros(0, dtype=int)
+        self.triangulation = np.zeros(0, dtype=int)
+        self.triangulation_concavity = np.zeros(0, dtype=bool)
+        self.triangulation_end_indices = np.zeros(0, dtype=int)
 
         super().__init__(**kwargs)
 
@@ -167,6 +179,7 @@ class VMobject(Mobject):
         if border_width is not None:
             self.border_width = border_width
             for mob in self.get_family(recurse):
+                mob.unshare_data()
                 data = mob.data if mob.has_points() > 0 else mob._data_defaults
                 data["fill_border_width"] = border_width
         return self
@@ -184,6 +197,7 @@ class VMobject(Mobject):
 
         if width is not None:
             for mob in self.get_family(recurse):
+                mob.unshare_data()
                 data = mob.data if mob.get_num_points() > 0 else mob._data_defaults
                 if isinstance(width, (float, int)):
                     data['stroke_width'][:, 0] = width
@@ -409,6 +423,13 @@ class VMobject(Mobject):
     def get_scale_stroke_with_zoom(self) -> bool:
         return self.uniforms["flat_stroke"] == 1.0
 
+    def set_triangulated_fill(self, triangulated_fill: bool = True, recurse: bool = True) -> Self:
+        for mob in self.get_family(recurse):
+            if mob.triangulated_fill != triangulated_fill:
+                mob.triangulated_fill = triangulated_fill
+                mob.refresh_shader_wrapper_id()
+        return self
+
     def set_joint_type(self, joint_type: str, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.uniforms["joint_type"] = self.joint_type_map[joint_type]
@@ -449,6 +470,7 @@ class VMobject(Mobject):
             self.clear_points()
             return self
         assert len(anchors) == len(handles) + 1
+        self.unshare_data()
         points = resize_array(self.get_points(), 2 * len(anchors) - 1)
         points[0::2] = anchors
         points[1::2] = handles
@@ -637,8 +659,16 @@ class VMobject(Mobject):
         return self
 
     def add_points_as_corners(self, points: Iterable[Vect3]) -> Self:
-        for point in points:
-            self.add_line_to(point)
+        # Equivalent to calling add_line_to for each point, but
+        # with all the new lines appended at once
+        points = np.array(list(points), dtype=float).reshape(-1, self.dim)
+        if len(points) == 0:
+            return self
+        self.throw_error_if_no_points()
+        starts = np.vstack([self.get_last_point(), points[:-1]])
+        alphas = np.linspace(0, 1, 5 if self.long_lines else 3)[1:]
+        new_points = starts[:, np.newaxis] + alphas[:, np.newaxis] * (points - starts)[:, np.newaxis]
+        self.append_points(new_points.reshape(-1, self.dim))
         return self
 
     def set_points_as_corners(self, points: Iterable[Vect3]) -> Self:
@@ -783,6 +813,24 @@ class VMobject(Mobject):
         curve_func = self.get_nth_curve_function(n)
         return curve_func(residue)
 
+    def get_cumulative_curve_lengths(self) -> np.ndarray:
+        """
+        Running totals of the lengths of all curves, starting at 0, with
+        each length approximated by the straight line from start to end,
+        and null curves counting as zero.  These are cached until the
+        data of this mobject next changes.
+        """
+        if self.curve_lengths_cache is None or self.curve_lengths_cache[0] != self._data_version:
+            anchors1, handles, anchors2 = self.get_anchors_and_handles()
+            lengths = np.linalg.norm(anchors2 - anchors1, axis=1)
+            # Don't consider null curves
+            is_null = (np.abs(handles - anchors1) < self.tolerance_for_point_equality).all(1)
+            lengths[is_null] = 0
+            partials = np.zeros(len(lengths) + 1)
+            np.cumsum(lengths, out=partials[1:])
+            self.curve_lengths_cache = (self._data_version, partials)
+        return self.curve_lengths_cache[1]
+
     def curve_and_prop_of_partial_point(self, alpha) -> Tuple[int, float]:
         """
         If you want a point a proportion alpha along the curve, this
@@ -791,23 +839,12 @@ class VMobject(Mobject):
         """
         if alpha == 0:
             return (0, 0.0)
-        partials: list[float] = [0]
-        for tup in self.get_bezier_tuples():
-            if self.consider_points_equal(tup[0], tup[1]):
-                # Don't consider null curves
-                arclen = 0
-            else:
-                # Approximate length with straight line from start to end
-                arclen = get_norm(tup[2] - tup[0])
-            partials.append(partials[-1] + arclen)
+        partials = self.get_cumulative_curve_lengths()
         full = partials[-1]
         if full == 0:
             return len(partials), 1.0
         # First index where the partial length is more than alpha times the full length
-        index = next(
-            (i for i, x in enumerate(partials) if x >= full * alpha),
-            len(partials) - 1  # Default
-        )
+        index = min(int(np.searchsorted(partials, full * alpha)), len(partials) - 1)
         residue = float(inverse_interpolate(
             partials[index - 1] / full, partials[index] / full, alpha
         ))
@@ -823,6 +860,37 @@ class VMobject(Mobject):
         index, residue = self.curve_and_prop_of_partial_point(alpha)
         return self.get_nth_curve_function(index)(residue)
 
+    def points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Equivalent to calling point_from_proportion for each alpha,
+        but locating and evaluating all curves at once
+        """
+        alphas = np.array(alphas, dtype=float).reshape(-1)
+        if self.get_num_points() == 0:
+            return np.repeat([self.get_center()], len(alphas), axis=0)
+        partials = self.get_cumulative_curve_lengths()
+        full = partials[-1]
+        result = np.repeat([self.get_start()], len(alphas), axis=0)
+        result[alphas >= 1] = self.get_end()
+        inner = (alphas > 0) & (alphas < 1)
+        if full == 0 or not inner.any():
+            return result
+
+        inner_alphas = alphas[inner]
+        indices = np.searchsorted(partials, full * inner_alphas).clip(1, len(partials) - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            residues = inverse_interpolate(
+                partials[indices - 1] / full, partials[indices] / full, inner_alphas
+            )[:, np.newaxis]
+        points = self.get_points()
+        anchors1 = points[2 * indices - 2]
+        handles = points[2 * indices - 1]
+        anchors2 = points[2 * indices]
+        result[inner] = (1 - residues)**2 * anchors1 + \
+            2 * (1 - residues) * residues * handles + \
+            residues**2 * anchors2
+        return result
+
     def get_anchors_and_handles(self) -> list[Vect3]:
         """
         returns anchors1, handles, anchors2,
@@ -856,10 +924,12 @@ class VMobject(Mobject):
                 for a in np.linspace(0, 1, n_sample_points)
             ])
             return poly_line_length(points)
-        points = self.get_points()
-        inner_len = poly_line_length(points[::2])
-        outer_len = poly_line_length(points)
-        return interpolate(inner_len, outer_len, 1 / 3)
+        if self.arc_length_cache is None or self.arc_length_cache[0] != self._data_version:
+            points = self.get_points()
+            inner_len = poly_line_length(points[::2])
+            outer_len = poly_line_length(points)
+            self.arc_length_cache = (self._data_version, interpolate(inner_len, outer_len, 1 / 3))
+        return self.arc_length_cache[1]
 
     def get_area_vector(self) -> Vect3:
         # Returns a vector whose length is the area bound by
@@ -895,6 +965,7 @@ class VMobject(Mobject):
         else:
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
+        self.unshare_data(detach_copies=False)
         self.data["base_normal"][1::2] = normal
         self.needs_new_unit_normal = False
         return normal
@@ -1011,6 +1082,7 @@ class VMobject(Mobject):
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
         vm_points = vmobject.get_points()
+        self.unshare_data()
         self.data["joint_angle"] = vmobject.data["joint_angle"]
         if a <= 0 and b >= 1:
             self.set_points(vm_points, refresh=False)
@@ -1068,14 +1140,36 @@ class VMobject(Mobject):
 
     # Data for shaders that may need refreshing
 
-    def get_triangulation(self) -> np.ndarray:
+    def refresh_triangulation(self) -> Self:
+        for mob in self.get_family():
+            mob.needs_new_triangulation = True
+        return self
+
+    def get_triangulation(self, refresh: bool = False) -> np.ndarray:
         # Figure out how to triangulate the interior to know
         # how to send the points as to the vertex shader.
         # First triangles come directly from the points
+        if self.get_num_points() <= 1:
+            return np.zeros(0, dtype='i4')
+        ovi = self.get_outer_vert_indices()
+        return np.hstack([ovi, self.get_inner_triangulation(refresh)])
+
+    def get_inner_triangulation(self, refresh: bool = False) -> np.ndarray:
+        """
+        Returns indices of points, in groups of three, triangulating the
+        polygon through all anchors and through the handles of concave
+        curves, with each triangle positively oriented relative to the
+        unit normal.
+
+        This is cached, and only recomputed when the points are reset, or
+        when the subpath ends or the concavity of some curve no longer
+        match the cached value, so shifts, rotations and rescalings
+        reuse the same triangulation.
+        """
         points = self.get_points()
 
         if len(points) <= 1:
-            return np.zeros(0, dtype='i4')
+            return np.zeros(0, dtype=int)
 
         normal_vector = self.get_unit_normal()
 
@@ -1085,9 +1179,22 @@ class VMobject(Mobject):
 
         v01s = points[1::2] - points[0:-1:2]
         v12s = points[2::2] - points[1::2]
-        curve_orientations = np.sign(cross2d(v01s, v12s))
+        crosses = cross2d(v01s, v12s)
+        # Nearly straight curves count as convex, so that rounding
+        # errors don't change which curves are concave
+        tolerance = 1e-6 * np.sqrt(
+            (v01s * v01s).sum(1) * (v12s * v12s).sum(1)
+        )
+        concave_parts = crosses < -tolerance
+        end_indices = self.get_subpath_end_indices()
 
-        concave_parts = curve_orientations < 0
+        if not (
+            refresh
+            or self.needs_new_triangulation
+            or not np.array_equal(concave_parts, self.triangulation_concavity)
+            or not np.array_equal(end_indices, self.triangulation_end_indices)
+        ):
+            return self.triangulation
 
         # These are the vertices to which we'll apply a polygon triangulation
         indices = np.arange(len(points), dtype=int)
@@ -1098,7 +1205,6 @@ class VMobject(Mobject):
         inner_vert_indices.sort()
         # Even indices correspond to anchors, and `end_indices // 2`
         # shows which anchors are considered end points
-        end_indices = self.get_subpath_end_indices()
         counts = np.arange(1, len(inner_vert_indices) + 1)
         rings = counts[inner_vert_indices % 2 == 0][end_indices // 2]
 
@@ -1111,11 +1217,21 @@ class VMobject(Mobject):
         iti = inner_tri_indices
         null1 = (iti[0::3] + 1 == iti[1::3]) & (iti[0::3] + 2 == iti[2::3])
         null2 = (iti[0::3] - 1 == iti[1::3]) & (iti[0::3] - 2 == iti[2::3])
-        inner_tri_indices = iti[~(null1 | null2).repeat(3)]
-
-        ovi = self.get_outer_vert_indices()
-        tri_indices = np.hstack([ovi, inner_tri_indices])
-        return tri_indices
+        tris = iti[~(null1 | null2).repeat(3)].reshape(-1, 3)
+
+        # Orient all triangles positively
+        tri_points = points[tris]
+        negative = cross2d(
+            tri_points[:, 1] - tri_points[:, 0],
+            tri_points[:, 2] - tri_points[:, 0],
+        ) < 0
+        tris[negative, 1:] = tris[negative, :0:-1]
+
+        self.triangulation = tris.flatten()
+        self.triangulation_concavity = concave_parts
+        self.triangulation_end_indices = end_indices
+        self.needs_new_triangulation = False
+        return self.triangulation
 
     def refresh_joint_angles(self) -> Self:
         for mob in self.get_family():
@@ -1134,7 +1250,7 @@ class VMobject(Mobject):
             return self.data["joint_angle"][:, 0]
 
         self.needs_new_joint_angles = False
-        self._data_has_changed = True
+        self.note_changed_data(recurse_up=False)
 
         # Rotate points such that positive z direction is the normal
         points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
@@ -1176,6 +1292,7 @@ class VMobject(Mobject):
         angle_diffs = angles_out - angles_in
         angle_diffs[angle_diffs < -PI] += TAU
         angle_diffs[angle_diffs > PI] -= TAU
+        self.unshare_data(detach_copies=False)
         self.data["joint_angle"][:, 0] = angle_diffs
         return self.data["joint_angle"][:, 0]
 
@@ -1199,11 +1316,13 @@ class VMobject(Mobject):
     @triggers_refresh
     def set_points(self, points: Vect3Array) -> Self:
         assert len(points) == 0 or len(points) % 2 == 1
+        self.needs_new_triangulation = True
         return super().set_points(points)
 
     @triggers_refresh
     def append_points(self, points: Vect3Array) -> Self:
         assert len(points) % 2 == 0
+        self.needs_new_triangulation = True
         return super().append_points(points)
 
     def reverse_points(self, recurse: bool = True) -> Self:
@@ -1213,13 +1332,16 @@ class VMobject(Mobject):
             if not mob.has_points():
                 continue
             inner_ends = mob.get_subpath_end_indices()[:-1]
+            mob.unshare_data()
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
+            mob.needs_new_triangulation = True
             self.subpath_end_indices = None
         return super().reverse_points()
 
     @triggers_refresh
     def set_data(self, data: np.ndarray) -> Self:
+        self.needs_new_triangulation = True
         return super().set_data(data)
 
     # TODO, how to be smart about tangents here?
@@ -1231,6 +1353,7 @@ class VMobject(Mobject):
         **kwargs
     ) -> Self:
         super().apply_function(function, **kwargs)
+        self.refresh_triangulation()
         if self.make_smooth_after_applying_functions or make_smooth:
             self.make_smooth(approx=True)
         return self
@@ -1275,6 +1398,7 @@ class VMobject(Mobject):
             mobject_uniforms=self.uniforms,
             code_replacements=self.shader_code_replacements,
             stroke_behind=self.stroke_behind,
+            triangulated_fill=self.triangulated_fill,
             depth_test=self.depth_test
         )
 
@@ -1282,18 +1406,29 @@ class VMobject(Mobject):
         for submob in self.get_family():
             if submob.shader_wrapper is not None:
                 submob.shader_wrapper.stroke_behind = submob.stroke_behind
+                submob.shader_wrapper.triangulated_fill = submob.triangulated_fill
         super().refresh_shader_wrapper_id()
         return self
 
     def get_shader_data(self) -> np.ndarray:
         # Do we want this elsewhere? Say whenever points are refreshed or something?
         self.get_joint_angles()
+        self.unshare_data(detach_copies=False)
         self.data["base_normal"][0::2] = self.data["point"][0]
         return super().get_shader_data()
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return self.get_outer_vert_indices()
 
+    def get_shader_index_data(self) -> Optional[np.ndarray]:
+        if not self.triangulated_fill or not self.has_fill():
+            return None
+        # Shader data is laid out as (a0, h0, a1, a1, h1, a2, a2, ...),
+        # so convert point indices into positions in that array
+        inner_tri_indices = self.get_inner_triangulation()
+        positions = 3 * (inner_tri_indices // 2) + (inner_tri_indices % 2)
+        return np.minimum(positions, 3 * self.get_num_curves() - 1)
+
 
 class VGroup(Group, VMobject, Generic[SubVmobjectType]):
     def __init__(self, *vmobjects: SubVmobjectType | Iterable[SubVmobjectType], **kwargs):
@@ -74,6 +74,53 @@ def ode_solution_points(function, state0, time, dt=0.01):
     return solution.y.T
 
 
+def batched_ode_solution_points(
+    function: Callable[[VectArray], VectArray],
+    states0: VectArray,
+    n_steps: int,
+    dt: float,
+    cutoff_norm: float = np.inf,
+    arc_len: float = np.inf,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Advances all initial states together by fixed steps of the classic
+    Runge-Kutta method, with function taking in and returning arrays of
+    states.  A state stops advancing once its norm exceeds cutoff_norm,
+    once the path it traces exceeds arc_len, or once it stops being finite.
+
+    Returns an array of shape (n_steps + 1, *states0.shape) of the states
+    along each path, together with how many states each path holds.
+    """
+    states0 = np.array(states0, dtype=float)
+    paths = np.repeat(states0[np.newaxis], n_steps + 1, axis=0)
+    path_lengths = np.ones(len(states0), dtype=int)
+    arc_lens = np.zeros(len(states0))
+    active = np.flatnonzero(np.linalg.norm(states0, axis=1) <= cutoff_norm)
+    for step in range(1, n_steps + 1):
+        if len(active) == 0:
+            break
+        states = paths[step - 1, active]
+        k1 = function(states)
+        k2 = function(states + 0.5 * dt * k1)
+        k3 = function(states + 0.5 * dt * k2)
+        k4 = function(states + dt * k3)
+        new_states = states + (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        finite = np.isfinite(new_states).all(1)
+        active = active[finite]
+        states = states[finite]
+        new_states = new_states[finite]
+
+        paths[step, active] = new_states
+        path_lengths[active] += 1
+        arc_lens[active] += np.linalg.norm(new_states - states, axis=1)
+        active = active[
+            (np.linalg.norm(new_states, axis=1) <= cutoff_norm) &
+            (arc_lens[active] <= arc_len)
+        ]
+    return paths, path_lengths
+
+
 def move_along_vector_field(
     mobject: Mobject,
     func: Callable[[Vect3], Vect3]
@@ -244,6 +291,7 @@ class VectorField(VMobject):
 
     def set_stroke_width(self, width: float):
         if self.get_num_points() > 0:
+            self.unshare_data()
             self.get_stroke_widths()[:] = width * self.base_stroke_width_array
             self.stroke_width = width
         return self
@@ -277,6 +325,7 @@ class VectorField(VMobject):
         dist_to_head_base = np.clip(drawn_norms - tip_len, 0, np.inf)  # Mixing units!
 
         # Set all points
+        self.unshare_data()
         points = self.get_points()
         points[0::8] = self.sample_points
         points[2::8] = self.sample_points + dist_to_head_base * unit_outputs
@@ -385,18 +434,24 @@ class StreamLines(VGroup):
         return self.coordinate_system.c2p(*out_coords.T) - origin
 
     def draw_lines(self) -> None:
-        lines = []
-        origin = self.coordinate_system.get_origin()
+        # All seeds are integrated together, in the coordinate system
+        sample_coords = self.get_sample_coords()
+        n_steps = min(len(np.arange(0, self.solution_time, self.dt)) - 1, self.max_time_steps)
+        paths, path_lengths = batched_ode_solution_points(
+            self.func, sample_coords, n_steps, self.dt,
+            cutoff_norm=self.cutoff_norm,
+            arc_len=self.arc_len,
+        )
+        path_points = self.coordinate_system.c2p(*paths.reshape(-1, paths.shape[2]).T)
+        path_points = path_points.reshape((*paths.shape[:2], 3))
 
-        # Todo, it feels like coordinate system should just have
-        # the ODE solver built into it, no?
         lines = []
-        for coords in self.get_sample_coords():
-            solution_coords = ode_solution_points(self.func, coords, self.solution_time, self.dt)
+        for index, length in enumerate(path_lengths):
+            if length < 2:
+                continue
             line = VMobject()
-            line.set_points_smoothly(self.coordinate_system.c2p(*solution_coords.T))
-            # TODO, account for arc length somehow?
-            line.virtual_time = self.solution_time
+            line.set_points_smoothly(path_points[:length, index])
+            line.virtual_time = (length - 1) * self.dt
             lines.append(line)
         self.set_submobjects(lines)
 
@@ -419,17 +474,18 @@ class StreamLines(VGroup):
             values_to_rgbs = get_vectorized_rgb_gradient_function(
                 *self.magnitude_range, self.color_map,
             )
-            cs = self.coordinate_system
-            for line in self.submobjects:
-                norms = [
-                    get_norm(self.func(*cs.p2c(point)))
-                    for point in line.get_points()
-                ]
-                rgbs = values_to_rgbs(norms)
-                rgbas = np.zeros((len(rgbs), 4))
-                rgbas[:, :3] = rgbs
+            # Magnitudes at the points of all lines are found at once
+            lines = self.submobjects
+            if len(lines) > 0:
+                points = np.vstack([line.get_points() for line in lines])
+                coords = np.array(self.coordinate_system.p2c(points)).T
+                norms = np.linalg.norm(self.func(coords), axis=1)
+                rgbas = np.zeros((len(points), 4))
+                rgbas[:, :3] = values_to_rgbs(norms)
                 rgbas[:, 3] = self.stroke_opacity
-                line.set_rgba_array(rgbas, "stroke_rgba")
+                ends = np.cumsum([line.get_num_points() for line in lines])
+                for line, line_rgbas in zip(lines, np.split(rgbas, ends[:-1])):
+                    line.set_rgba_array(line_rgbas, "stroke_rgba")
         else:
             self.set_stroke(self.stroke_color, opacity=self.stroke_opacity)
 
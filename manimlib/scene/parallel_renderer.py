@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import platform
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+import numpy as np
+from tqdm.auto import tqdm as ProgressDisplay
+
+from manimlib.logger import log
+from manimlib.module_loader import ModuleLoader
+from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.utils.cache import get_cached_value
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pydub import AudioSegment
+
+    from manimlib.scene.scene import Scene
+
+
+def render_scene_segment(
+    file_name: str,
+    scene_name: str,
+    scene_config: dict,
+    start: int,
+    end: int,
+) -> tuple[list[Path], AudioSegment | None]:
+    """
+    Meant to be run in a worker process. The scene class is loaded anew from
+    its file, and the scene is run skipping everything but the animations
+    numbered from start up to (but not including) end, each of which gets
+    written to its own partial movie file.
+
+    Returns the paths of those partial movie files, together with the audio
+    of any sounds added along the way, placed at their time in the scene.
+    """
+    module = ModuleLoader.get_module(file_name)
+    scene_class = getattr(module, scene_name)
+    config = copy.deepcopy(scene_config)
+    config["start_at_animation_number"] = start
+    config["end_at_animation_number"] = end
+    scene = scene_class(**config)
+    scene.run()
+    file_writer = scene.file_writer
+    audio_segment = file_writer.audio_segment if file_writer.includes_sound else None
+    return file_writer.partial_movie_file_paths, audio_segment
+
+
+class ParallelSceneRenderer(object):
+    """
+    Renders a scene by splitting its play and wait calls into contiguous
+    segments, each rendered in a separate process with its own standalone
+    context, and then concatenating the resulting partial movie files, and
+    adding whatever sounds the workers came across.
+
+    Each worker runs construct in full, so everything before its segment
+    is run in skip mode, the same as when passing -n on the command line.
+    """
+    def __init__(
+        self,
+        scene_class: type[Scene],
+        scene_config: dict,
+        file_name: str,
+        n_processes: int,
+    ):
+        self.scene_class = scene_class
+        self.scene_config = scene_config
+        self.file_name = file_name
+        self.n_processes = n_processes
+
+        fw_config = copy.deepcopy(scene_config["file_writer_config"])
+        fw_config.update(
+            write_to_movie=True,
+            subdivide_output=True,
+            file_name=self.get_output_file_name(),
+        )
+        # Only used to combine what the workers write, so it needs no scene
+        self.file_writer = SceneFileWriter(None, **fw_config)
+
+    def __str__(self) -> str:
+        return self.scene_class.__name__
+
+    def get_output_file_name(self) -> str:
+        """
+        Same name the file writer of the scene itself would choose
+        """
+        file_name = self.scene_config["file_writer_config"].get("file_name")
+        if file_name:
+            return file_name
+        name = str(self)
+        saan = self.scene_config.get("start_at_animation_number")
+        eaan = self.scene_config.get("end_at_animation_number")
+        if saan is not None:
+            name += f"_{saan}"
+        if eaan is not None:
+            name += f"_{eaan}"
+        return name
+
+    def count_animations(self) -> int:
+        # Known without running the scene if its last full run was cached
+        timeline_key = self.scene_config["file_writer_config"].get("timeline_key")
+        timeline = get_cached_value(timeline_key) if timeline_key else None
+        if timeline is not None:
+            return len(timeline)
+
+        pre_config = copy.deepcopy(self.scene_config)
+        pre_config["file_writer_config"].update(
+            write_to_movie=False,
+            save_last_frame=False,
+            quiet=True,
+        )
+        pre_config["skip_animations"] = True
+        pre_scene = self.scene_class(**pre_config)
+        pre_scene.run()
+        return pre_scene.num_plays
+
+    def get_segments(self) -> list[tuple[int, int]]:
+        start = self.scene_config.get("start_at_animation_number") or 0
+        end = self.count_animations()
+        eaan = self.scene_config.get("end_at_animation_number")
+        if eaan is not None:
+            end = min(end, eaan)
+        chunks = np.array_split(np.arange(start, end), self.n_processes)
+        return [
+            (int(chunk[0]), int(chunk[-1]) + 1)
+            for chunk in chunks
+            if len(chunk) > 0
+        ]
+
+    def get_worker_config(self) -> dict:
+        config = copy.deepcopy(self.scene_config)
+        config.pop("window", None)
+        config["show_animation_progress"] = False
+        config["file_writer_config"].update(
+            write_to_movie=True,
+            subdivide_output=True,
+            save_last_frame=False,
+            # Ensure all workers write into the same partial movie directory
+            file_name=self.file_writer.get_output_file_name(),
+            quiet=True,
+            open_file_upon_completion=False,
+            show_file_location_upon_completion=False,
+        )
+        return config
+
+    def run(self) -> None:
+        segments = self.get_segments()
+        if len(segments) == 0:
+            log.warning(f"{self} has no animations to render")
+            return
+        worker_config = self.get_worker_config()
+
+        # Spawn, rather than fork, so that no process inherits the OpenGL
+        # context created by this one
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(len(segments), mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(
+                    render_scene_segment,
+                    self.file_name,
+                    self.scene_class.__name__,
+                    worker_config,
+                    start, end,
+                )
+                for start, end in segments
+            ]
+            progress_display = ProgressDisplay(
+                total=len(futures),
+                leave=False,
+                ascii=True if platform.system() == 'Windows' else None,
+                desc=f"{self} segments",
+                disable=self.file_writer.quiet,
+            )
+            for future in as_completed(futures):
+                future.result()
+                progress_display.update()
+            progress_display.close()
+
+        # Results are gathered in the order of the segments
+        file_writer = self.file_writer
+        partial_movie_file_paths = []
+        for future in futures:
+            file_paths, audio_segment = future.result()
+            partial_movie_file_paths.extend(file_paths)
+            if audio_segment is not None:
+                # Sounds in each segment are already placed at their time in the scene
+                file_writer.add_audio_segment(audio_segment, time=0)
+
+        file_writer.combine_partial_movie_files(partial_movie_file_paths)
+        if file_writer.includes_sound:
+            file_writer.add_sound_to_video()
+        if file_writer.should_open_file():
+            file_writer.open_file()
@@ -29,10 +29,12 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.scene.segment_hashing import hash_segment_state
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
 from manimlib.utils.iterables import batch_by_property
+from manimlib.utils.profiling import profiler
 from manimlib.window import Window
 
 from typing import TYPE_CHECKING
@@ -74,6 +76,9 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        # If given, a trace of where the time of each frame goes is written
+        # to this path as json, which chrome://tracing or perfetto can open
+        profile_file: str | None = None,
     ):
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
@@ -84,6 +89,7 @@ class Scene(object):
         self.preview_while_skipping = preview_while_skipping
         self.presenter_mode = presenter_mode
         self.default_wait_time = default_wait_time
+        self.profile_file = profile_file
 
         self.camera_config = merge_dicts_recursively(
             manim_config.camera,         # Global default
@@ -116,7 +122,13 @@ class Scene(object):
         self.mobjects: list[Mobject] = [self.camera.frame]
         self.render_groups: list[Mobject] = []
         self.id_to_mobject_map: dict[int, Mobject] = dict()
+        # Only set within batched_mobject_changes, as the number of mobjects
+        # at the start of the list not added since the batch began
+        self.n_settled_mobjects: int | None = None
         self.num_plays: int = 0
+        # Run time of each play and wait call so far
+        self.timeline: list[float] = []
+        self.play_start_time: float = 0
         self.time: float = 0
         self.skip_time: float = 0
         self.original_skipping_status: bool = self.skip_animations
@@ -148,11 +160,14 @@ class Scene(object):
     def run(self) -> None:
         self.virtual_animation_start_time: float = 0
         self.real_animation_start_time: float = time.time()
+        if self.profile_file is not None:
+            profiler.enable()
         self.file_writer.begin()
 
         self.setup()
         try:
             self.construct()
+            self.file_writer.record_timeline(self.timeline)
             self.interact()
         except EndScene:
             pass
@@ -178,6 +193,11 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        if self.profile_file is not None and profiler.enabled:
+            profiler.disable()
+            profiler.log_summary()
+            profiler.export_chrome_trace(self.profile_file)
+            log.info(f"Frame profile written to {self.profile_file}")
         if self.window:
             self.window.destroy()
             self.window = None
@@ -237,6 +257,9 @@ class Scene(object):
         self.update_mobjects(dt)
         if self.skip_animations and not force_draw:
             return
+        if self.file_writer.reusing_cached_segment and not force_draw:
+            # The frames of this segment have already been rendered
+            return
 
         if self.is_window_closing():
             raise EndScene()
@@ -262,7 +285,8 @@ class Scene(object):
 
     def update_mobjects(self, dt: float) -> None:
         for mobject in self.mobjects:
-            mobject.update(dt)
+            with profiler.span(lambda: str(mobject), "update", mobject_id=id(mobject)):
+                mobject.update(dt)
 
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
@@ -300,26 +324,38 @@ class Scene(object):
         """
         Rendering can be more efficient when mobjects of the
         same type are grouped together, so this function creates
-        Groups of all clusters of adjacent Mobjects in the scene
+        Groups of all clusters of adjacent Mobjects in the scene.
+
+        Groups whose members are the same as before are kept, together
+        with the shader data they've already read in, so that only groups
+        affected by a change to the mobject list are built anew.
         """
         batches = batch_by_property(
             self.mobjects,
-            lambda m: str(type(m)) + str(m.get_shader_wrapper(self.camera.ctx).get_id()) + str(m.z_index)
+            lambda m: (type(m), m.get_shader_wrapper(self.camera.ctx).get_id(), m.z_index)
         )
 
-        for group in self.render_groups:
+        members_to_old_group = {
+            tuple(map(id, group.submobjects)): group
+            for group in self.render_groups
+        }
+        render_groups = []
+        for batch, key in batches:
+            group = members_to_old_group.pop(tuple(map(id, batch)), None)
+            if group is None:
+                group = batch[0].get_group_class()(*batch)
+            render_groups.append(group)
+        for group in members_to_old_group.values():
             group.clear()
-        self.render_groups = [
-            batch[0].get_group_class()(*batch)
-            for batch, key in batches
-        ]
+        self.render_groups = render_groups
 
     @staticmethod
     def affects_mobject_list(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             func(self, *args, **kwargs)
-            self.assemble_render_groups()
+            if self.n_settled_mobjects is None:
+                self.assemble_render_groups()
             return self
         return wrapper
 
@@ -329,12 +365,12 @@ class Scene(object):
         Mobjects will be displayed, from background to
         foreground in the order with which they are added.
         """
-        self.remove(*new_mobjects)
-        self.mobjects += new_mobjects
-
-        # Reorder based on z_index
-        id_to_scene_order = {id(m): idx for idx, m in enumerate(self.mobjects)}
-        self.mobjects.sort(key=lambda m: (m.z_index, id_to_scene_order[id(m)]))
+        if self.n_settled_mobjects is None:
+            self.remove(*new_mobjects)
+            self.mobjects += new_mobjects
+            self.sort_mobjects_by_z_index()
+        else:
+            self.mobjects += new_mobjects
 
         self.id_to_mobject_map.update({
             id(sm): sm
@@ -343,6 +379,58 @@ class Scene(object):
         })
         return self
 
+    def sort_mobjects_by_z_index(self) -> None:
+        id_to_scene_order = {id(m): idx for idx, m in enumerate(self.mobjects)}
+        self.mobjects.sort(key=lambda m: (m.z_index, id_to_scene_order[id(m)]))
+
+    @contextmanager
+    def batched_mobject_changes(self):
+        """
+        For adding a great many mobjects one at a time, e.g.
+
+        with self.batched_mobject_changes():
+            for point in points:
+                self.add(Dot(point))
+
+        Within this context, add only appends to the mobject list, while
+        removing earlier copies of what's added, ordering by z_index and
+        assembling render groups are done once, either at the end or on
+        the next call to remove.  Not meant to span calls to play or wait.
+        """
+        if self.n_settled_mobjects is not None:
+            yield
+            return
+        self.n_settled_mobjects = len(self.mobjects)
+        try:
+            yield
+        finally:
+            self.settle_batched_additions()
+            self.n_settled_mobjects = None
+            self.assemble_render_groups()
+
+    def settle_batched_additions(self) -> None:
+        """
+        Leaves the mobject list as it would have been had each mobject
+        added within batched_mobject_changes been added on its own, by
+        which each addition removes its family from all that came before
+        """
+        if self.n_settled_mobjects is None:
+            return
+        settled = self.mobjects[:self.n_settled_mobjects]
+        additions = self.mobjects[self.n_settled_mobjects:]
+        if not additions:
+            return
+        later_families: set[Mobject] = set()
+        kept_additions = []
+        for mob in reversed(additions):
+            sub_list, _ = recursive_mobject_remove([mob], later_families)
+            kept_additions.extend(reversed(sub_list))
+            later_families.update(mob.get_family())
+        settled, _ = recursive_mobject_remove(settled, later_families)
+        self.mobjects = settled + kept_additions[::-1]
+        self.sort_mobjects_by_z_index()
+        self.n_settled_mobjects = len(self.mobjects)
+
     def add_mobjects_among(self, values: Iterable):
         """
         This is meant mostly for quick prototyping,
@@ -357,6 +445,7 @@ class Scene(object):
 
     @affects_mobject_list
     def replace(self, mobject: Mobject, *replacements: Mobject):
+        self.settle_batched_additions()
         if mobject in self.mobjects:
             index = self.mobjects.index(mobject)
             self.mobjects = [
@@ -364,6 +453,8 @@ class Scene(object):
                 *replacements,
                 *self.mobjects[index + 1:]
             ]
+        if self.n_settled_mobjects is not None:
+            self.n_settled_mobjects = len(self.mobjects)
         return self
 
     @affects_mobject_list
@@ -376,9 +467,12 @@ class Scene(object):
         For example, if the scene includes Group(m1, m2, m3), and we call scene.remove(m1),
         the desired behavior is for the scene to then include m2 and m3 (ungrouped).
         """
+        self.settle_batched_additions()
         to_remove = set(extract_mobject_family_members(mobjects_to_remove))
         new_mobjects, _ = recursive_mobject_remove(self.mobjects, to_remove)
         self.mobjects = new_mobjects
+        if self.n_settled_mobjects is not None:
+            self.n_settled_mobjects = len(self.mobjects)
 
     def bring_to_front(self, *mobjects: Mobject):
         self.add(*mobjects)
@@ -388,11 +482,15 @@ class Scene(object):
     def bring_to_back(self, *mobjects: Mobject):
         self.remove(*mobjects)
         self.mobjects = list(mobjects) + self.mobjects
+        if self.n_settled_mobjects is not None:
+            self.n_settled_mobjects = len(self.mobjects)
         return self
 
     @affects_mobject_list
     def clear(self):
         self.mobjects = []
+        if self.n_settled_mobjects is not None:
+            self.n_settled_mobjects = 0
         return self
 
     def get_mobjects(self) -> list[Mobject]:
@@ -470,6 +568,8 @@ class Scene(object):
 
         times = np.arange(0, run_time, 1 / self.camera.fps) + 1 / self.camera.fps
 
+        if n_iterations is None:
+            self.file_writer.note_upcoming_frames(len(times))
         self.file_writer.set_progress_display_description(sub_desc=desc)
 
         if self.show_animation_progress:
@@ -510,14 +610,36 @@ class Scene(object):
             kw["override_skip_animations"] = True
         return self.get_time_progression(duration, **kw)
 
-    def pre_play(self):
+    def get_segment_key(self, *segment_items) -> str | None:
+        """
+        Key under which the movie of the coming play or wait call is
+        cached, based on the state of the scene going into it, the given
+        items describing the segment (e.g. its animations), and on all
+        configuration affecting how frames are rendered and encoded
+        """
+        if not self.file_writer.cache_segments or self.window is not None:
+            return None
+        fw = self.file_writer
+        return hash_segment_state(
+            self.camera_config,
+            [fw.movie_file_extension, fw.video_codec, fw.pixel_format, fw.saturation, fw.gamma],
+            self.time,
+            random.getstate(),
+            np.random.get_state(),
+            self.always_update_mobjects,
+            self.mobjects,
+            segment_items,
+        )
+
+    def pre_play(self, *segment_items):
         if self.presenter_mode and self.num_plays == 0:
             self.hold_loop()
 
         self.update_skipping_status()
+        self.play_start_time = self.time
 
         if not self.skip_animations:
-            self.file_writer.begin_animation()
+            self.file_writer.begin_animation(self.get_segment_key(*segment_items))
 
         if self.window:
             self.virtual_animation_start_time = self.time
@@ -531,6 +653,7 @@ class Scene(object):
             # Show some quick frames along the way
             self.update_frame(dt=0, force_draw=True)
 
+        self.timeline.append(self.time - self.play_start_time)
         self.num_plays += 1
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
@@ -581,11 +704,15 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
-        self.pre_play()
-        self.begin_animations(animations)
-        self.progress_through_animations(animations)
-        self.finish_animations(animations)
-        self.post_play()
+        with profiler.span(
+            f"play {self.num_plays}", "play",
+            animations=lambda: ", ".join(map(str, animations))
+        ):
+            self.pre_play(*animations)
+            self.begin_animations(animations)
+            self.progress_through_animations(animations)
+            self.finish_animations(animations)
+            self.post_play()
 
     def wait(
         self,
@@ -596,23 +723,38 @@ class Scene(object):
     ):
         if duration is None:
             duration = self.default_wait_time
-        self.pre_play()
-        self.update_mobjects(dt=0)  # Any problems with this?
-        if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
-            if note:
-                log.info(note)
-            self.hold_loop()
-        else:
-            time_progression = self.get_wait_time_progression(duration, stop_condition)
-            last_t = 0
-            for t in time_progression:
-                dt = t - last_t
-                last_t = t
-                self.update_frame(dt)
-                self.emit_frame()
-                if stop_condition is not None and stop_condition():
-                    break
-        self.post_play()
+        with profiler.span(f"wait {self.num_plays}", "play", duration=duration):
+            self.pre_play(duration, stop_condition)
+            self.update_mobjects(dt=0)  # Any problems with this?
+            if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
+                if note:
+                    log.info(note)
+                self.hold_loop()
+            else:
+                time_progression = self.get_wait_time_progression(duration, stop_condition)
+                # With nothing to update and no window to respond to, nothing
+                # changes over the course of the wait, so once its first frame
+                # is written, that same frame can be written again.  While
+                # skipping, no frame is written, so there is none to repeat
+                is_static = all([
+                    self.window is None,
+                    not self.skip_animations,
+                    not self.should_update_mobjects(),
+                ])
+                has_emitted_frame = False
+                last_t = 0
+                for t in time_progression:
+                    dt = t - last_t
+                    last_t = t
+                    if is_static and has_emitted_frame and self.file_writer.repeat_last_frame():
+                        self.increment_time(dt)
+                    else:
+                        self.update_frame(dt)
+                        self.emit_frame()
+                        has_emitted_frame = True
+                    if stop_condition is not None and stop_condition():
+                        break
+            self.post_play()
 
     def hold_loop(self):
         while self.hold_on_wait:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections import deque
+from contextlib import contextmanager
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
+import time
 
 import numpy as np
 from pydub import AudioSegment
@@ -13,12 +18,17 @@ from pathlib import Path
 
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
+from manimlib.utils.cache import cache_file_on_disk
+from manimlib.utils.cache import cache_value
+from manimlib.utils.cache import copy_file_from_cache
 from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.profiling import profiler
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Iterable
     from PIL.Image import Image
 
     from manimlib.camera.camera import Camera
@@ -31,6 +41,10 @@ class SceneFileWriter(object):
         scene: Scene,
         write_to_movie: bool = False,
         subdivide_output: bool = False,
+        # Whether to keep the movie of each play or wait call in the cache,
+        # keyed by everything its frames depend on, so that unchanged
+        # segments needn't be rendered again the next time around
+        cache_segments: bool = False,
         png_mode: str = "RGBA",
         save_last_frame: bool = False,
         movie_file_extension: str = ".mp4",
@@ -41,6 +55,9 @@ class SceneFileWriter(object):
         show_file_location_upon_completion: bool = False,
         quiet: bool = False,
         total_frames: int = 0,
+        # Key under which the run times of all play and wait calls
+        # are cached once the scene runs through, see record_timeline
+        timeline_key: str | None = None,
         progress_description_len: int = 40,
         # Name of the binary used for ffmpeg
         ffmpeg_bin: str = "ffmpeg",
@@ -48,10 +65,17 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # Frames are read back from the gpu through a ring of this many
+        # pixel buffers, so that rendering the next frame needn't wait
+        # on the previous one. Use 1 to read each frame synchronously.
+        n_readback_buffers: int = 3,
+        # Frames waiting to be piped into ffmpeg by the writing thread
+        max_queued_frames: int = 16,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
         self.subdivide_output = subdivide_output
+        self.cache_segments = cache_segments
         self.png_mode = png_mode
         self.save_last_frame = save_last_frame
         self.movie_file_extension = movie_file_extension
@@ -61,17 +85,35 @@ class SceneFileWriter(object):
         self.show_file_location_upon_completion = show_file_location_upon_completion
         self.quiet = quiet
         self.total_frames = total_frames
+        self.timeline_key = timeline_key
         self.progress_description_len = progress_description_len
         self.ffmpeg_bin = ffmpeg_bin
         self.video_codec = video_codec
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.n_readback_buffers = n_readback_buffers
+        self.max_queued_frames = max_queued_frames
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
+        self.writing_thread: threading.Thread | None = None
+        self.frame_queue: queue.Queue[bytes | None] = queue.Queue(max(max_queued_frames, 1))
+        self.frame_writing_error: Exception | None = None
+        self.readback_buffers: list = []
+        self.pending_readbacks: deque = deque()
+        # Bytes of the latest frame handed to the writing thread
+        self.last_frame_bytes: bytes | None = None
+        self.free_readback_buffers: list = []
+        self.frame_stage_timer = FrameStageTimer()
         self.progress_display: ProgressDisplay | None = None
+        self.n_frames_queued: int = 0
+        self.segment_key: str | None = None
+        self.reusing_cached_segment: bool = False
         self.ended_with_interrupt: bool = False
+        # Partial movie files written, or restored from the cache, during this run
+        self.partial_movie_file_paths: list[Path] = []
+        self.current_partial_movie_path: Path | None = None
 
         self.init_output_directories()
         self.init_audio()
@@ -82,7 +124,7 @@ class SceneFileWriter(object):
             self.image_file_path = self.init_image_file_path()
         if self.write_to_movie:
             self.movie_file_path = self.init_movie_file_path()
-        if self.subdivide_output:
+        if self.subdivide_output or self.cache_segments:
             self.partial_movie_directory = self.init_partial_movie_directory()
 
     def init_image_file_path(self) -> Path:
@@ -118,10 +160,13 @@ class SceneFileWriter(object):
     def get_image_file_path(self) -> str:
         return self.image_file_path
 
-    def get_next_partial_movie_path(self) -> str:
-        result = Path(self.partial_movie_directory, f"{self.scene.num_plays:05}")
+    def get_partial_movie_path(self, index: int) -> Path:
+        result = Path(self.partial_movie_directory, f"{index:05}")
         return result.with_suffix(self.movie_file_extension)
 
+    def get_next_partial_movie_path(self) -> Path:
+        return self.get_partial_movie_path(self.scene.num_plays)
+
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
@@ -175,20 +220,49 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, gain_to_background)
 
     # Writers
+    def writes_partial_movies(self) -> bool:
+        return self.write_to_movie and (self.subdivide_output or self.cache_segments)
+
     def begin(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if not self.writes_partial_movies() and self.write_to_movie:
             self.open_movie_pipe(self.get_movie_file_path())
 
-    def begin_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
-            self.open_movie_pipe(self.get_next_partial_movie_path())
+    def begin_animation(self, segment_key: str | None = None) -> None:
+        """
+        If segment_key is given, and a segment with that key was cached
+        before, it's used as the next partial movie file, and frames are
+        not written until the next call to end_animation
+        """
+        if not self.writes_partial_movies():
+            return
+        file_path = self.get_next_partial_movie_path()
+        self.current_partial_movie_path = file_path
+        self.segment_key = segment_key if self.cache_segments else None
+        if self.segment_key is not None and copy_file_from_cache(self.segment_key, file_path):
+            self.reusing_cached_segment = True
+        else:
+            self.open_movie_pipe(file_path)
 
     def end_animation(self) -> None:
-        if self.subdivide_output and self.write_to_movie:
-            self.close_movie_pipe()
+        if not self.writes_partial_movies():
+            return
+        if self.reusing_cached_segment:
+            self.reusing_cached_segment = False
+            self.partial_movie_file_paths.append(self.current_partial_movie_path)
+            return
+        self.close_movie_pipe()
+        if self.ended_with_interrupt:
+            return
+        self.partial_movie_file_paths.append(self.current_partial_movie_path)
+        if self.segment_key is not None:
+            cache_file_on_disk(self.segment_key, self.final_file_path)
 
     def finish(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if self.cache_segments and not self.subdivide_output and self.write_to_movie:
+            self.combine_partial_movie_files(self.partial_movie_file_paths)
+            if self.includes_sound:
+                self.add_sound_to_video()
+        elif not self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
             if self.includes_sound:
                 self.add_sound_to_video()
@@ -203,6 +277,7 @@ class SceneFileWriter(object):
         stem, ext = os.path.splitext(file_path)
         self.final_file_path = file_path
         self.temp_file_path = stem + "_temp" + ext
+        self.last_frame_bytes = None
 
         fps = self.scene.camera.fps
         width, height = self.scene.camera.get_pixel_shape()
@@ -228,10 +303,18 @@ class SceneFileWriter(object):
             command += ['-pix_fmt', self.pixel_format]
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        self.frame_writing_error = None
+        self.frame_stage_timer.reset()
+        self.writing_thread = threading.Thread(
+            target=self.write_queued_frames,
+            daemon=True,
+        )
+        self.writing_thread.start()
 
         if not self.quiet:
+            self.n_frames_queued = 0
             self.progress_display = ProgressDisplay(
-                range(self.total_frames),
+                total=self.total_frames or None,
                 leave=False,
                 ascii=True if platform.system() == 'Windows' else None,
                 dynamic_ncols=True,
@@ -267,6 +350,29 @@ class SceneFileWriter(object):
     def has_progress_display(self):
         return self.progress_display is not None
 
+    def note_upcoming_frames(self, n_frames: int) -> None:
+        """
+        Called as each play or wait call begins, so that the total of the
+        progress display grows to cover the frames about to be written,
+        whenever it wasn't known in advance (or was underestimated)
+        """
+        display = self.progress_display
+        if display is None or self.reusing_cached_segment:
+            return
+        needed = self.n_frames_queued + n_frames
+        if display.total is None or display.total < needed:
+            display.total = needed
+            display.refresh()
+
+    def record_timeline(self, timeline: list[float]) -> None:
+        """
+        Caches the run times of all play and wait calls from a full run
+        of the scene, so that later renders can size their progress
+        display without first running through the scene
+        """
+        if self.timeline_key is not None:
+            cache_value(self.timeline_key, list(timeline))
+
     def set_progress_display_description(self, file: str = "", sub_desc: str = "") -> None:
         if self.progress_display is None:
             return
@@ -282,18 +388,118 @@ class SceneFileWriter(object):
         self.progress_display.set_description(full_desc)
 
     def write_frame(self, camera: Camera) -> None:
-        if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+        if not self.write_to_movie or self.reusing_cached_segment:
+            return
+        if self.frame_writing_error is not None:
+            raise self.frame_writing_error
+        self.n_frames_queued += 1
+        timer = self.frame_stage_timer
+        timer.note_frame_rendered()
+        if self.n_readback_buffers > 1:
+            self.begin_frame_readback(camera)
+        else:
+            with timer.time_stage("read back"):
+                raw_bytes = camera.get_raw_fbo_data()
+            self.queue_frame(raw_bytes)
+        timer.note_frame_handed_off()
+
+    def repeat_last_frame(self) -> bool:
+        """
+        Writes the latest frame once more, without it being rendered or
+        read back again, for when nothing in the scene has changed since.
+        Returns False if there is no such frame to repeat.
+        """
+        if not self.write_to_movie or self.reusing_cached_segment:
+            return True
+        if self.frame_writing_error is not None:
+            raise self.frame_writing_error
+        self.flush_frame_readbacks()
+        if self.last_frame_bytes is None:
+            return False
+        self.n_frames_queued += 1
+        self.queue_frame(self.last_frame_bytes)
+        self.frame_stage_timer.note_frame_handed_off()
+        return True
+
+    def queue_frame(self, raw_bytes: bytes) -> None:
+        self.last_frame_bytes = raw_bytes
+        self.frame_queue.put(raw_bytes)
+
+    def begin_frame_readback(self, camera: Camera) -> None:
+        n_bytes = camera.get_raw_fbo_data_size()
+        if self.readback_buffers and self.readback_buffers[0].size != n_bytes:
+            self.release_readback_buffers()
+        if not self.readback_buffers:
+            self.readback_buffers = [
+                camera.ctx.buffer(reserve=n_bytes)
+                for _ in range(self.n_readback_buffers)
+            ]
+            self.free_readback_buffers = list(self.readback_buffers)
+        if not self.free_readback_buffers:
+            self.finish_frame_readback()
+        buffer = self.free_readback_buffers.pop()
+        with self.frame_stage_timer.time_stage("read back", n_frames=0):
+            camera.read_fbo_data_into(buffer)
+        self.pending_readbacks.append(buffer)
+
+    def finish_frame_readback(self) -> None:
+        # Oldest frame first, which the gpu has most likely finished with
+        buffer = self.pending_readbacks.popleft()
+        with self.frame_stage_timer.time_stage("read back"):
+            raw_bytes = buffer.read()
+        self.free_readback_buffers.append(buffer)
+        self.queue_frame(raw_bytes)
+
+    def flush_frame_readbacks(self) -> None:
+        while self.pending_readbacks:
+            self.finish_frame_readback()
+
+    def release_readback_buffers(self) -> None:
+        self.flush_frame_readbacks()
+        for buffer in self.readback_buffers:
+            buffer.release()
+        self.readback_buffers = []
+        self.free_readback_buffers = []
+
+    def write_queued_frames(self) -> None:
+        """
+        Run on a separate thread, piping frames into ffmpeg as they come in
+        """
+        while (raw_bytes := self.frame_queue.get()) is not None:
+            if self.frame_writing_error is not None:
+                # Keep draining so the render thread never blocks
+                continue
+            try:
+                with self.frame_stage_timer.time_stage("encoded"):
+                    self.writing_process.stdin.write(raw_bytes)
+            except Exception as err:
+                self.frame_writing_error = err
+                continue
             if self.progress_display is not None:
                 self.progress_display.update()
 
+    def get_frame_rates(self) -> dict[str, float]:
+        """
+        Frames per second handled by each stage of writing, when measured
+        only over the time spent in that stage
+        """
+        return self.frame_stage_timer.get_frame_rates()
+
     def close_movie_pipe(self) -> None:
+        self.release_readback_buffers()
+        self.frame_queue.put(None)
+        self.writing_thread.join()
         self.writing_process.stdin.close()
         self.writing_process.wait()
         self.writing_process.terminate()
         if self.progress_display is not None:
             self.progress_display.close()
+        log.debug("Frames per second, " + ", ".join(
+            f"{stage}: {rate:.1f}"
+            for stage, rate in self.get_frame_rates().items()
+        ))
+        if self.frame_writing_error is not None:
+            raise self.frame_writing_error
 
         if not self.ended_with_interrupt:
             shutil.move(self.temp_file_path, self.final_file_path)
@@ -331,6 +537,35 @@ class SceneFileWriter(object):
         shutil.move(temp_file_path, movie_file_path)
         os.remove(sound_file_path)
 
+    def combine_partial_movie_files(self, file_paths: Iterable[Path]) -> None:
+        """
+        Concatenate the given partial movie files, in order, into the full
+        movie file, without re-encoding.  Anything else lying around in the
+        partial movie directory, e.g. from an earlier run, is left out.
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) == 0:
+            log.warning("No partial movie files found to combine")
+            return
+        movie_file_path = self.get_movie_file_path()
+        file_list_path = Path(self.partial_movie_directory, "partial_movie_files.txt")
+        with open(file_list_path, "w") as fp:
+            for path in file_paths:
+                fp.write(f"file '{path.as_posix()}'\n")
+        commands = [
+            self.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(file_list_path),
+            '-c', 'copy',
+            '-loglevel', 'error',
+            str(movie_file_path),
+        ]
+        sp.call(commands)
+        os.remove(file_list_path)
+        self.print_file_ready_message(movie_file_path)
+
     def save_final_image(self, image: Image) -> None:
         file_path = self.get_image_file_path()
         image.save(file_path)
@@ -383,3 +618,44 @@ class SceneFileWriter(object):
         if self.quiet:
             sys.stdout.close()
             sys.stdout = curr_stdout
+
+
+class FrameStageTimer(object):
+    """
+    Keeps track of how many frames pass through each stage of writing
+    a movie, namely rendering, reading back from the gpu and encoding,
+    and of how much time is spent in each, to find the bottleneck.
+    """
+    stages = ("rendered", "read back", "encoded")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.frame_counts: dict[str, int] = dict.fromkeys(self.stages, 0)
+        self.durations: dict[str, float] = dict.fromkeys(self.stages, 0.0)
+        self.last_hand_off_time: float = time.perf_counter()
+
+    @contextmanager
+    def time_stage(self, stage: str, n_frames: int = 1):
+        start = time.perf_counter()
+        try:
+            with profiler.span(stage, "file_writer"):
+                yield
+        finally:
+            self.durations[stage] += time.perf_counter() - start
+            self.frame_counts[stage] += n_frames
+
+    def note_frame_rendered(self) -> None:
+        # Everything since the last frame was handed off counts as rendering
+        self.durations["rendered"] += time.perf_counter() - self.last_hand_off_time
+        self.frame_counts["rendered"] += 1
+
+    def note_frame_handed_off(self) -> None:
+        self.last_hand_off_time = time.perf_counter()
+
+    def get_frame_rates(self) -> dict[str, float]:
+        return {
+            stage: self.frame_counts[stage] / self.durations[stage] if self.durations[stage] > 0 else 0.0
+            for stage in self.stages
+        }
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import types
+
+import numpy as np
+
+from manimlib.animation.animation import Animation
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def hash_segment_state(*items: Any, n_bytes: int = 32) -> str:
+    """
+    Hash of the state held by the given items, meant to identify everything
+    a rendered segment of a scene depends on.
+
+    Mobjects contribute their data, uniforms and other render settings,
+    together with those of their submobjects and the code of their updaters,
+    animations contribute all their attributes, and functions contribute
+    their code, defaults and the values they close over.  Other objects
+    only contribute their type, so anything looked up through globals or
+    through such objects is not accounted for.
+    """
+    hasher = hashlib.sha256()
+    update_hash(hasher, items, dict())
+    return hasher.hexdigest()[:n_bytes]
+
+
+def update_hash(hasher: hashlib._Hash, obj: Any, visited: dict[int, int]) -> None:
+    def feed(*parts: Any):
+        for part in parts:
+            update_hash(hasher, part, visited)
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+        return
+    if isinstance(obj, np.generic):
+        feed(obj.item())
+        return
+    if isinstance(obj, np.ndarray):
+        hasher.update(f"array:{obj.dtype.str}:{obj.shape};".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+        return
+
+    # Objects seen before are referred to by the order in which they were
+    # first seen, which also guards against cycles
+    if id(obj) in visited:
+        hasher.update(f"ref:{visited[id(obj)]};".encode())
+        return
+    visited[id(obj)] = len(visited)
+    hasher.update(f"{type(obj).__module__}.{type(obj).__qualname__}:".encode())
+
+    if isinstance(obj, (list, tuple)):
+        feed(len(obj), *obj)
+    elif isinstance(obj, (set, frozenset)):
+        feed(sorted(map(repr, obj)))
+    elif isinstance(obj, dict):
+        feed(len(obj))
+        for key, value in obj.items():
+            feed(key, value)
+    elif isinstance(obj, Mobject):
+        feed(
+            obj.data,
+            obj.uniforms,
+            obj.texture_paths,
+            obj.shader_code_replacements,
+            obj.depth_test,
+            obj.z_index,
+            obj.updating_suspended,
+            obj.updaters,
+            obj.submobjects,
+        )
+    elif isinstance(obj, Animation):
+        feed(vars(obj))
+    elif isinstance(obj, types.MethodType):
+        feed(obj.__func__, obj.__self__)
+    elif isinstance(obj, types.FunctionType):
+        cell_contents = [
+            get_cell_contents(cell)
+            for cell in (obj.__closure__ or [])
+        ]
+        feed(obj.__qualname__, obj.__code__, obj.__defaults__, obj.__kwdefaults__, cell_contents)
+    elif isinstance(obj, types.CodeType):
+        feed(obj.co_code, obj.co_consts, obj.co_names)
+    elif isinstance(obj, type):
+        feed(obj.__module__, obj.__qualname__)
+    elif isinstance(obj, (types.BuiltinFunctionType, np.ufunc)):
+        feed(obj.__name__)
+
+
+def get_cell_contents(cell: types.CellType) -> Any:
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # Cell which has not been assigned yet
+        return None
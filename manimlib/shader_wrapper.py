@@ -19,8 +19,8 @@ from manimlib.utils.shaders import set_program_uniform
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Optional, Tuple, Iterable
-    from manimlib.typing import UniformDict
+    from typing import Callable, Hashable, Optional, Tuple, Iterable
+    from manimlib.typing import UniformDict, Vect3Array
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
 
@@ -45,6 +45,9 @@ class ShaderWrapper(object):
     ):
         self.ctx = ctx
         self.vert_data = vert_data
+        # Whether vert_data is an array of this wrapper's own, rather than
+        # the data of some mobject, which shouldn't be written into
+        self.owns_vert_data = False
         self.vert_attributes = vert_data.dtype.names
         self.shader_folder = shader_folder
         self.depth_test = depth_test
@@ -99,6 +102,10 @@ class ShaderWrapper(object):
     def init_vertex_objects(self):
         self.vbo = None
         self.vaos = []
+        self.n_verts = 0
+        # What was last read into the vbo, see read_in_changes
+        self.data_keys = None
+        self.data_lengths = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
         max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
@@ -150,28 +157,132 @@ class ShaderWrapper(object):
 
     # Adding data
 
-    def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
+    def read_in(
+        self,
+        data_list: Iterable[np.ndarray],
+        index_list: Optional[Iterable[np.ndarray | None]] = None,
+        data_keys: Optional[list[Hashable]] = None,
+    ):
+        """
+        Reads the concatenation of data_list into the vbo.
+
+        index_list is only used by subclasses which render some primitives
+        through an index buffer. If data_keys is given, it should hold one
+        key for each array in data_list, which changes whenever the contents
+        of that array do, so that later calls to read_in_changes can rewrite
+        only what has changed.
+        """
+        data_list = list(data_list)
+        lengths = list(map(len, data_list))
+        total_len = sum(lengths)
         if total_len == 0:
-            if self.vbo is not None:
-                self.vbo.clear()
+            self.vert_data = self.vert_data[:0]
+            self.owns_vert_data = False
+            self.n_verts = 0
+            self.data_keys = None
             return
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
+        # If possible, read concatenated data into existing list, so long
+        # as that list isn't the data of a mobject
+        if len(self.vert_data) != total_len or not self.owns_vert_data:
             self.vert_data = np.concatenate(data_list)
+            self.owns_vert_data = True
         else:
             np.concatenate(data_list, out=self.vert_data)
 
-        # Either create new vbo, or read data into it
-        total_size = self.vert_data.itemsize * total_len
-        if self.vbo is not None and self.vbo.size != total_size:
-            self.release()  # This sets vbo to be None
-        if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
-            self.generate_vaos()
-        else:
-            self.vbo.write(self.vert_data)
+        self.reserve_vbo(total_len)
+        self.vbo.write(self.vert_data)
+        self.n_verts = total_len
+        self.data_keys = data_keys
+        self.data_lengths = lengths
+
+    def read_in_changes(
+        self,
+        data_keys: list[Hashable],
+        get_data: Callable[[int], np.ndarray]
+    ) -> bool:
+        """
+        Updates the vbo to hold the data for data_keys, where get_data(i)
+        returns the data for data_keys[i]. Only data for keys which were
+        not part of the last read are computed, and only those, along with
+        any data whose place in the buffer has moved, are rewritten.
+
+        Returns False, leaving everything as is, when this isn't possible,
+        e.g. if the vbo doesn't have room for the new data, in which case
+        everything should be read in with read_in.
+        """
+        if self.data_keys is None or self.vbo is None:
+            return False
+        if data_keys == self.data_keys:
+            return True
+
+        old_places = dict()
+        offset = 0
+        for key, length in zip(self.data_keys, self.data_lengths):
+            old_places[key] = (offset, length)
+            offset += length
+
+        new_data = dict()
+        lengths = []
+        for i, key in enumerate(data_keys):
+            if key in old_places:
+                lengths.append(old_places[key][1])
+            else:
+                new_data[i] = get_data(i)
+                lengths.append(len(new_data[i]))
+        total_len = sum(lengths)
+        itemsize = self.vert_data.itemsize
+        if total_len == 0 or total_len * itemsize > self.vbo.size:
+            return False
+
+        offsets = np.cumsum([0, *lengths[:-1]])
+        moved = set(
+            i for i, key in enumerate(data_keys)
+            if i not in new_data and old_places[key][0] != offsets[i]
+        )
+        old_vert_data = self.vert_data
+        if moved or total_len != len(old_vert_data) or not self.owns_vert_data:
+            self.vert_data = np.empty(total_len, dtype=old_vert_data.dtype)
+            self.owns_vert_data = True
+
+        dirty_ranges = []
+        for i, key in enumerate(data_keys):
+            start, end = offsets[i], offsets[i] + lengths[i]
+            if i in new_data:
+                self.vert_data[start:end] = new_data[i]
+            elif self.vert_data is not old_vert_data:
+                old_start = old_places[key][0]
+                self.vert_data[start:end] = old_vert_data[old_start:old_start + lengths[i]]
+                if i not in moved:
+                    continue
+            else:
+                continue
+            # Merge with the previous range when adjacent
+            if dirty_ranges and dirty_ranges[-1][1] == start:
+                dirty_ranges[-1][1] = end
+            else:
+                dirty_ranges.append([start, end])
+
+        for start, end in dirty_ranges:
+            self.vbo.write(self.vert_data[start:end], offset=int(start * itemsize))
+        self.n_verts = total_len
+        self.data_keys = data_keys
+        self.data_lengths = lengths
+        return True
+
+    def reserve_vbo(self, n_verts: int) -> bool:
+        """
+        Makes sure the vbo has room for n_verts vertices, without being
+        excessively large, allocating a new one with some room to grow
+        if not. Returns whether a new one was allocated.
+        """
+        itemsize = self.vert_data.itemsize
+        if self.vbo is not None and n_verts * itemsize <= self.vbo.size <= 2 * n_verts * itemsize:
+            return False
+        self.release()  # This sets vbo to be None
+        self.vbo = self.ctx.buffer(reserve=int(np.ceil(1.25 * n_verts)) * itemsize)
+        self.generate_vaos()
+        return True
 
     def generate_vaos(self):
         # Vertex array object
@@ -193,7 +304,7 @@ class ShaderWrapper(object):
 
     def render(self):
         for vao in self.vaos:
-            vao.render()
+            vao.render(vertices=self.n_verts)
 
     def update_program_uniforms(self, camera_uniforms: UniformDict):
         for program in self.programs:
@@ -218,6 +329,15 @@ class ShaderWrapper(object):
 
 
 class VShaderWrapper(ShaderWrapper):
+    # When drawing many shifted copies of the same shape,
+    # each copy gets one of these, see get_instance_data
+    instance_dtype: np.dtype = np.dtype([
+        ('shift', np.float32, (3,)),
+        ('stroke_rgba', np.float32, (4,)),
+        ('fill_rgba', np.float32, (4,)),
+    ])
+    min_instances: int = 2
+
     def __init__(
         self,
         ctx: moderngl.context.Context,
@@ -229,8 +349,20 @@ class VShaderWrapper(ShaderWrapper):
         render_primitive: int = moderngl.TRIANGLES,
         code_replacements: dict[str, str] = dict(),
         stroke_behind: bool = False,
+        triangulated_fill: bool = False,
     ):
         self.stroke_behind = stroke_behind
+        self.triangulated_fill = triangulated_fill
+        self.point_bounds = None
+        self.max_fill_border_width = 0.0
+        self.camera_uniforms = dict()
+        self.instanced = False
+        self.n_instances = 1
+        # Data keys for each instance, see read_in_instance_changes
+        self.instance_keys: list[Hashable] | None = None
+        self.instance_data: np.ndarray | None = None
+        # Keys of two arrays found not to be shifted copies of each other
+        self.mismatched_instance_keys: tuple[Hashable, Hashable] | None = None
         super().__init__(
             ctx=ctx,
             vert_data=vert_data,
@@ -253,6 +385,12 @@ class VShaderWrapper(ShaderWrapper):
             for vtype in ["stroke", "fill", "depth"]
             for name in ["vert", "geom", "frag"]
         }
+        self.program_code.update({
+            f"triangulated_fill_{name}": get_shader_code_from_file(
+                os.path.join("quadratic_bezier", "triangulated_fill", f"{name}.glsl")
+            )
+            for name in ["geom", "frag"]
+        })
 
     def init_program(self):
         self.stroke_program = get_shader_program(
@@ -282,7 +420,19 @@ class VShaderWrapper(ShaderWrapper):
             geometry_shader=self.program_code["depth_geom"],
             fragment_shader=self.program_code["depth_frag"],
         )
-        self.programs = [self.stroke_program, self.fill_program, self.fill_border_program, self.fill_depth_program]
+        self.triangulated_fill_program = get_shader_program(
+            self.ctx,
+            vertex_shader=self.program_code["fill_vert"],
+            geometry_shader=self.program_code["triangulated_fill_geom"],
+            fragment_shader=self.program_code["triangulated_fill_frag"],
+        )
+        self.programs = [
+            self.stroke_program,
+            self.fill_program,
+            self.fill_border_program,
+            self.fill_depth_program,
+            self.triangulated_fill_program,
+        ]
 
         # Full vert format looks like this (total of 4x23 = 92 bytes):
         # point 3
@@ -304,48 +454,398 @@ class VShaderWrapper(ShaderWrapper):
         self.fill_depth_vert_format = '3f 40x 3f 4x'
         self.fill_depth_vert_attributes = ['point', 'base_normal']
 
+        # Per-instance data, see instance_dtype
+        self.stroke_instance_format = '3f 4f 16x/i'
+        self.stroke_instance_attributes = ['instance_shift', 'instance_stroke_rgba']
+
+        self.fill_instance_format = '3f 16x 4f/i'
+        self.fill_instance_attributes = ['instance_shift', 'instance_fill_rgba']
+
+        self.fill_border_instance_format = '3f 16x 4f/i'
+        self.fill_border_instance_attributes = ['instance_shift', 'instance_stroke_rgba']
+
+        self.fill_depth_instance_format = '3f 32x/i'
+        self.fill_depth_instance_attributes = ['instance_shift']
+
     def init_vertex_objects(self):
-        self.vbo = None
+        super().init_vertex_objects()
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
-        self.vaos = []
+        self.curve_fill_vao = None
+        self.direct_fill_border_vao = None
+        self.inner_fill_vao = None
+        self.inner_fill_ibo = None
+        self.instance_vbo = None
+
+    def get_vertex_array(
+        self,
+        program: moderngl.Program,
+        vert_format: str,
+        vert_attributes: list[str],
+        instance_format: str,
+        instance_attributes: list[str],
+        **kwargs
+    ) -> VertexArray:
+        if self.instance_vbo is None:
+            self.instance_vbo = self.ctx.buffer(np.zeros(1, dtype=self.instance_dtype))
+        return self.ctx.vertex_array(
+            program=program,
+            content=[
+                (self.vbo, vert_format, *vert_attributes),
+                (self.instance_vbo, instance_format, *instance_attributes),
+            ],
+            **kwargs
+        )
 
     def generate_vaos(self):
-        self.stroke_vao = self.ctx.vertex_array(
-            program=self.stroke_program,
-            content=[(self.vbo, self.stroke_vert_format, *self.stroke_vert_attributes)],
+        self.stroke_vao = self.get_vertex_array(
+            self.stroke_program,
+            self.stroke_vert_format, self.stroke_vert_attributes,
+            self.stroke_instance_format, self.stroke_instance_attributes,
+            mode=self.render_primitive,
+        )
+        self.fill_vao = self.get_vertex_array(
+            self.fill_program,
+            self.fill_vert_format, self.fill_vert_attributes,
+            self.fill_instance_format, self.fill_instance_attributes,
             mode=self.render_primitive,
         )
-        self.fill_vao = self.ctx.vertex_array(
-            program=self.fill_program,
-            content=[(self.vbo, self.fill_vert_format, *self.fill_vert_attributes)],
+        self.fill_border_vao = self.get_vertex_array(
+            self.fill_border_program,
+            self.fill_border_vert_format, self.fill_border_vert_attributes,
+            self.fill_border_instance_format, self.fill_border_instance_attributes,
             mode=self.render_primitive,
         )
-        self.fill_border_vao = self.ctx.vertex_array(
-            program=self.fill_border_program,
-            content=[(self.vbo, self.fill_border_vert_format, *self.fill_border_vert_attributes)],
+        self.fill_depth_vao = self.get_vertex_array(
+            self.fill_depth_program,
+            self.fill_depth_vert_format, self.fill_depth_vert_attributes,
+            self.fill_depth_instance_format, self.fill_depth_instance_attributes,
             mode=self.render_primitive,
         )
-        self.fill_depth_vao = self.ctx.vertex_array(
-            program=self.fill_depth_program,
-            content=[(self.vbo, self.fill_depth_vert_format, *self.fill_depth_vert_attributes)],
+        self.curve_fill_vao = self.get_vertex_array(
+            self.triangulated_fill_program,
+            self.fill_vert_format, self.fill_vert_attributes,
+            self.fill_instance_format, self.fill_instance_attributes,
             mode=self.render_primitive,
         )
-        self.vaos = [self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao]
+        # This one reads from the stroke attributes, but is blended
+        # directly onto the frame, unlike fill_border_vao
+        self.direct_fill_border_vao = self.get_vertex_array(
+            self.stroke_program,
+            self.fill_border_vert_format, self.fill_border_vert_attributes,
+            self.fill_border_instance_format, self.fill_border_instance_attributes,
+            mode=self.render_primitive,
+        )
+        self.vaos = [
+            self.stroke_vao,
+            self.fill_vao,
+            self.fill_border_vao,
+            self.fill_depth_vao,
+            self.curve_fill_vao,
+            self.direct_fill_border_vao,
+        ]
 
     def set_backstroke(self, value: bool = True):
         self.stroke_behind = value
 
     def refresh_id(self):
         super().refresh_id()
-        self.id = hash(str(self.id) + str(self.stroke_behind))
+        self.id = hash(str(self.id) + str(self.stroke_behind) + str(self.triangulated_fill))
+
+    # Adding data
+    def read_in(
+        self,
+        data_list: Iterable[np.ndarray],
+        index_list: Optional[Iterable[np.ndarray | None]] = None,
+        data_keys: Optional[list[Hashable]] = None,
+    ):
+        """
+        With triangulated fill, index_list should hold, for each array of
+        data_list, indices into that array giving the triangles of the
+        interior of the corresponding shape.
+
+        When all the data describe shifted copies of one shape, only the
+        first is read into the vbo, and the others are drawn as instances
+        of it, each with its own shift and colors.
+        """
+        data_list = list(data_list)
+        instance_data = self.find_instances(data_list, data_keys)
+        self.instanced = instance_data is not None
+        if self.instanced:
+            self.instance_keys = data_keys
+            self.instance_data = instance_data
+            data_list = data_list[:1]
+            data_keys = None
+            if index_list is not None:
+                index_list = list(index_list)[:1]
+        else:
+            instance_data = np.zeros(1, dtype=self.instance_dtype)
+
+        super().read_in(data_list, data_keys=data_keys)
+        self.read_in_instances(instance_data)
+        self.refresh_point_bounds(instance_data["shift"])
+        if self.triangulated_fill and index_list is not None:
+            self.read_in_inner_triangles(data_list, index_list)
+
+    def read_in_changes(
+        self,
+        data_keys: list[Hashable],
+        get_data: Callable[[int], np.ndarray]
+    ) -> bool:
+        if self.instanced:
+            return self.read_in_instance_changes(data_keys, get_data)
+        # Inner triangles are always read in anew
+        if self.triangulated_fill:
+            return False
+        if not super().read_in_changes(data_keys, get_data):
+            return False
+        self.refresh_point_bounds(np.zeros((1, 3)))
+        return True
+
+    def read_in_instance_changes(
+        self,
+        data_keys: list[Hashable],
+        get_data: Callable[[int], np.ndarray]
+    ) -> bool:
+        """
+        While drawing instances, only the arrays with new keys are gotten
+        and checked against the shape being instanced, with the others
+        keeping their instance data.  Returns False, leaving things as they
+        were, if the first array changed or a new one doesn't match.
+        """
+        if self.instance_keys is None or len(data_keys) < self.min_instances:
+            return False
+        if data_keys[0] != self.instance_keys[0]:
+            return False
+        old_places = {key: i for i, key in enumerate(self.instance_keys)}
+        new_indices = [i for i, key in enumerate(data_keys) if key not in old_places]
+        old_indices = [i for i, key in enumerate(data_keys) if key in old_places]
+
+        instance_data = np.zeros(len(data_keys), dtype=self.instance_dtype)
+        if new_indices:
+            new_data, matches = self.get_instance_data(
+                [get_data(i) for i in new_indices], self.vert_data
+            )
+            if not matches.all():
+                mismatch = new_indices[int(np.argmin(matches))]
+                self.mismatched_instance_keys = (data_keys[0], data_keys[mismatch])
+                return False
+            instance_data[new_indices] = new_data
+        instance_data[old_indices] = self.instance_data[[
+            old_places[data_keys[i]] for i in old_indices
+        ]]
+
+        self.instance_keys = data_keys
+        self.instance_data = instance_data
+        self.read_in_instances(instance_data)
+        self.refresh_point_bounds(instance_data["shift"])
+        return True
+
+    def refresh_point_bounds(self, shifts: Vect3Array):
+        if len(self.vert_data) == 0:
+            self.point_bounds = None
+            return
+        points = self.vert_data["point"]
+        self.point_bounds = np.array([
+            points.min(0) + shifts.min(0),
+            points.max(0) + shifts.max(0),
+        ])
+        self.max_fill_border_width = float(self.vert_data["fill_border_width"].max())
+
+    def find_instances(
+        self,
+        data_list: list[np.ndarray],
+        data_keys: Optional[list[Hashable]] = None,
+    ) -> np.ndarray | None:
+        """
+        If all arrays in data_list describe shifted copies of the first,
+        this returns their instance data, see get_instance_data. Otherwise,
+        it returns None, remembering a pair which didn't match so that later
+        calls with both of them among data_keys needn't check again.
+        """
+        if len(data_list) < self.min_instances:
+            return None
+        if data_keys is not None and self.mismatched_instance_keys is not None:
+            if set(self.mismatched_instance_keys).issubset(data_keys):
+                return None
+        instance_data, matches = self.get_instance_data(data_list, data_list[0])
+        if matches.all():
+            return instance_data
+        if data_keys is not None:
+            mismatch = int(np.argmin(matches))
+            self.mismatched_instance_keys = (data_keys[0], data_keys[mismatch])
+        return None
+
+    def get_instance_data(
+        self,
+        data_list: list[np.ndarray],
+        reference: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        For each array in data_list, tells whether it describes the same shape
+        as reference up to a shift, with a single stroke color and a single
+        fill color, and if so, gives its shift relative to reference together
+        with its colors. Returns the instance data along with a boolean array
+        of which ones match.
+
+        Only shifts are detected, rotated or scaled copies don't match.
+        """
+        instance_data = np.zeros(len(data_list), dtype=self.instance_dtype)
+        matches = np.array([
+            len(data) == len(reference) > 0
+            for data in data_list
+        ], dtype=bool)
+        if not matches.any():
+            return instance_data, matches
+
+        def all_equal(arr1, arr2):
+            return (arr1 == arr2).reshape(len(arr1), -1).all(1)
+
+        rows = np.flatnonzero(matches)
+        stacked = np.stack([data_list[i] for i in rows])
+        ref = reference[np.newaxis]
+        same = np.ones(len(stacked), dtype=bool)
+        for name in stacked.dtype.names:
+            if name in ("point", "base_normal", "stroke_rgba", "fill_rgba"):
+                continue
+            same &= all_equal(stacked[name], ref[name])
+        for name in ("stroke_rgba", "fill_rgba"):
+            same &= all_equal(stacked[name], stacked[name][:, :1])
+        # Every third entry of base_normal holds the unit normal, the others
+        # hold a base point which moves together with the points
+        same &= all_equal(stacked["base_normal"][:, 1::3], ref["base_normal"][:, 1::3])
+        points = stacked["point"]
+        shifts = points[:, 0] - reference["point"][0]
+        same &= np.isclose(
+            points - shifts[:, np.newaxis], ref["point"], atol=1e-6
+        ).reshape(len(stacked), -1).all(1)
+
+        matches[rows] = same
+        instance_data["shift"][rows] = shifts
+        instance_data["stroke_rgba"][rows] = stacked["stroke_rgba"][:, 0]
+        instance_data["fill_rgba"][rows] = stacked["fill_rgba"][:, 0]
+        return instance_data, matches
+
+    def read_in_instances(self, instance_data: np.ndarray):
+        self.n_instances = len(instance_data)
+        if self.instance_vbo is not None and self.instance_vbo.size == instance_data.nbytes:
+            self.instance_vbo.write(instance_data)
+            return
+
+        # Vertex arrays are bound to the instance buffer, so they
+        # need to be regenerated along with it
+        for obj in (self.instance_vbo, *self.vaos, self.inner_fill_vao, self.inner_fill_ibo):
+            if obj is not None:
+                obj.release()
+        self.inner_fill_vao = None
+        self.inner_fill_ibo = None
+        self.instance_vbo = self.ctx.buffer(instance_data)
+        if self.vbo is not None:
+            self.generate_vaos()
+        else:
+            self.vaos = []
+
+    def read_in_inner_triangles(
+        self,
+        data_list: Iterable[np.ndarray],
+        index_list: Iterable[np.ndarray | None]
+    ):
+        offsets = np.cumsum([0, *map(len, data_list)])
+        indices = np.hstack([
+            offset + indices
+            for offset, indices in zip(offsets, index_list)
+            if indices is not None
+        ] or [np.zeros(0)]).astype('i4')
+
+        ibo = self.inner_fill_ibo
+        if ibo is not None and (len(indices) == 0 or ibo.size != indices.nbytes):
+            self.inner_fill_vao.release()
+            ibo.release()
+            self.inner_fill_vao = None
+            self.inner_fill_ibo = None
+        if len(indices) == 0 or self.vbo is None:
+            return
+
+        if self.inner_fill_ibo is None:
+            self.inner_fill_ibo = self.ctx.buffer(indices)
+            self.inner_fill_vao = self.get_vertex_array(
+                self.triangulated_fill_program,
+                self.fill_vert_format, self.fill_vert_attributes,
+                self.fill_instance_format, self.fill_instance_attributes,
+                index_buffer=self.inner_fill_ibo,
+                index_element_size=4,
+                mode=moderngl.TRIANGLES,
+            )
+        else:
+            self.inner_fill_ibo.write(indices)
+
+    def release(self):
+        for obj in (self.inner_fill_vao, self.inner_fill_ibo, self.instance_vbo):
+            if obj is not None:
+                obj.release()
+        super().release()
+
+    def update_program_uniforms(self, camera_uniforms: UniformDict):
+        super().update_program_uniforms(camera_uniforms)
+        for program in self.programs:
+            set_program_uniform(program, "instanced", float(self.instanced))
+        self.camera_uniforms = camera_uniforms
 
     # Rendering
+    def get_fill_ndc_bounds(self) -> np.ndarray | None:
+        """
+        Returns the lower left and upper right corners, in normalized
+        device coordinates, of a rectangle containing everything drawn
+        by render_fill, or None if no such bound is known, e.g. when
+        some of the points lie behind the camera.
+        """
+        uniforms = self.camera_uniforms
+        if self.point_bounds is None or "view" not in uniforms:
+            return None
+
+        # Leave room for the fill border and anti-aliasing
+        buff = 0.01 * self.max_fill_border_width * max(uniforms["frame_scale"], 1.0)
+        buff += self.mobject_uniforms.get("anti_alias_width", 0.0) * uniforms["pixel_size"]
+        low, high = self.point_bounds[0] - buff, self.point_bounds[1] + buff
+        corners = np.array([
+            (x, y, z, 1.0)
+            for x in (low[0], high[0])
+            for y in (low[1], high[1])
+            for z in (low[2], high[2])
+        ])
+
+        # Mirrors emit_gl_Position
+        view = np.array(uniforms["view"]).reshape(4, 4).T
+        fixed = self.mobject_uniforms.get("is_fixed_in_frame", 0.0)
+        result = (1.0 - fixed) * np.dot(corners, view.T) + fixed * corners
+        result = result[:, :3] * uniforms["frame_rescale_factors"]
+        w = 1.0 - result[:, 2]
+        if (w <= 0).any():
+            return None
+        ndc = result[:, :2] / w[:, np.newaxis]
+        return np.array([ndc.min(0), ndc.max(0)])
+
+    @staticmethod
+    def get_scissor_rect(ndc_bounds: np.ndarray | None, fbo: Framebuffer) -> Tuple[int, int, int, int]:
+        """
+        Pixel rectangle, as (x, y, width, height), of the given frame buffer
+        covering the region within ndc_bounds, padded by a couple pixels
+        """
+        x, y, width, height = fbo.viewport
+        if ndc_bounds is None:
+            return (x, y, width, height)
+        (x0, y0), (x1, y1) = (ndc_bounds + 1.0) * 0.5 * (width, height)
+        x0 = int(np.clip(np.floor(x0) - 2, 0, width))
+        y0 = int(np.clip(np.floor(y0) - 2, 0, height))
+        x1 = int(np.clip(np.ceil(x1) + 2, 0, width))
+        y1 = int(np.clip(np.ceil(y1) + 2, 0, height))
+        return (x + x0, y + y0, x1 - x0, y1 - y0)
+
     def render_stroke(self):
         if self.stroke_vao is None:
             return
-        self.stroke_vao.render()
+        self.stroke_vao.render(vertices=self.n_verts, instances=self.n_instances)
 
     def render_fill(self):
         if self.fill_vao is None:
@@ -354,14 +854,26 @@ class VShaderWrapper(ShaderWrapper):
         original_fbo = self.ctx.fbo
         fill_tx_fbo, fill_tx_vao, depth_tx_fbo = self.fill_canvas
 
+        # Only the part of each frame buffer which this fill can cover
+        # gets cleared and composited, so that the cost of this pass
+        # scales with the size of the fill, rather than the whole screen
+        ndc_bounds = self.get_fill_ndc_bounds()
+        fill_rect = self.get_scissor_rect(ndc_bounds, fill_tx_fbo)
+        original_rect = self.get_scissor_rect(ndc_bounds, original_fbo)
+        if 0 in (*fill_rect[2:], *original_rect[2:]):
+            # Entirely off screen
+            return
+
         # Render to a separate texture, due to strange alpha compositing
         # for the blended winding calculation
-        fill_tx_fbo.clear()
+        fill_tx_fbo.scissor = fill_rect
+        fill_tx_fbo.clear(viewport=fill_rect)
         fill_tx_fbo.use()
 
         # Be sure not to apply depth test while rendering fill
-        # but set it back to where it was after
-        apply_depth_test = bool(gl.glGetBooleanv(gl.GL_DEPTH_TEST))
+        # but set it back to where it was after (pre_render
+        # sets it according to self.depth_test)
+        apply_depth_test = self.depth_test
         self.ctx.disable(moderngl.DEPTH_TEST)
 
         # With this blend function, the effect of blending alpha a with
@@ -371,31 +883,55 @@ class VShaderWrapper(ShaderWrapper):
             gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA,
             gl.GL_ONE_MINUS_DST_ALPHA, gl.GL_ONE
         )
-        self.fill_vao.render()
+        self.fill_vao.render(vertices=self.n_verts, instances=self.n_instances)
 
         if apply_depth_test:
             self.ctx.enable(moderngl.DEPTH_TEST)
-            depth_tx_fbo.clear(1.0)
+            depth_rect = self.get_scissor_rect(ndc_bounds, depth_tx_fbo)
+            depth_tx_fbo.scissor = depth_rect
+            depth_tx_fbo.clear(1.0, viewport=depth_rect)
             depth_tx_fbo.use()
             gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
             gl.glBlendEquation(gl.GL_MIN)
-            self.fill_depth_vao.render()
+            self.fill_depth_vao.render(vertices=self.n_verts, instances=self.n_instances)
 
         # Now add border, just taking the max alpha
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
         gl.glBlendEquation(gl.GL_MAX)
-        self.fill_border_vao.render()
+        self.fill_border_vao.render(vertices=self.n_verts, instances=self.n_instances)
 
         # Take the texture we were just drawing to, and render it to
         # the main scene. Account for how alphas have been premultiplied
         original_fbo.use()
+        original_scissor = original_fbo.scissor
+        original_fbo.scissor = original_rect
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
         gl.glBlendEquation(gl.GL_FUNC_ADD)
         fill_tx_vao.render()
+        original_fbo.scissor = original_scissor
 
         # Return to original blending state
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
 
+    def render_triangulated_fill(self):
+        """
+        Draws the fill straight onto the current frame buffer, using
+        the precomputed triangulation of the interior, together with the
+        part of each curve's triangle lying inside the shape. This skips
+        the offscreen canvas used for the winding fill, at the cost of
+        only being correct for shapes without self-intersections, and of
+        fill borders blending over semi-transparent fills.
+        """
+        if self.curve_fill_vao is None:
+            return
+        program = self.triangulated_fill_program
+        set_program_uniform(program, "inner_triangles", 0.0)
+        self.curve_fill_vao.render(vertices=self.n_verts, instances=self.n_instances)
+        if self.inner_fill_vao is not None:
+            set_program_uniform(program, "inner_triangles", 1.0)
+            self.inner_fill_vao.render(instances=self.n_instances)
+        self.direct_fill_border_vao.render(vertices=self.n_verts, instances=self.n_instances)
+
     # Static method returning one shared value across all VShaderWrappers
     @lru_cache
     @staticmethod
@@ -472,9 +1008,10 @@ class VShaderWrapper(ShaderWrapper):
         return (fill_texture_fbo, fill_texture_vao, depth_texture_fbo)
 
     def render(self):
+        render_fill = self.render_triangulated_fill if self.triangulated_fill else self.render_fill
         if self.stroke_behind:
             self.render_stroke()
-            self.render_fill()
+            render_fill()
         else:
-            self.render_fill()
+            render_fill()
             self.render_stroke()
@@ -2,11 +2,14 @@
 
 in vec3 point;
 in vec3 base_normal;
+// Per-instance values, for when many shifted copies
+// of the same shape are drawn at once
+in vec3 instance_shift;
 
 out vec3 verts;
 out vec3 v_base_point;
 
 void main(){
-    verts = point;
-    v_base_point = base_normal;
+    verts = point + instance_shift;
+    v_base_point = base_normal + instance_shift;
 }
\ No newline at end of file
@@ -1,15 +1,23 @@
 #version 330
 
+uniform float instanced;
+
 in vec3 point;
 in vec4 fill_rgba;
 in vec3 base_normal;
+// Per-instance values, for when many shifted copies
+// of the same shape are drawn at once
+in vec3 instance_shift;
+in vec4 instance_fill_rgba;
 
 out vec3 verts;  // Bezier control point
 out vec4 v_color;
 out vec3 v_base_normal;
 
 void main(){
-    verts = point;
-    v_color = fill_rgba;
-    v_base_normal = base_normal;
+    verts = point + instance_shift;
+    v_color = mix(fill_rgba, instance_fill_rgba, instanced);
+    // All but the middle vertex of each curve hold the base
+    // point, which moves with the instance, unlike the normal
+    v_base_normal = base_normal + float(gl_VertexID % 3 != 1) * instance_shift;
 }
\ No newline at end of file
@@ -3,12 +3,17 @@
 uniform float frame_scale;
 uniform float is_fixed_in_frame;
 uniform float scale_stroke_with_zoom;
+uniform float instanced;
 
 in vec3 point;
 in vec4 stroke_rgba;
 in float stroke_width;
 in float joint_angle;
 in vec3 unit_normal;
+// Per-instance values, for when many shifted copies
+// of the same shape are drawn at once
+in vec3 instance_shift;
+in vec4 instance_stroke_rgba;
 
 // Bezier control point
 out vec3 verts;
@@ -21,8 +26,8 @@ out vec3 v_unit_normal;
 const float STROKE_WIDTH_CONVERSION = 0.01;
 
 void main(){
-    verts = point;
-    v_color = stroke_rgba;
+    verts = point + instance_shift;
+    v_color = mix(stroke_rgba, instance_stroke_rgba, instanced);
     v_stroke_width = STROKE_WIDTH_CONVERSION * stroke_width * mix(frame_scale, 1, scale_stroke_with_zoom);
     v_joint_angle = joint_angle;
     v_unit_normal = unit_normal;
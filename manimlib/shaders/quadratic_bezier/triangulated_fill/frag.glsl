@@ -0,0 +1,28 @@
+#version 330
+
+in vec4 color;
+in float fill_all;
+in float orientation;
+in vec2 uv_coords;
+
+out vec4 frag_color;
+
+void main() {
+    if (color.a == 0) discard;
+    frag_color = color;
+
+    if (bool(fill_all)) return;
+
+    /*
+    The interior triangulation passes through the chord of each convex
+    curve, and through the handle of each concave one, so what remains
+    to be filled is the region between the curve and its chord for
+    convex curves, and the region between the curve and its handle
+    for concave ones.
+    */
+    float x = uv_coords.x;
+    float y = uv_coords.y;
+    float Fxy = (y - x * x);
+    if(orientation > 0 && Fxy < 0) discard;
+    if(orientation < 0 && Fxy >= 0) discard;
+}
@@ -0,0 +1,65 @@
+#version 330
+
+layout (triangles) in;
+layout (triangle_strip, max_vertices = 3) out;
+
+// Whether the triangles drawn are those from the precomputed
+// triangulation of the interior, rather than those from the curves
+uniform float inner_triangles;
+
+in vec3 verts[3];
+in vec4 v_color[3];
+in vec3 v_base_normal[3];
+
+out vec4 color;
+out float fill_all;
+out float orientation;
+// uv space is where the curve coincides with y = x^2
+out vec2 uv_coords;
+
+// A quadratic bezier curve with these points coincides with y = x^2
+const vec2 SIMPLE_QUADRATIC[3] = vec2[3](
+    vec2(0.0, 0.0),
+    vec2(0.5, 0),
+    vec2(1.0, 1.0)
+);
+
+// Analog of import for manim only
+#INSERT emit_gl_Position.glsl
+#INSERT finalize_color.glsl
+
+
+void main(){
+    // Check zero fill
+    if (vec3(v_color[0].a, v_color[1].a, v_color[2].a) == vec3(0.0, 0.0, 0.0)) return;
+
+    vec3 unit_normal;
+    if (bool(inner_triangles)){
+        // Inner triangles are positively oriented, so their
+        // normal can be read off from the cross product
+        vec3 cross_product = cross(verts[1] - verts[0], verts[2] - verts[0]);
+        if (length(cross_product) == 0.0) return;
+        unit_normal = normalize(cross_product);
+        fill_all = 1.0;
+        orientation = 1.0;
+    }else{
+        // Curves are marked as ended when the handle after
+        // the first anchor is set equal to that anchor
+        if (verts[0] == verts[1]) return;
+        unit_normal = v_base_normal[1];
+        fill_all = 0.0;
+        orientation = sign(determinant(mat3(
+            unit_normal,
+            verts[1] - verts[0],
+            verts[2] - verts[0]
+        )));
+    }
+
+    for(int i = 0; i < 3; i++){
+        uv_coords = SIMPLE_QUADRATIC[i];
+        color = finalize_color(v_color[i], verts[i], unit_normal);
+        emit_gl_Position(verts[i]);
+        EmitVertex();
+    }
+    EndPrimitive();
+}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 from diskcache import Cache
 from contextlib import contextmanager
 from functools import wraps
@@ -11,6 +12,8 @@ from manimlib.utils.simple_functions import hash_string
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
     T = TypeVar('T')
 
 
@@ -18,10 +21,14 @@ CACHE_SIZE = 1e9  # 1 Gig
 _cache = Cache(get_cache_dir(), size_limit=CACHE_SIZE)
 
 
+def get_cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    return hash_string(f"{func.__name__}{args}{kwargs}")
+
+
 def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     @wraps(func)
     def wrapper(*args, **kwargs):
-        key = hash_string(f"{func.__name__}{args}{kwargs}")
+        key = get_cache_key(func, args, kwargs)
         value = _cache.get(key)
         if value is None:
             value = func(*args, **kwargs)
@@ -30,5 +37,47 @@ def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+def is_cached_on_disk(func: Callable, *args, **kwargs) -> bool:
+    """
+    For a function decorated with cache_on_disk, whether
+    its value for these arguments is already cached
+    """
+    return get_cache_key(func, args, kwargs) in _cache
+
+
+def set_cached_value(value: T, func: Callable[..., T], *args, **kwargs) -> None:
+    """
+    For a function decorated with cache_on_disk, store the value it would
+    return for these arguments, e.g. when computed as part of a batch
+    """
+    _cache.set(get_cache_key(func, args, kwargs), value)
+
+
+def get_cached_value(key: str) -> Any:
+    return _cache.get(key)
+
+
+def cache_value(key: str, value: Any) -> None:
+    _cache.set(key, value)
+
+
+def cache_file_on_disk(key: str, file_path: str | Path) -> None:
+    with open(file_path, "rb") as fp:
+        _cache.set(key, fp, read=True)
+
+
+def copy_file_from_cache(key: str, file_path: str | Path) -> bool:
+    """
+    Writes the file cached under key to file_path, returning
+    whether there was such a file
+    """
+    cached_file = _cache.get(key, read=True)
+    if cached_file is None:
+        return False
+    with cached_file, open(file_path, "wb") as fp:
+        shutil.copyfileobj(cached_file, fp)
+    return True
+
+
 def clear_cache():
     _cache.clear()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import nullcontext
+import json
+import os
+import threading
+import time
+from types import FunctionType
+
+from manimlib.logger import log
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, ContextManager
+
+
+def evaluate_lazily_given(value: Any) -> Any:
+    # Functions, such as lambdas, stand in for what they return
+    return value() if isinstance(value, FunctionType) else value
+
+
+class Span(object):
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        name: str | Callable[[], str],
+        category: str,
+        args: dict[str, Any]
+    ):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter()
+        # Arguments are kept as strings, so as not to keep objects alive
+        args = {key: str(evaluate_lazily_given(value)) for key, value in self.args.items()}
+        self.profiler.events.append((
+            str(evaluate_lazily_given(self.name)), self.category, self.start, end - self.start,
+            threading.get_ident(), args,
+        ))
+
+
+class FrameProfiler(object):
+    """
+    Opt-in record of how long each stage of producing frames takes, such
+    as each updater, each render group and shader wrapper, reading frames
+    back from the gpu and piping them to ffmpeg.
+
+    Stages are timed as nested spans, which can be exported as a trace
+    to load into chrome://tracing or https://ui.perfetto.dev, and which
+    are summarized for each play and wait call of a scene.  While not
+    enabled, span only hands back a shared context manager doing nothing.
+    A span's name and arguments are only turned into strings once it ends,
+    and those which are costly to build can be passed as lambdas, which
+    are then only called while enabled.
+    """
+    null_span = nullcontext()
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.events: list[tuple] = []
+        self.start_time: float = time.perf_counter()
+
+    def enable(self) -> None:
+        self.events = []
+        self.start_time = time.perf_counter()
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(
+        self,
+        name: str | Callable[[], str],
+        category: str = "",
+        **args: Any
+    ) -> ContextManager:
+        if not self.enabled:
+            return self.null_span
+        return Span(self, name, category, args)
+
+    def get_chrome_trace(self) -> dict:
+        pid = os.getpid()
+        return dict(
+            traceEvents=[
+                dict(
+                    name=name,
+                    cat=category,
+                    ph="X",
+                    ts=1e6 * (start - self.start_time),
+                    dur=1e6 * duration,
+                    pid=pid,
+                    tid=tid,
+                    args=args,
+                )
+                for name, category, start, duration, tid, args in self.events
+            ],
+            displayTimeUnit="ms",
+        )
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        with open(file_path, "w") as fp:
+            json.dump(self.get_chrome_trace(), fp)
+
+    def get_play_summaries(self, category: str = "play") -> list[tuple[str, float, dict[str, float]]]:
+        """
+        For each span of the given category (namely each play or wait call),
+        returns its name, its duration, and the total time spent in spans of
+        each other category and name which began during it on any thread
+        """
+        events = sorted(self.events, key=lambda event: event[2])
+        starts = [event[2] for event in events]
+        plays = [event for event in events if event[1] == category]
+        summaries = []
+        for name, _, start, duration, _, _ in plays:
+            totals: dict[str, float] = defaultdict(float)
+            for sub_name, sub_category, sub_start, sub_duration, _, _ in events[bisect_left(starts, start):]:
+                if sub_start > start + duration:
+                    break
+                if sub_category != category:
+                    totals[f"{sub_category}: {sub_name}"] += sub_duration
+            summaries.append((name, duration, dict(totals)))
+        return summaries
+
+    def log_summary(self, n_top_spans: int = 5) -> None:
+        for name, duration, totals in self.get_play_summaries():
+            top_spans = sorted(totals.items(), key=lambda item: -item[1])[:n_top_spans]
+            log.info(f"{name} took {1000 * duration:.1f}ms, most of it in " + ", ".join(
+                f"{span_name} ({1000 * span_duration:.1f}ms)"
+                for span_name, span_duration in top_spans
+            ))
+
+
+profiler = FrameProfiler()
@@ -107,3 +107,21 @@ def exponential_decay(t: float, half_life: float = 0.1) -> float:
     # The half-life should be rather small to minimize
     # the cut-off error at the end
     return 1 - np.exp(-t / half_life)
+
+
+def apply_rate_func_to_array(
+    rate_func: Callable[[float], float],
+    alphas: np.ndarray
+) -> np.ndarray:
+    """
+    Applies rate_func to all of alphas at once when it works on arrays,
+    as most rate functions written as plain arithmetic do, and to each
+    alpha in turn otherwise
+    """
+    try:
+        result = np.asarray(rate_func(alphas), dtype=float)
+        if result.shape == alphas.shape:
+            return result
+    except (ValueError, TypeError):
+        pass
+    return np.array([rate_func(alpha) for alpha in alphas], dtype=float)
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
-import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
 import numpy as np
 from scipy.spatial.transform import Rotation
-from tqdm.auto import tqdm as ProgressDisplay
 
 from manimlib.constants import DOWN, OUT, RIGHT, UP
 from manimlib.constants import PI, TAU
@@ -368,6 +364,24 @@ def get_closest_point_on_line(a: VectN, b: VectN, p: VectN) -> VectN:
     return ((t * a) + ((1 - t) * b))
 
 
+def get_dist_to_segments(
+    points: Vect3Array,
+    starts: Vect3Array,
+    ends: Vect3Array
+) -> np.ndarray:
+    """
+    Distance from each point to the segment running between
+    the corresponding start and end
+    """
+    vects = ends - starts
+    lengths_squared = (vects * vects).sum(1)
+    dots = ((points - starts) * vects).sum(1)
+    alphas = np.zeros(len(points))
+    np.divide(dots, lengths_squared, out=alphas, where=(lengths_squared > 0))
+    closest = starts + np.clip(alphas, 0, 1)[:, np.newaxis] * vects
+    return np.linalg.norm(points - closest, axis=1)
+
+
 def get_winding_number(points: Sequence[Vect2 | Vect3]) -> float:
     total_angle = 0
     for p1, p2 in adjacent_pairs(points):
@@ -420,9 +434,9 @@ def norm_squared(v: VectN | List[float]) -> float:
 
 
 # TODO, fails for polygons drawn over themselves
-def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> list[int]:
+def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> np.ndarray:
     """
-    Returns a list of indices giving a triangulation
+    Returns an array of indices giving a triangulation
     of a polygon, potentially with holes
 
     - verts is a numpy array of points
@@ -430,79 +444,105 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
     - ring_ends is a list of indices indicating where
     the ends of new paths are
     """
-
-    rings = [
-        list(range(e0, e1))
-        for e0, e1 in zip([0, *ring_ends], ring_ends)
-    ]
+    bounds = np.array([0, *ring_ends], dtype=int)
+    starts = bounds[:-1]
+    ends = bounds[1:]
+    # Empty rings have nothing to contribute
+    non_empty = ends > starts
+    starts = starts[non_empty]
+    ends = ends[non_empty]
+    n_rings = len(starts)
+    if n_rings == 0:
+        return np.zeros(0, dtype=int)
     epsilon = 1e-6
 
-    def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
-
     # Points at the same position may cause problems
-    for i in rings:
-        if len(i) < 2:
-            continue
-        verts[i[0]] += (verts[i[1]] - verts[i[0]]) * epsilon
-        verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
-
-    # First, we should know which rings are directly contained in it for each ring
-
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    long_rings = (ends - starts) >= 2
+    firsts = starts[long_rings]
+    lasts = ends[long_rings] - 1
+    verts[firsts] += (verts[firsts + 1] - verts[firsts]) * epsilon
+    verts[lasts] += (verts[lasts - 1] - verts[lasts]) * epsilon
+
+    xs = verts[:ends[-1], 0]
+    ys = verts[:ends[-1], 1]
+
+    # Bounding boxes and areas of all rings
+    left = np.minimum.reduceat(xs, starts)
+    right = np.maximum.reduceat(xs, starts)
+    bottom = np.minimum.reduceat(ys, starts)
+    top = np.maximum.reduceat(ys, starts)
+    # Index of the next vertex along each ring, closing each one up
+    nexts = np.arange(1, len(xs) + 1)
+    nexts[ends - 1] = starts
+    ring_ids = np.repeat(np.arange(n_rings), ends - starts)
+    area = abs(np.bincount(
+        ring_ids,
+        weights=xs * ys[nexts] - xs[nexts] * ys,
+        minlength=n_rings,
+    )) / 2
 
     # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
-
-    chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
-        leave=False,
-        ascii=True if platform.system() == 'Windows' else None,
-        dynamic_ncols=True,
-        desc="SVG Triangulation",
-        delay=3,
-    )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
-                break
+    rings_sorted = np.argsort(-area, kind="stable")
+    rank = np.empty(n_rings, dtype=int)
+    rank[rings_sorted] = np.arange(n_rings)
+
+    # Pairs of a ring and a larger one whose bounding box holds it,
+    # a few rows of the full comparison at a time to bound memory
+    inner = []
+    outer = []
+    chunk_size = max(1, 2**20 // n_rings)
+    for low in range(0, n_rings, chunk_size):
+        i = np.arange(low, min(low + chunk_size, n_rings))[:, np.newaxis]
+        rows, cols = np.nonzero(
+            (rank < rank[i])
+            & (left <= left[i]) & (right >= right[i])
+            & (bottom <= bottom[i]) & (top >= top[i])
+        )
+        inner.append(rows + low)
+        outer.append(cols)
+    inner = np.hstack(inner)
+    outer = np.hstack(outer)
+
+    # Winding number of the first point of each inner ring around its
+    # candidate, with all edges of all candidates handled at once.  As
+    # with the winding fill, a ring is inside another when that's nonzero
+    edge_counts = ends[outer] - starts[outer]
+    pair_ids = np.repeat(np.arange(len(outer)), edge_counts)
+    edges = np.arange(len(pair_ids)) + np.repeat(starts[outer] - np.cumsum([0, *edge_counts[:-1]]), edge_counts)
+    px = xs[starts[inner]][pair_ids]
+    py = ys[starts[inner]][pair_ids]
+    x0, y0 = xs[edges], ys[edges]
+    x1, y1 = xs[nexts[edges]], ys[nexts[edges]]
+    side = (x1 - x0) * (py - y0) - (px - x0) * (y1 - y0)
+    upward = (y0 <= py) & (y1 > py) & (side > 0)
+    downward = (y0 > py) & (y1 <= py) & (side < 0)
+    winding = np.bincount(pair_ids, weights=upward.astype(float) - downward, minlength=len(outer))
+    inner = inner[winding != 0]
+    outer = outer[winding != 0]
+
+    # The smallest ring containing a given ring is its direct parent
+    order = np.lexsort((rank[outer], inner))
+    inner = inner[order]
+    outer = outer[order]
+    is_last = np.append(inner[1:] != inner[:-1], True)
+    parents = np.full(n_rings, -1)
+    parents[inner[is_last]] = outer[is_last]
+    by_parent = np.argsort(parents, kind="stable")
+    n_orphans = np.count_nonzero(parents < 0)
+    child_counts = np.bincount(parents[parents >= 0], minlength=n_rings)
+    children = np.split(by_parent[n_orphans:], np.cumsum(child_counts)[:-1])
 
     res = []
 
     # Then, we can use earcut for each part
-    used = [False] * len(rings)
+    used = np.zeros(n_rings, dtype=bool)
     for i in rings_sorted:
         if used[i]:
             continue
-        v = rings[i]
-        ring_ends = [len(v)]
-        for j in chilren[i]:
-            used[j] = True
-            v += rings[j]
-            ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
-
-    return res
+        group = [i, *children[i]]
+        used[group] = True
+        v = np.hstack([np.arange(starts[j], ends[j]) for j in group])
+        sub_ring_ends = np.cumsum([ends[j] - starts[j] for j in group])
+        res.append(v[earcut(verts[v, :2], sub_ring_ends)])
+
+    return np.hstack(res).astype(int)
@@ -4,12 +4,16 @@ import os
 import re
 import yaml
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 
 from pathlib import Path
 import tempfile
 
 from manimlib.utils.cache import cache_on_disk
+from manimlib.utils.cache import is_cached_on_disk
+from manimlib.utils.cache import set_cached_value
 from manimlib.config import manim_config
 from manimlib.config import get_manim_dir
 from manimlib.logger import log
@@ -37,17 +41,31 @@ def get_tex_config(template: str = "") -> tuple[str, str]:
     return config["compiler"], config["preamble"]
 
 
-def get_full_tex(content: str, preamble: str = ""):
+# Each piece of LaTeX goes on its own page of this environment, both when
+# compiled on its own and when compiled in a batch, so that either way the
+# document around it, and hence the resulting svg, is the same
+PAGE_ENVIRONMENT = "manimpage"
+
+
+def get_multipage_tex(latex_list: list[str], preamble: str = "") -> str:
+    env = PAGE_ENVIRONMENT
     return "\n\n".join((
-        "\\documentclass[preview]{standalone}",
+        f"\\documentclass[preview, multi={env}]{{standalone}}",
+        f"\\newenvironment{{{env}}}{{}}{{}}",
         preamble,
         "\\begin{document}",
-        content,
+        *(
+            f"\\begin{{{env}}}\n{latex}\n\\end{{{env}}}"
+            for latex in latex_list
+        ),
         "\\end{document}"
     )) + "\n"
 
 
-@lru_cache(maxsize=128)
+def get_full_tex(content: str, preamble: str = ""):
+    return get_multipage_tex([content], preamble)
+
+
 def latex_to_svg(
     latex: str,
     template: str = "",
@@ -77,8 +95,19 @@ def latex_to_svg(
     compiler, preamble = get_tex_config(template)
 
     preamble = "\n".join([preamble, additional_preamble])
-    full_tex = get_full_tex(latex, preamble)
-    return full_tex_to_svg(full_tex, compiler, message)
+    # Checked ahead of the memoized compilation, so that stand-in svgs
+    # are never memoized
+    if _latex_batch is not None:
+        full_tex = get_full_tex(latex, preamble)
+        if not is_cached_on_disk(full_tex_to_svg, full_tex, compiler, message):
+            _latex_batch.add(latex, preamble, compiler, message)
+            return EMPTY_SVG
+    return compile_latex_to_svg(latex, preamble, compiler, message)
+
+
+@lru_cache(maxsize=128)
+def compile_latex_to_svg(latex: str, preamble: str, compiler: str, message: str = "") -> str:
+    return full_tex_to_svg(get_full_tex(latex, preamble), compiler, message)
 
 
 @cache_on_disk
@@ -86,45 +115,15 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     if message:
         print(message, end="\r")
 
-    if compiler == "latex":
-        dvi_ext = ".dvi"
-    elif compiler == "xelatex":
-        dvi_ext = ".xdv"
-    else:
-        raise NotImplementedError(f"Compiler '{compiler}' is not implemented")
-
     # Write intermediate files to a temporary directory
     with tempfile.TemporaryDirectory() as temp_dir:
         tex_path = Path(temp_dir, "working").with_suffix(".tex")
-        dvi_path = tex_path.with_suffix(dvi_ext)
 
         # Write tex file
         tex_path.write_text(full_tex)
 
         # Run latex compiler
-        process = subprocess.run(
-            [
-                compiler,
-                "-no-pdf",
-                "-interaction=batchmode",
-                "-halt-on-error",
-                f"-output-directory={temp_dir}",
-                tex_path
-            ],
-            capture_output=True,
-            text=True
-        )
-
-        if process.returncode != 0:
-            # Handle error
-            error_str = ""
-            log_path = tex_path.with_suffix(".log")
-            if log_path.exists():
-                content = log_path.read_text()
-                error_match = re.search(r"(?<=\n! ).*\n.*\n", content)
-                if error_match:
-                    error_str = error_match.group()
-            raise LatexError(error_str or "LaTeX compilation failed")
+        dvi_path = compile_tex_file(tex_path, compiler)
 
         # Run dvisvgm and capture output directly
         process = subprocess.run(
@@ -147,5 +146,164 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     return result
 
 
+def compile_tex_file(tex_path: Path, compiler: str = "latex") -> Path:
+    """
+    Runs the compiler on a tex file, returning the path to the resulting dvi
+    (or xdv) file, which is written to the same directory
+    """
+    if compiler == "latex":
+        dvi_ext = ".dvi"
+    elif compiler == "xelatex":
+        dvi_ext = ".xdv"
+    else:
+        raise NotImplementedError(f"Compiler '{compiler}' is not implemented")
+
+    process = subprocess.run(
+        [
+            compiler,
+            "-no-pdf",
+            "-interaction=batchmode",
+            "-halt-on-error",
+            f"-output-directory={tex_path.parent}",
+            tex_path
+        ],
+        capture_output=True,
+        text=True
+    )
+
+    if process.returncode != 0:
+        # Handle error
+        error_str = ""
+        log_path = tex_path.with_suffix(".log")
+        if log_path.exists():
+            content = log_path.read_text()
+            error_match = re.search(r"(?<=\n! ).*\n.*\n", content)
+            if error_match:
+                error_str = error_match.group()
+        raise LatexError(error_str or "LaTeX compilation failed")
+
+    return tex_path.with_suffix(dvi_ext)
+
+
+# Batched compilation
+
+# Stands in for the svg of LaTeX which has been gathered into a batch
+EMPTY_SVG = '<svg xmlns="http://www.w3.org/2000/svg" version="1.1"></svg>'
+
+_latex_batch: LatexBatch | None = None
+
+
+@contextmanager
+def gather_latex():
+    """
+    Within this context, rather than compiling LaTeX which is not yet cached,
+    latex_to_svg gathers it into a batch and returns an empty svg in its
+    place.  Upon exiting, everything gathered is compiled together, spread
+    over a few concurrent latex runs, each writing one page per string, and
+    each resulting svg is cached just as if it were compiled on its own.
+
+    Note, mobjects constructed within this context are meant to be thrown
+    away, e.g.
+
+    with gather_latex():
+        for tex_string in tex_strings:
+            Tex(tex_string)
+    """
+    global _latex_batch
+    outer_batch = _latex_batch
+    batch = outer_batch if outer_batch is not None else LatexBatch()
+    _latex_batch = batch
+    try:
+        yield batch
+    finally:
+        _latex_batch = outer_batch
+    if outer_batch is None and len(batch) > 0:
+        batch.compile()
+
+
+class LatexBatch(object):
+    def __init__(self, n_workers: int | None = None):
+        # Maps (preamble, compiler) to the list of (latex, message) pairs using them
+        self.items: dict[tuple[str, str], list[tuple[str, str]]] = dict()
+        self.n_workers = n_workers or manim_config.tex.n_compile_workers or 1
+
+    def __len__(self) -> int:
+        return sum(map(len, self.items.values()))
+
+    def add(self, latex: str, preamble: str, compiler: str, message: str = "") -> None:
+        items = self.items.setdefault((preamble, compiler), [])
+        if (latex, message) not in items:
+            items.append((latex, message))
+
+    def compile(self) -> None:
+        message = f"Writing {len(self)} LaTeX strings..."
+        print(message, end="\r")
+
+        with ThreadPoolExecutor(self.n_workers) as executor:
+            # Each latex run is its own subprocess, so threads suffice
+            # to have several of them going at once
+            jobs = []
+            for (preamble, compiler), items in self.items.items():
+                latex_list = list(dict.fromkeys(latex for latex, _ in items))
+                n_chunks = min(self.n_workers, len(latex_list))
+                for i in range(n_chunks):
+                    chunk = latex_list[i::n_chunks]
+                    future = executor.submit(self.compile_pages, chunk, preamble, compiler)
+                    jobs.append((preamble, compiler, chunk, future))
+
+            svg_maps = dict()
+            for preamble, compiler, chunk, future in jobs:
+                try:
+                    svgs = future.result()
+                except LatexError:
+                    # Leave it to each string to be compiled, and fail, on its own
+                    log.debug("Batched LaTeX compilation failed")
+                    continue
+                svg_maps.setdefault((preamble, compiler), dict()).update(zip(chunk, svgs))
+
+        for (preamble, compiler), items in self.items.items():
+            svg_map = svg_maps.get((preamble, compiler), dict())
+            for latex, item_message in items:
+                if latex not in svg_map:
+                    continue
+                full_tex = get_full_tex(latex, preamble)
+                set_cached_value(svg_map[latex], full_tex_to_svg, full_tex, compiler, item_message)
+        self.items.clear()
+
+        print(" " * len(message), end="\r")
+
+    def compile_pages(self, latex_list: list[str], preamble: str, compiler: str) -> list[str]:
+        """
+        Returns the svgs for each piece of LaTeX, each rendered onto its own
+        page of a single document
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tex_path = Path(temp_dir, "working").with_suffix(".tex")
+            tex_path.write_text(get_multipage_tex(latex_list, preamble))
+            dvi_path = compile_tex_file(tex_path, compiler)
+
+            # Split each page into its own svg file
+            subprocess.run(
+                [
+                    "dvisvgm",
+                    dvi_path,
+                    "-n",  # no fonts
+                    "-v", "0",  # quiet
+                    "--page=1-",  # all pages
+                    f"--output={Path(temp_dir, 'page_%p.svg')}",
+                ],
+                capture_output=True
+            )
+            svg_paths = sorted(
+                Path(temp_dir).glob("page_*.svg"),
+                key=lambda path: int(path.stem.split("_")[1])
+            )
+            svgs = [path.read_text() for path in svg_paths]
+
+        if len(svgs) != len(latex_list):
+            raise LatexError("Number of pages does not match number of LaTeX strings")
+        return svgs
+
+
 class LatexError(Exception):
     pass